@@ -1,9 +1,49 @@
 """Interfaces (contratos) da camada de aplicação."""
 
-from .account_repository import AccountRepository
-from .event_publisher import EventPublisher
+from .account_repository import AccountPage, AccountRepository, AccountSummary
+from .event_publisher import EventPublishError, EventPublisher
+from .read_consistency import ReadConsistency
+from .transaction_repository import (
+    LedgerPosition,
+    TransactionPage,
+    TransactionRepository,
+)
+from .report_repository import (
+    BalanceBucket,
+    OpeningRatePoint,
+    ReportPeriod,
+    ReportRepository,
+    StatusReportRow,
+)
+from .snapshot_repository import BalanceSnapshot, SnapshotRepository
+from .unit_of_work import UnitOfWork
+from .stats_repository import (
+    LedgerDayTotals,
+    StatsRepository,
+    StatusTotals,
+    SystemStats,
+)
 
 __all__ = [
+    "AccountPage",
     "AccountRepository",
+    "AccountSummary",
+    "BalanceBucket",
+    "BalanceSnapshot",
+    "EventPublishError",
     "EventPublisher",
+    "LedgerDayTotals",
+    "LedgerPosition",
+    "OpeningRatePoint",
+    "ReadConsistency",
+    "ReportPeriod",
+    "ReportRepository",
+    "SnapshotRepository",
+    "StatsRepository",
+    "StatusReportRow",
+    "StatusTotals",
+    "SystemStats",
+    "TransactionPage",
+    "TransactionRepository",
+    "UnitOfWork",
 ]
\ No newline at end of file
@@ -1,27 +1,170 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 
-from ...domain.entities import Account
-from ...domain.value_objects import AccountNumber, CPF
+from ...domain.entities import Account, AccountStatus
+from ...domain.value_objects import AccountNumber, CPF, Money
+from .read_consistency import ReadConsistency
+
+@dataclass
+class AccountSummary:
+    """Modelo de leitura da listagem: só os campos exibidos."""
+    account_number: str
+    holder_name: str
+    status: str
+    balance: Decimal
+    created_at: datetime
+
+
+@dataclass
+class AccountPage:
+    """Uma página da listagem e o cursor para a próxima (None se acabou)."""
+    items: list[AccountSummary]
+    next_cursor: str | None
+
 
 class AccountRepository(ABC):
+    """
+    Repositório de contas.
+
+    As leituras aceitam `consistency`: STRONG (padrão) para o que
+    decide movimentar dinheiro, EVENTUAL para consultas que toleram
+    alguns segundos de atraso (ver ReadConsistency).
+    """
 
     @abstractmethod
     async def save(self, account: Account) -> None:
         pass
 
     @abstractmethod
-    async def find_by_account_number(self, account_number: AccountNumber) -> Optional[Account]:
+    async def find_by_account_number(
+        self,
+        account_number: AccountNumber,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
         pass
 
     @abstractmethod
-    async def find_by_cpf(self, cpf: CPF) -> Optional[Account]:
+    async def find_many_by_account_numbers(
+        self,
+        account_numbers: list[AccountNumber],
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> list[Account]:
+        """Busca várias contas de uma vez (contas inexistentes são omitidas)."""
         pass
 
     @abstractmethod
-    async def exists_by_cpf(self, cpf: CPF) -> bool:
+    async def save_many(self, accounts: list[Account]) -> None:
+        """
+        Salva várias contas de uma vez, cada uma com controle de versão.
+
+        As contas sem conflito são salvas mesmo que outras conflitem.
+
+        Raises:
+            ConcurrentUpdateError: Com os números das contas que conflitaram
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
+        pass
+
+    @abstractmethod
+    async def exists_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> bool:
         pass
 
     @abstractmethod
     async def delete(self, account_number: AccountNumber) -> None:
+        pass
+
+    @abstractmethod
+    async def list_account_numbers(
+        self,
+        after: AccountNumber | None = None,
+        limit: int = 100,
+    ) -> list[AccountNumber]:
+        """
+        Números de conta em ordem, a partir de `after` (exclusivo).
+
+        Para percorrer todas as contas em lotes: passe o último número
+        do lote anterior até receber uma lista vazia.
+        """
+        pass
+
+    @abstractmethod
+    async def list_accounts(
+        self,
+        status: AccountStatus | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AccountPage:
+        """
+        Lista contas da mais antiga para a mais nova, com filtros.
+
+        O cursor é opaco: vem de `AccountPage.next_cursor`.
+
+        Raises:
+            ValueError: Se o cursor for inválido
+        """
+        pass
+
+    @abstractmethod
+    async def apply_balance_delta(
+        self,
+        account_number: AccountNumber,
+        delta: Decimal,
+        operation_id: str | None = None,
+    ) -> Money | None:
+        """
+        Soma `delta` (positivo ou negativo) ao saldo de forma atômica.
+
+        Com `operation_id` a operação é idempotente: repetir a chamada com
+        o mesmo id (ex.: cliente que reenviou a requisição) não altera o
+        saldo de novo.
+
+        Returns:
+            Novo saldo, ou None se a implementação não o conhece sem uma
+            leitura extra (ex.: conta com saldo dividido no MongoDB) ou se
+            a operação já tinha sido aplicada
+
+        Raises:
+            AccountNotFoundError: Se a conta não existir
+            AccountNotActiveError: Se a conta não estiver ativa
+            InsufficientFundsError: Se o saldo ficaria negativo
+            ConcurrentUpdateError: Se a conta mudou a cada tentativa (pode repetir)
+        """
+        pass
+
+    @abstractmethod
+    async def settle_transfer(
+        self,
+        transfer_id: str,
+        from_account_number: AccountNumber,
+        to_account_number: AccountNumber,
+        amount: Money,
+    ) -> None:
+        """
+        Debita a origem e credita o destino como uma única operação.
+
+        Idempotente por transfer_id: liquidar de novo a mesma
+        transferência não move o dinheiro duas vezes.
+
+        Raises:
+            AccountNotFoundError: Se alguma das contas não existir
+            AccountNotActiveError: Se alguma das contas não estiver ativa
+            InsufficientFundsError: Se a origem não tiver saldo
+        """
         pass
\ No newline at end of file
@@ -3,6 +3,21 @@ from typing import List
 
 from ...domain.events import DomainEvent
 
+
+class EventPublishError(Exception):
+    """
+    Parte dos eventos de um publish_many não foi aceita pelo broker.
+
+    Os demais foram publicados: quem chamou pode tentar de novo só
+    os de `failed_events`.
+    """
+
+    def __init__(self, failed_events: List[DomainEvent], errors: List[BaseException]) -> None:
+        self.failed_events = failed_events
+        self.errors = errors
+        super().__init__(f"{len(failed_events)} evento(s) não confirmado(s) pelo broker")
+
+
 class EventPublisher(ABC):
 
     @abstractmethod
@@ -11,4 +26,10 @@ class EventPublisher(ABC):
 
     @abstractmethod
     async def publish_many(self, events: List[DomainEvent]) -> None:
-        pass
\ No newline at end of file
+        """
+        Publica vários eventos, na ordem.
+
+        Raises:
+            EventPublishError: Com os eventos que o broker recusou
+        """
+        pass
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class ReadConsistency(Enum):
+    """
+    Quão atualizada uma leitura precisa estar.
+
+    STRONG: lê do primário (vê todas as escritas confirmadas).
+        Obrigatório para leituras que decidem movimentar dinheiro.
+    EVENTUAL: pode ler de um secundário, alguns segundos atrasado.
+        Serve para consultas e checagens que são revalidadas na escrita.
+    """
+    STRONG = "strong"
+    EVENTUAL = "eventual"
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+
+class ReportPeriod(Enum):
+    """Granularidade das séries temporais dos relatórios."""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+@dataclass
+class StatusReportRow:
+    """Contas e saldos de um status."""
+    status: str
+    count: int
+    total_balance: Decimal
+    average_balance: Decimal
+
+
+@dataclass
+class BalanceBucket:
+    """Faixa de saldo [lower, upper) e quantas contas caem nela (upper=None: sem teto)."""
+    lower: Decimal
+    upper: Decimal | None
+    count: int
+    total_balance: Decimal
+
+
+@dataclass
+class OpeningRatePoint:
+    """Contas abertas em um período (dia, semana ou mês que começa em period_start)."""
+    period_start: datetime
+    count: int
+
+
+class ReportRepository(ABC):
+    """
+    Relatórios agregados sobre as contas.
+
+    As agregações rodam onde os dados estão (no MongoDB, pipelines de
+    agregação): só os totais atravessam a rede, nunca as contas.
+    Os resultados refletem a leitura EVENTUAL.
+    """
+
+    @abstractmethod
+    async def totals_by_status(self) -> list[StatusReportRow]:
+        """Quantidade, saldo total e saldo médio por status."""
+        pass
+
+    @abstractmethod
+    async def balance_distribution(self, boundaries: list[Decimal]) -> list[BalanceBucket]:
+        """
+        Distribuição das contas por faixa de saldo.
+
+        Args:
+            boundaries: Limites crescentes das faixas; saldos a partir
+                do último caem numa faixa final sem teto
+        """
+        pass
+
+    @abstractmethod
+    async def opening_rate(
+        self,
+        period: ReportPeriod,
+        created_from: datetime,
+        created_to: datetime,
+    ) -> list[OpeningRatePoint]:
+        """Contas abertas por período no intervalo (só períodos com aberturas)."""
+        pass
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from ...domain.value_objects import AccountNumber
+from .transaction_repository import LedgerPosition
+
+
+@dataclass
+class BalanceSnapshot:
+    """
+    Saldo da conta logo após o lançamento em `ledger_position`.
+
+    Para saber o saldo em qualquer instante posterior basta somar os
+    lançamentos depois dessa posição (e não o histórico inteiro).
+    """
+    account_number: AccountNumber
+    balance: Decimal
+    ledger_position: LedgerPosition
+    taken_at: datetime
+
+
+class SnapshotRepository(ABC):
+    """Checkpoints de saldo calculados a partir do livro-razão."""
+
+    @abstractmethod
+    async def save(self, snapshot: BalanceSnapshot) -> None:
+        """Grava o checkpoint; gravar de novo a mesma posição é ignorado."""
+        pass
+
+    @abstractmethod
+    async def find_latest(
+        self,
+        account_number: AccountNumber,
+        at: datetime | None = None,
+    ) -> BalanceSnapshot | None:
+        """
+        Checkpoint mais recente da conta.
+
+        Args:
+            at: Se informado, só considera checkpoints cuja posição
+                é de um lançamento criado até este instante
+        """
+        pass
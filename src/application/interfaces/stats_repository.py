@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+
+
+@dataclass
+class StatusTotals:
+    """Quantidade de contas e saldo somado de um status."""
+    count: int = 0
+    balance: Decimal = Decimal("0")
+
+
+@dataclass
+class LedgerDayTotals:
+    """Lançamentos de um dia, por tipo: {"deposit": (quantidade, valor), ...}."""
+    day: date
+    by_type: dict[str, tuple[int, Decimal]] = field(default_factory=dict)
+
+
+@dataclass
+class SystemStats:
+    """
+    Resumo agregado do sistema.
+
+    Lido de documentos já somados (visões materializadas), e não
+    calculado varrendo contas e lançamentos a cada consulta.
+    """
+    accounts_by_status: dict[str, StatusTotals]
+    ledger_days: list[LedgerDayTotals]
+    updated_at: datetime | None
+
+
+class StatsRepository(ABC):
+    """Visões agregadas mantidas a partir das escritas."""
+
+    @abstractmethod
+    async def get_stats(self, days: int = 30) -> SystemStats:
+        """
+        Resumo atual.
+
+        Args:
+            days: Quantos dias mais recentes de lançamentos incluir
+        """
+        pass
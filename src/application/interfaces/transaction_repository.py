@@ -0,0 +1,89 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from ...domain.entities import Transaction
+from ...domain.value_objects import AccountNumber
+from .read_consistency import ReadConsistency
+
+
+@dataclass(frozen=True)
+class LedgerPosition:
+    """
+    Posição de um lançamento no livro-razão.
+
+    O par (created_at, transaction_id) ordena os lançamentos de uma
+    conta sem empates, então serve de marcador para retomar a leitura.
+    """
+    created_at: datetime
+    transaction_id: str
+
+
+@dataclass
+class TransactionPage:
+    """Uma página do histórico e o cursor para a próxima (None se acabou)."""
+    items: list[Transaction]
+    next_cursor: str | None
+
+
+class TransactionRepository(ABC):
+    """
+    Livro-razão (ledger) de transações: só recebe inserções.
+
+    Lançamentos nunca são alterados ou removidos; correções entram
+    como novos lançamentos.
+    """
+
+    @abstractmethod
+    async def save(self, transaction: Transaction) -> None:
+        pass
+
+    @abstractmethod
+    async def save_many(self, transactions: list[Transaction]) -> None:
+        """Insere vários lançamentos; ids já gravados são ignorados."""
+        pass
+
+    @abstractmethod
+    async def exists(self, transaction_id: str) -> bool:
+        """Se o lançamento com este id já foi gravado."""
+        pass
+
+    @abstractmethod
+    async def find_page_by_account(
+        self,
+        account_number: AccountNumber,
+        limit: int,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> TransactionPage:
+        """
+        Histórico da conta, do mais recente para o mais antigo.
+
+        O cursor é opaco: vem de `TransactionPage.next_cursor`.
+
+        Raises:
+            ValueError: Se o cursor for inválido
+        """
+        pass
+
+    @abstractmethod
+    def stream_by_account(
+        self,
+        account_number: AccountNumber,
+        batch_size: int = 1000,
+        after: LedgerPosition | None = None,
+        until: datetime | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Percorre o histórico da conta, do mais antigo ao mais recente.
+
+        Os lançamentos chegam do banco em lotes de `batch_size`: a
+        memória usada não cresce com o tamanho do histórico.
+
+        Args:
+            after: Começa depois desta posição (exclusivo)
+            until: Para em lançamentos criados até este instante (inclusivo)
+        """
+        pass
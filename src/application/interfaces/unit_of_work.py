@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class UnitOfWork(ABC):
+    """
+    Executa um trecho de use case de forma atômica.
+
+    As escritas feitas pelos repositórios (e pelo publisher, quando ele
+    grava no banco) dentro de `work` são confirmadas juntas ou nenhuma.
+    `work` pode ser executado mais de uma vez (ex.: conflito transitório
+    na transação): não deve ter efeitos fora do banco.
+    """
+
+    @abstractmethod
+    async def run(self, work: Callable[[], Awaitable[T]]) -> T:
+        pass
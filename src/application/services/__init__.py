@@ -0,0 +1,16 @@
+"""Serviços de aplicação."""
+
+from .ledger_replay import OPENING_POSITION, LedgerReplayer, ReplayResult
+from .retry import RetryPolicy, RetryStats
+from .use_case_context import current_use_case, traced_use_case, use_case_scope
+
+__all__ = [
+    "OPENING_POSITION",
+    "LedgerReplayer",
+    "ReplayResult",
+    "RetryPolicy",
+    "RetryStats",
+    "current_use_case",
+    "traced_use_case",
+    "use_case_scope",
+]
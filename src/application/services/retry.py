@@ -0,0 +1,103 @@
+"""
+Política de retry para conflitos de concorrência otimista.
+
+Quando duas operações alteram a mesma conta ao mesmo tempo, o save
+com versão (compare-and-swap) de uma delas falha com
+ConcurrentUpdateError. A operação inteira (reler + aplicar + salvar)
+pode então ser repetida, com uma espera aleatória crescente (jitter)
+para que as concorrentes não colidam de novo no mesmo instante.
+"""
+
+import asyncio
+import random
+from collections import Counter
+from typing import Awaitable, Callable, TypeVar
+
+from ...domain.exceptions import ConcurrentUpdateError
+
+
+T = TypeVar("T")
+
+
+class RetryStats:
+    """
+    Contadores de conflitos e retries.
+    
+    `conflicts_by_account` mostra as contas mais disputadas (hot accounts).
+    """
+    
+    def __init__(self, max_tracked_accounts: int = 1000) -> None:
+        self.conflicts = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.conflicts_by_account: Counter[str] = Counter()
+        self.max_tracked_accounts = max_tracked_accounts
+    
+    def record_conflict(self, account_numbers: list[str]) -> None:
+        self.conflicts += 1
+        self.conflicts_by_account.update(account_numbers)
+        
+        # Mantém só as contas mais disputadas para não crescer sem limite
+        if len(self.conflicts_by_account) > self.max_tracked_accounts:
+            keep = self.conflicts_by_account.most_common(self.max_tracked_accounts // 2)
+            self.conflicts_by_account = Counter(dict(keep))
+    
+    def snapshot(self, top: int = 10) -> dict:
+        return {
+            "conflicts": self.conflicts,
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+            "hot_accounts": dict(self.conflicts_by_account.most_common(top)),
+        }
+
+
+class RetryPolicy:
+    """
+    Repete uma operação em caso de ConcurrentUpdateError.
+    
+    Backoff exponencial com "full jitter": a espera da tentativa N é
+    sorteada entre 0 e min(max_delay, base_delay * 2^N).
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay_ms: int = 10,
+        max_delay_ms: int = 200,
+    ) -> None:
+        """
+        Args:
+            max_attempts: Total de tentativas (incluindo a primeira)
+            base_delay_ms: Espera base antes do primeiro retry
+            max_delay_ms: Teto da espera entre tentativas
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay_ms / 1000
+        self.max_delay = max_delay_ms / 1000
+        self.stats = RetryStats()
+    
+    async def run(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Executa a operação, repetindo em caso de conflito.
+        
+        A operação deve ser refeita do zero a cada tentativa
+        (reler a conta, aplicar a mudança e salvar).
+        
+        Raises:
+            ConcurrentUpdateError: Se todas as tentativas conflitarem
+        """
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except ConcurrentUpdateError as e:
+                self.stats.record_conflict(e.account_numbers)
+                
+                if attempt >= self.max_attempts:
+                    self.stats.exhausted += 1
+                    raise
+                
+                self.stats.retries += 1
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+                await asyncio.sleep(random.uniform(0, delay))
+                attempt += 1
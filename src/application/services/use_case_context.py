@@ -0,0 +1,76 @@
+"""
+Use case em execução no contexto atual.
+
+A infraestrutura (ex.: a monitoração de comandos do MongoDB) lê
+`current_use_case()` para atribuir o custo de uma operação a quem a
+pediu. O valor vive num ContextVar: cada requisição (task asyncio)
+tem o seu, e o Motor copia o contexto para as threads onde roda o
+PyMongo.
+
+Uso:
+    class DepositMoneyUseCase:
+        @traced_use_case
+        async def execute(self, input_dto): ...
+
+    with use_case_scope("TransferWorker"):
+        await repository.settle_transfer(...)
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+_current_use_case: ContextVar[str | None] = ContextVar("current_use_case", default=None)
+
+
+def current_use_case() -> str | None:
+    """Nome do use case em execução (None fora de um)."""
+    return _current_use_case.get()
+
+
+@contextmanager
+def use_case_scope(name: str) -> Iterator[None]:
+    """Marca o trecho como executado pelo use case `name`."""
+    token = _current_use_case.set(name)
+    try:
+        yield
+    finally:
+        _current_use_case.reset(token)
+
+
+def traced_use_case(execute):
+    """
+    Decorator do `execute` de um use case: marca a execução com o nome da classe.
+
+    Funciona com corrotinas e com async generators (ex.: extrato em
+    streaming). No generator a marca vale só durante cada passo, pois
+    entre um item e outro quem roda é o consumidor.
+    """
+    if inspect.isasyncgenfunction(execute):
+        @functools.wraps(execute)
+        async def generator_wrapper(self, *args, **kwargs):
+            name = type(self).__name__
+            generator = execute(self, *args, **kwargs)
+            try:
+                while True:
+                    with use_case_scope(name):
+                        try:
+                            item = await generator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                    yield item
+            finally:
+                with use_case_scope(name):
+                    await generator.aclose()
+
+        return generator_wrapper
+
+    @functools.wraps(execute)
+    async def wrapper(self, *args, **kwargs):
+        with use_case_scope(type(self).__name__):
+            return await execute(self, *args, **kwargs)
+
+    return wrapper
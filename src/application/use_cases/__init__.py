@@ -15,6 +15,56 @@ from .withdraw_money import (
     WithdrawMoneyInput,
     WithdrawMoneyOutput,
 )
+from .export_statement import (
+    ExportStatementUseCase,
+    ExportStatementInput,
+    StatementLine,
+)
+from .get_balance_distribution import (
+    GetBalanceDistributionUseCase,
+    GetBalanceDistributionInput,
+    GetBalanceDistributionOutput,
+    BalanceBucketItem,
+)
+from .get_balance_at import (
+    GetBalanceAtUseCase,
+    GetBalanceAtInput,
+    GetBalanceAtOutput,
+)
+from .get_opening_rate import (
+    GetOpeningRateUseCase,
+    GetOpeningRateInput,
+    GetOpeningRateOutput,
+    OpeningRateItem,
+)
+from .get_status_report import (
+    GetStatusReportUseCase,
+    GetStatusReportOutput,
+    StatusReportItem,
+)
+from .get_system_stats import (
+    GetSystemStatsUseCase,
+    GetSystemStatsInput,
+    GetSystemStatsOutput,
+    LedgerDayItem,
+    StatusStatsItem,
+)
+from .get_transaction_history import (
+    GetTransactionHistoryUseCase,
+    GetTransactionHistoryInput,
+    GetTransactionHistoryOutput,
+    TransactionHistoryItem,
+)
+from .list_accounts import (
+    ListAccountsUseCase,
+    ListAccountsInput,
+    ListAccountsOutput,
+    AccountListItem,
+)
+from .take_balance_snapshots import (
+    TakeBalanceSnapshotsUseCase,
+    TakeBalanceSnapshotsOutput,
+)
 from .transfer_money import (
     TransferMoneyUseCase,
     TransferMoneyInput,
@@ -31,6 +81,38 @@ __all__ = [
     "WithdrawMoneyUseCase",
     "WithdrawMoneyInput",
     "WithdrawMoneyOutput",
+    "ExportStatementUseCase",
+    "ExportStatementInput",
+    "StatementLine",
+    "GetBalanceDistributionUseCase",
+    "GetBalanceDistributionInput",
+    "GetBalanceDistributionOutput",
+    "BalanceBucketItem",
+    "GetBalanceAtUseCase",
+    "GetBalanceAtInput",
+    "GetBalanceAtOutput",
+    "GetOpeningRateUseCase",
+    "GetOpeningRateInput",
+    "GetOpeningRateOutput",
+    "OpeningRateItem",
+    "GetStatusReportUseCase",
+    "GetStatusReportOutput",
+    "StatusReportItem",
+    "GetSystemStatsUseCase",
+    "GetSystemStatsInput",
+    "GetSystemStatsOutput",
+    "LedgerDayItem",
+    "StatusStatsItem",
+    "GetTransactionHistoryUseCase",
+    "GetTransactionHistoryInput",
+    "GetTransactionHistoryOutput",
+    "TransactionHistoryItem",
+    "ListAccountsUseCase",
+    "ListAccountsInput",
+    "ListAccountsOutput",
+    "AccountListItem",
+    "TakeBalanceSnapshotsUseCase",
+    "TakeBalanceSnapshotsOutput",
     "TransferMoneyUseCase",
     "TransferMoneyInput",
     "TransferMoneyOutput",
@@ -2,18 +2,30 @@
 Use Case: Criar uma nova conta bancária.
 
 Este Use Case coordena a criação de uma conta:
-1. Valida se CPF já não existe
+1. Valida se CPF já não existe (só enquanto há contas no formato antigo)
 2. Cria a entidade Account (domínio faz as validações!)
-3. Salva no repositório
-4. Dispara evento AccountCreated
+3. Salva no repositório (que também rejeita CPF duplicado)
+4. Grava o checkpoint de abertura (saldo zero antes de qualquer lançamento)
+5. Registra o saldo inicial no livro-razão (se houver)
+6. Dispara evento AccountCreated
 """
 
 from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
 
-from ...domain.entities import Account
+from ...domain.entities import Account, Transaction, TransactionType
 from ...domain.value_objects import CPF, Money
 from ...domain.events import AccountCreated
-from ..interfaces import AccountRepository, EventPublisher
+from ...domain.exceptions import DuplicateAccountError
+from ..interfaces import (
+    AccountRepository,
+    BalanceSnapshot,
+    EventPublisher,
+    SnapshotRepository,
+    TransactionRepository,
+)
+from ..services import OPENING_POSITION, traced_use_case
 
 
 
@@ -54,6 +66,9 @@ class CreateAccountUseCase:
         self,
         account_repository: AccountRepository,
         event_publisher: EventPublisher,
+        transaction_repository: TransactionRepository,
+        snapshot_repository: SnapshotRepository | None = None,
+        check_legacy_cpf: bool = True,
     ) -> None:
         """
         Injeta as dependências.
@@ -61,10 +76,19 @@ class CreateAccountUseCase:
         Args:
             account_repository: Repositório de contas (interface!)
             event_publisher: Publicador de eventos (interface!)
+            transaction_repository: Livro-razão de transações (interface!)
+            snapshot_repository: Checkpoints de saldo (sem ele, a abertura
+                fica para o job de checkpoints)
+            check_legacy_cpf: Consulta o CPF antes de gravar
+                (Settings.cpf_migration_pending)
         """
         self.account_repository = account_repository
         self.event_publisher = event_publisher
+        self.transaction_repository = transaction_repository
+        self.snapshot_repository = snapshot_repository
+        self.check_legacy_cpf = check_legacy_cpf
     
+    @traced_use_case
     async def execute(self, input_dto: CreateAccountInput) -> CreateAccountOutput:
         """
         Executa o caso de uso.
@@ -76,16 +100,20 @@ class CreateAccountUseCase:
             Dados da conta criada
             
         Raises:
-            ValueError: Se CPF já existir ou dados inválidos
+            DuplicateAccountError: Se CPF já existir
+            ValueError: Se dados inválidos
         """
         # 1. Converter strings para Value Objects (com validação!)
         cpf = CPF(input_dto.cpf)
         initial_balance = Money.create(input_dto.initial_balance)
         
         # 2. Verificar se CPF já existe
-        exists = await self.account_repository.exists_by_cpf(cpf)
-        if exists:
-            raise ValueError(f"CPF {cpf} já possui uma conta cadastrada")
+        # Contas antigas ainda guardam o CPF formatado (até o fim do
+        # migrate_account_documents), e o índice único não compara os dois
+        # formatos: só esta consulta, que casa ambos, barra o duplicado.
+        # Migradas as contas, o índice único do passo 4 basta
+        if self.check_legacy_cpf and await self.account_repository.exists_by_cpf(cpf):
+            raise DuplicateAccountError("cpf", cpf.formatted())
         
         # 3. Criar a entidade (lógica de negócio no domínio!)
         account = Account.create(
@@ -95,9 +123,34 @@ class CreateAccountUseCase:
         )
         
         # 4. Salvar no repositório
+        # O índice único de CPF rejeita duplicados na própria escrita
+        # (DuplicateAccountError): cobre duas criações simultâneas
         await self.account_repository.save(account)
         
-        # 5. Disparar evento de domínio
+        # 5. Checkpoint de abertura: o histórico da conta nova é completo,
+        # então o livro-razão parte de zero (saldo inicial é um lançamento)
+        if self.snapshot_repository:
+            await self.snapshot_repository.save(
+                BalanceSnapshot(
+                    account_number=account.account_number,
+                    balance=Decimal("0"),
+                    ledger_position=OPENING_POSITION,
+                    taken_at=datetime.now(),
+                )
+            )
+        
+        # 6. Saldo inicial entra no histórico como um depósito
+        if initial_balance.amount > 0:
+            transaction = Transaction.create(
+                account_number=account.account_number,
+                type=TransactionType.DEPOSIT,
+                amount=initial_balance,
+                description="Saldo inicial",
+            )
+            transaction.complete()
+            await self.transaction_repository.save(transaction)
+        
+        # 7. Disparar evento de domínio
         event = AccountCreated(
             account_number=str(account.account_number),
             holder_name=account.holder_name,
@@ -106,7 +159,7 @@ class CreateAccountUseCase:
         )
         await self.event_publisher.publish(event)
         
-        # 6. Retornar dados da conta criada
+        # 8. Retornar dados da conta criada
         return CreateAccountOutput(
             account_number=str(account.account_number),
             holder_name=account.holder_name,
@@ -2,17 +2,32 @@
 Use Case: Depositar dinheiro em uma conta.
 
 Fluxo:
-1. Busca a conta
-2. Deposita o dinheiro (lógica na entidade!)
-3. Salva no repositório
-4. Dispara evento MoneyDeposited
+1. Credita o valor direto no repositório (atômico, uma ida ao banco)
+2. Registra a transação no livro-razão
+3. Dispara evento MoneyDeposited
+
+Com uma UnitOfWork (outbox habilitada), os três passos são gravados
+na mesma transação.
+
+Sem UnitOfWork o saldo é gravado antes do lançamento e do evento: se a
+resposta se perder, o cliente pode repetir a requisição. Com a mesma
+idempotency_key a repetição não aplica o depósito de novo (o marcador
+fica na conta, na mesma escrita do saldo) e só completa o lançamento
+que tiver faltado.
 """
 
 from dataclasses import dataclass
 
+from ...domain.entities import Transaction, TransactionType
 from ...domain.value_objects import AccountNumber, Money
 from ...domain.events import MoneyDeposited
-from ..interfaces import AccountRepository, EventPublisher
+from ..interfaces import (
+    AccountRepository,
+    EventPublisher,
+    TransactionRepository,
+    UnitOfWork,
+)
+from ..services import RetryPolicy, traced_use_case
 
 
 @dataclass
@@ -20,15 +35,16 @@ class DepositMoneyInput:
     """Dados de entrada para depósito."""
     account_number: str
     amount: float
+    idempotency_key: str | None = None  # Mesma chave = mesma operação
 
 
 @dataclass
 class DepositMoneyOutput:
     """Dados de saída após depósito."""
     account_number: str
-    old_balance: str
+    old_balance: str | None  # None em contas com saldo dividido e em repetições
     amount_deposited: str
-    new_balance: str
+    new_balance: str | None
 
 
 class DepositMoneyUseCase:
@@ -38,10 +54,17 @@ class DepositMoneyUseCase:
         self,
         account_repository: AccountRepository,
         event_publisher: EventPublisher,
+        transaction_repository: TransactionRepository,
+        retry_policy: RetryPolicy | None = None,
+        unit_of_work: UnitOfWork | None = None,
     ) -> None:
         self.account_repository = account_repository
         self.event_publisher = event_publisher
+        self.transaction_repository = transaction_repository
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.unit_of_work = unit_of_work
     
+    @traced_use_case
     async def execute(self, input_dto: DepositMoneyInput) -> DepositMoneyOutput:
         """
         Executa o depósito.
@@ -53,40 +76,78 @@ class DepositMoneyUseCase:
             Resultado do depósito
             
         Raises:
-            ValueError: Se conta não existir ou dados inválidos
+            AccountNotFoundError: Se conta não existir
+            AccountNotActiveError: Se conta não estiver ativa
+            ValueError: Se dados inválidos
         """
         # 1. Converter para Value Objects
         account_number = AccountNumber(value=input_dto.account_number)
         amount = Money.create(input_dto.amount)
         
-        # 2. Buscar a conta
-        account = await self.account_repository.find_by_account_number(
-            account_number
+        # Chave de idempotência do cliente: vira o marcador da operação na
+        # conta (gravado na mesma escrita do saldo) e o id do lançamento
+        operation_id = (
+            f"deposit:{account_number}:{input_dto.idempotency_key}"
+            if input_dto.idempotency_key
+            else None
         )
-        if not account:
-            raise ValueError(f"Conta {account_number} não encontrada")
-        
-        # 3. Guardar saldo antigo
-        old_balance = account.balance
         
-        # 4. Depositar (lógica na entidade!)
-        account.deposit(amount)
-        
-        # 5. Salvar no repositório
-        await self.account_repository.save(account)
+        # 2 a 6 numa unidade de trabalho: com a outbox, saldo, lançamento
+        # e evento são gravados na mesma transação (ou nenhum deles)
+        async def work() -> tuple[Money | None, Money | None]:
+            # 2. Creditar no repositório
+            # O banco valida o status e soma o valor atomicamente, sem
+            # ler-modificar-salvar (depósitos concorrentes não se perdem)
+            # (com retry caso o repositório acuse conflito de versão)
+            new_balance = await self.retry_policy.run(
+                lambda: self.account_repository.apply_balance_delta(
+                    account_number, amount.amount, operation_id
+                )
+            )
+            
+            # 3. Repetição de uma operação já concluída: o lançamento com
+            # este id já existe, não há nada a gravar nem a publicar
+            if (
+                new_balance is None
+                and operation_id
+                and await self.transaction_repository.exists(operation_id)
+            ):
+                return None, None
+            
+            # 4. Saldo antigo derivado do novo (conta com saldo dividido
+            # não devolve o saldo: somar os slots custaria mais uma ida ao banco)
+            old_balance = Money(new_balance.amount - amount.amount) if new_balance else None
+            
+            # 5. Registrar no livro-razão (histórico da conta)
+            transaction = Transaction.create(
+                account_number=account_number,
+                type=TransactionType.DEPOSIT,
+                amount=amount,
+                description="Depósito",
+                id=operation_id,
+            )
+            transaction.complete()
+            await self.transaction_repository.save(transaction)
+            
+            # 6. Disparar evento
+            event = MoneyDeposited(
+                account_number=str(account_number),
+                amount=str(amount.amount),
+                new_balance=str(new_balance.amount) if new_balance else None,
+            )
+            await self.event_publisher.publish(event)
+            
+            return old_balance, new_balance
         
-        # 6. Disparar evento
-        event = MoneyDeposited(
-            account_number=str(account.account_number),
-            amount=str(amount.amount),
-            new_balance=str(account.balance.amount),
-        )
-        await self.event_publisher.publish(event)
+        if self.unit_of_work:
+            old_balance, new_balance = await self.unit_of_work.run(work)
+        else:
+            old_balance, new_balance = await work()
         
         # 7. Retornar resultado
         return DepositMoneyOutput(
-            account_number=str(account.account_number),
-            old_balance=str(old_balance.amount),
+            account_number=str(account_number),
+            old_balance=str(old_balance.amount) if old_balance else None,
             amount_deposited=str(amount.amount),
-            new_balance=str(account.balance.amount),
+            new_balance=str(new_balance.amount) if new_balance else None,
         )
\ No newline at end of file
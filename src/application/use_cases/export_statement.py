@@ -0,0 +1,110 @@
+"""
+Use Case: Exportar o extrato completo de uma conta.
+
+Fluxo:
+1. Valida a conta (antes de começar a transmitir)
+2. Percorre o livro-razão em ordem cronológica
+3. Emite cada lançamento com o saldo acumulado até ele
+
+O extrato é um async iterator: nada é carregado em lista, então
+contas com centenas de milhares de lançamentos usam a mesma
+memória que uma conta com dez.
+"""
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from decimal import Decimal
+
+from ...domain.entities import TransactionStatus
+from ...domain.exceptions import AccountNotFoundError
+from ...domain.value_objects import AccountNumber
+from ..interfaces import AccountRepository, ReadConsistency, TransactionRepository
+from ..services import traced_use_case
+
+
+@dataclass
+class ExportStatementInput:
+    """DTO de entrada."""
+    account_number: str
+
+
+@dataclass
+class StatementLine:
+    """Uma linha do extrato."""
+    transaction_id: str
+    created_at: str
+    type: str
+    description: str
+    related_account: str | None
+    amount: str
+    balance: str
+
+
+class ExportStatementUseCase:
+    """Caso de uso: Exportar extrato da conta."""
+    
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Args:
+            account_repository: Repositório de contas (interface!)
+            transaction_repository: Livro-razão de transações (interface!)
+            batch_size: Lançamentos por ida ao banco
+        """
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+        self.batch_size = batch_size
+    
+    @traced_use_case
+    async def execute(self, input_dto: ExportStatementInput) -> AsyncIterator[StatementLine]:
+        """
+        Valida a conta e devolve o iterador das linhas do extrato.
+        
+        A validação acontece aqui (e não dentro do iterador) para que
+        os erros virem uma resposta HTTP normal, antes do streaming.
+        
+        Raises:
+            ValueError: Se o número da conta for inválido
+            AccountNotFoundError: Se conta não existir
+        """
+        # 1. Validar conta
+        account_number = AccountNumber(value=input_dto.account_number)
+        account = await self.account_repository.find_by_account_number(
+            account_number, ReadConsistency.EVENTUAL
+        )
+        if not account:
+            raise AccountNotFoundError(str(account_number))
+        
+        return self._lines(account_number)
+    
+    @traced_use_case  # As leituras do streaming também contam para o use case
+    async def _lines(self, account_number: AccountNumber) -> AsyncIterator[StatementLine]:
+        """Linhas do extrato com o saldo acumulado (o ledger começa do zero)."""
+        balance = Decimal("0")
+        
+        # 2. Percorrer o livro-razão em ordem cronológica
+        async for transaction in self.transaction_repository.stream_by_account(
+            account_number, self.batch_size, consistency=ReadConsistency.EVENTUAL
+        ):
+            if transaction.status != TransactionStatus.COMPLETED:
+                continue
+            
+            # 3. Saldo acumulado até este lançamento
+            balance += transaction.signed_amount
+            yield StatementLine(
+                transaction_id=transaction.id,
+                created_at=transaction.created_at.isoformat(),
+                type=transaction.type.value,
+                description=transaction.description,
+                related_account=(
+                    str(transaction.related_account)
+                    if transaction.related_account
+                    else None
+                ),
+                amount=str(transaction.signed_amount),
+                balance=str(balance),
+            )
@@ -0,0 +1,77 @@
+"""
+Use Case: Consultar o saldo de uma conta em um instante.
+
+Fluxo:
+1. Valida a conta
+2. Carrega o checkpoint mais próximo antes do instante
+3. Soma só os lançamentos depois dele
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from ...domain.exceptions import AccountNotFoundError
+from ...domain.value_objects import AccountNumber
+from ..interfaces import AccountRepository, ReadConsistency
+from ..services import LedgerReplayer, traced_use_case
+
+
+@dataclass
+class GetBalanceAtInput:
+    """DTO de entrada (at=None: saldo atual segundo o livro-razão)."""
+    account_number: str
+    at: datetime | None = None
+
+
+@dataclass
+class GetBalanceAtOutput:
+    """DTO de saída."""
+    account_number: str
+    balance: str
+    at: str | None
+    snapshot_taken_at: str
+    replayed_entries: int
+
+
+class GetBalanceAtUseCase:
+    """Caso de uso: Saldo em um instante."""
+    
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        replayer: LedgerReplayer,
+    ) -> None:
+        self.account_repository = account_repository
+        self.replayer = replayer
+    
+    @traced_use_case
+    async def execute(self, input_dto: GetBalanceAtInput) -> GetBalanceAtOutput:
+        """
+        Executa o caso de uso.
+        
+        Raises:
+            ValueError: Se o número da conta for inválido
+            AccountNotFoundError: Se conta não existir
+            MissingOpeningSnapshotError: Se a conta ainda não tem checkpoint
+                de abertura (conta antiga antes da passada do job)
+        """
+        # 1. Validar conta
+        account_number = AccountNumber(value=input_dto.account_number)
+        account = await self.account_repository.find_by_account_number(
+            account_number, ReadConsistency.EVENTUAL
+        )
+        if not account:
+            raise AccountNotFoundError(str(account_number))
+        
+        # 2. e 3. Checkpoint + lançamentos posteriores
+        result = await self.replayer.balance_at(
+            account_number, input_dto.at, ReadConsistency.EVENTUAL
+        )
+        
+        return GetBalanceAtOutput(
+            account_number=str(account_number),
+            balance=str(result.balance),
+            at=input_dto.at.isoformat() if input_dto.at else None,
+            snapshot_taken_at=result.snapshot.taken_at.isoformat(),
+            replayed_entries=result.replayed_entries,
+        )
@@ -0,0 +1,87 @@
+"""
+Use Case: Distribuição das contas por faixa de saldo.
+
+Fluxo:
+1. Valida os limites das faixas
+2. Conta as contas de cada faixa (no banco)
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from ..interfaces import ReportRepository
+from ..services import traced_use_case
+
+
+# Faixas padrão: [0, 100), [100, 1.000), [1.000, 10.000), [10.000, 100.000), 100.000+
+DEFAULT_BOUNDARIES = [
+    Decimal("0"),
+    Decimal("100"),
+    Decimal("1000"),
+    Decimal("10000"),
+    Decimal("100000"),
+]
+
+MAX_BUCKETS = 50
+
+
+@dataclass
+class GetBalanceDistributionInput:
+    """DTO de entrada (None: faixas padrão)."""
+    boundaries: list[Decimal] | None = None
+
+
+@dataclass
+class BalanceBucketItem:
+    """Uma faixa de saldo (upper=None: sem teto)."""
+    lower: str
+    upper: str | None
+    count: int
+    total_balance: str
+
+
+@dataclass
+class GetBalanceDistributionOutput:
+    """DTO de saída."""
+    buckets: list[BalanceBucketItem]
+
+
+class GetBalanceDistributionUseCase:
+    """Caso de uso: Distribuição de saldos."""
+
+    def __init__(self, report_repository: ReportRepository) -> None:
+        self.report_repository = report_repository
+
+    @traced_use_case
+    async def execute(
+        self, input_dto: GetBalanceDistributionInput
+    ) -> GetBalanceDistributionOutput:
+        """
+        Executa o caso de uso.
+
+        Raises:
+            ValueError: Se os limites não forem crescentes a partir de zero
+        """
+        # 1. Validar limites (a primeira faixa começa em zero: nenhum saldo fica de fora)
+        boundaries = input_dto.boundaries or DEFAULT_BOUNDARIES
+        if boundaries[0] != 0:
+            boundaries = [Decimal("0")] + boundaries
+        if any(lower >= upper for lower, upper in zip(boundaries, boundaries[1:])):
+            raise ValueError("Os limites das faixas devem ser crescentes e positivos")
+        if len(boundaries) > MAX_BUCKETS:
+            raise ValueError(f"No máximo {MAX_BUCKETS} faixas")
+
+        # 2. Agregar
+        buckets = await self.report_repository.balance_distribution(boundaries)
+
+        return GetBalanceDistributionOutput(
+            buckets=[
+                BalanceBucketItem(
+                    lower=str(bucket.lower),
+                    upper=str(bucket.upper) if bucket.upper is not None else None,
+                    count=bucket.count,
+                    total_balance=str(bucket.total_balance),
+                )
+                for bucket in buckets
+            ]
+        )
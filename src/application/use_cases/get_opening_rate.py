@@ -0,0 +1,90 @@
+"""
+Use Case: Ritmo de abertura de contas.
+
+Fluxo:
+1. Valida período e intervalo
+2. Conta as aberturas por dia, semana ou mês (no banco)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from ..interfaces import ReportPeriod, ReportRepository
+from ..services import traced_use_case
+
+
+# Intervalo padrão e máximo (evita séries enormes por dia)
+DEFAULT_RANGE = timedelta(days=30)
+MAX_RANGE = timedelta(days=3 * 366)
+
+
+@dataclass
+class GetOpeningRateInput:
+    """DTO de entrada (sem datas: últimos 30 dias)."""
+    period: str = ReportPeriod.DAY.value
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+@dataclass
+class OpeningRateItem:
+    """Aberturas em um período."""
+    period_start: str
+    count: int
+
+
+@dataclass
+class GetOpeningRateOutput:
+    """DTO de saída."""
+    period: str
+    created_from: str
+    created_to: str
+    points: list[OpeningRateItem]
+    total: int
+
+
+class GetOpeningRateUseCase:
+    """Caso de uso: Aberturas de conta por período."""
+
+    def __init__(self, report_repository: ReportRepository) -> None:
+        self.report_repository = report_repository
+
+    @traced_use_case
+    async def execute(self, input_dto: GetOpeningRateInput) -> GetOpeningRateOutput:
+        """
+        Executa o caso de uso.
+
+        Raises:
+            ValueError: Se o período ou o intervalo forem inválidos
+        """
+        # 1. Validar
+        try:
+            period = ReportPeriod(input_dto.period)
+        except ValueError:
+            valid = ", ".join(p.value for p in ReportPeriod)
+            raise ValueError(f"Período inválido: {input_dto.period} (use {valid})")
+
+        # Sem fim informado: até o próximo minuto cheio (requisições do mesmo
+        # minuto pedem o mesmo intervalo e aproveitam o cache de relatórios)
+        created_to = input_dto.created_to or (
+            datetime.now().replace(second=0, microsecond=0) + timedelta(minutes=1)
+        )
+        created_from = input_dto.created_from or created_to - DEFAULT_RANGE
+        if created_from >= created_to:
+            raise ValueError("created_from deve ser anterior a created_to")
+        if created_to - created_from > MAX_RANGE:
+            raise ValueError("Intervalo máximo de 3 anos")
+
+        # 2. Agregar
+        points = await self.report_repository.opening_rate(period, created_from, created_to)
+
+        return GetOpeningRateOutput(
+            period=period.value,
+            created_from=created_from.isoformat(),
+            created_to=created_to.isoformat(),
+            points=[
+                OpeningRateItem(period_start=point.period_start.isoformat(), count=point.count)
+                for point in points
+            ],
+            total=sum(point.count for point in points),
+        )
@@ -0,0 +1,64 @@
+"""
+Use Case: Relatório de contas e saldos por status.
+
+Fluxo:
+1. Agrega as contas por status (no banco)
+2. Completa os status sem contas e soma o total geral
+"""
+
+from dataclasses import dataclass
+
+from ...domain.entities import AccountStatus
+from ..interfaces import ReportRepository
+from ..services import traced_use_case
+
+
+@dataclass
+class StatusReportItem:
+    """Totais de um status."""
+    status: str
+    count: int
+    total_balance: str
+    average_balance: str
+
+
+@dataclass
+class GetStatusReportOutput:
+    """DTO de saída."""
+    items: list[StatusReportItem]
+    total_accounts: int
+    total_balance: str
+
+
+class GetStatusReportUseCase:
+    """Caso de uso: Totais por status."""
+
+    def __init__(self, report_repository: ReportRepository) -> None:
+        self.report_repository = report_repository
+
+    @traced_use_case
+    async def execute(self) -> GetStatusReportOutput:
+        """Executa o caso de uso."""
+        # 1. Agregar
+        rows = {row.status: row for row in await self.report_repository.totals_by_status()}
+
+        # 2. Todos os status aparecem, mesmo zerados
+        items = [
+            StatusReportItem(
+                status=status.value,
+                count=rows[status.value].count,
+                total_balance=str(rows[status.value].total_balance),
+                average_balance=str(rows[status.value].average_balance),
+            )
+            if status.value in rows
+            else StatusReportItem(
+                status=status.value, count=0, total_balance="0", average_balance="0"
+            )
+            for status in AccountStatus
+        ]
+
+        return GetStatusReportOutput(
+            items=items,
+            total_accounts=sum(row.count for row in rows.values()),
+            total_balance=str(sum((row.total_balance for row in rows.values()), start=0)),
+        )
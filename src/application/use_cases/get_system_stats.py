@@ -0,0 +1,104 @@
+"""
+Use Case: Consultar o resumo agregado do sistema.
+
+Fluxo:
+1. Valida o período pedido
+2. Lê as visões materializadas (sem varrer contas nem lançamentos)
+3. Formata os totais
+"""
+
+from dataclasses import dataclass
+
+from ...domain.entities import AccountStatus
+from ..interfaces import StatsRepository
+from ..services import traced_use_case
+
+
+# Maior período aceito (um documento por dia)
+MAX_DAYS = 366
+
+
+@dataclass
+class GetSystemStatsInput:
+    """DTO de entrada."""
+    days: int = 30
+
+
+@dataclass
+class StatusStatsItem:
+    """Totais de um status de conta."""
+    status: str
+    count: int
+    balance: str
+
+
+@dataclass
+class LedgerDayItem:
+    """Totais de um tipo de lançamento em um dia."""
+    day: str
+    type: str
+    count: int
+    amount: str
+
+
+@dataclass
+class GetSystemStatsOutput:
+    """DTO de saída."""
+    total_accounts: int
+    pending_accounts: int
+    accounts_by_status: list[StatusStatsItem]
+    ledger_days: list[LedgerDayItem]
+    updated_at: str | None
+
+
+class GetSystemStatsUseCase:
+    """Caso de uso: Resumo do sistema."""
+
+    def __init__(self, stats_repository: StatsRepository) -> None:
+        self.stats_repository = stats_repository
+
+    @traced_use_case
+    async def execute(self, input_dto: GetSystemStatsInput) -> GetSystemStatsOutput:
+        """
+        Executa o caso de uso.
+
+        Raises:
+            ValueError: Se o período for inválido
+        """
+        # 1. Validar período
+        if not 1 <= input_dto.days <= MAX_DAYS:
+            raise ValueError(f"days deve estar entre 1 e {MAX_DAYS}")
+
+        # 2. Ler visões
+        stats = await self.stats_repository.get_stats(input_dto.days)
+
+        # 3. Formatar (todos os status aparecem, mesmo zerados)
+        by_status = [
+            StatusStatsItem(
+                status=status.value,
+                count=stats.accounts_by_status[status.value].count,
+                balance=str(stats.accounts_by_status[status.value].balance),
+            )
+            if status.value in stats.accounts_by_status
+            else StatusStatsItem(status=status.value, count=0, balance="0")
+            for status in AccountStatus
+        ]
+
+        return GetSystemStatsOutput(
+            total_accounts=sum(item.count for item in by_status),
+            pending_accounts=next(
+                item.count for item in by_status if item.status == AccountStatus.ANALYSIS.value
+            ),
+            accounts_by_status=by_status,
+            ledger_days=[
+                LedgerDayItem(
+                    day=day.day.isoformat(),
+                    type=transaction_type,
+                    count=count,
+                    amount=str(amount),
+                )
+                for day in stats.ledger_days
+                for transaction_type, (count, amount) in sorted(day.by_type.items())
+            ],
+            updated_at=stats.updated_at.isoformat() if stats.updated_at else None,
+        )
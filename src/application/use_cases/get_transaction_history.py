@@ -0,0 +1,88 @@
+"""
+Use Case: Consultar o histórico de transações de uma conta.
+
+Fluxo:
+1. Valida o número da conta
+2. Busca uma página do livro-razão (paginação por cursor)
+"""
+
+from dataclasses import dataclass
+
+from ...domain.value_objects import AccountNumber
+from ..interfaces import ReadConsistency, TransactionRepository
+from ..services import traced_use_case
+
+
+@dataclass
+class GetTransactionHistoryInput:
+    """DTO de entrada."""
+    account_number: str
+    limit: int = 50
+    cursor: str | None = None
+
+
+@dataclass
+class TransactionHistoryItem:
+    """Um lançamento do histórico."""
+    transaction_id: str
+    type: str
+    amount: str
+    status: str
+    description: str
+    related_account: str | None
+    created_at: str
+
+
+@dataclass
+class GetTransactionHistoryOutput:
+    """DTO de saída: uma página do histórico."""
+    account_number: str
+    items: list[TransactionHistoryItem]
+    next_cursor: str | None
+
+
+class GetTransactionHistoryUseCase:
+    """Caso de uso: Consultar histórico de transações."""
+    
+    def __init__(self, transaction_repository: TransactionRepository) -> None:
+        self.transaction_repository = transaction_repository
+    
+    @traced_use_case
+    async def execute(
+        self, input_dto: GetTransactionHistoryInput
+    ) -> GetTransactionHistoryOutput:
+        """
+        Executa o caso de uso.
+        
+        Raises:
+            ValueError: Se o número da conta ou o cursor forem inválidos
+        """
+        # 1. Converter para Value Object
+        account_number = AccountNumber(value=input_dto.account_number)
+        
+        # 2. Buscar a página (mais recentes primeiro)
+        page = await self.transaction_repository.find_page_by_account(
+            account_number, input_dto.limit, input_dto.cursor, ReadConsistency.EVENTUAL
+        )
+        
+        # 3. Retornar resultado
+        return GetTransactionHistoryOutput(
+            account_number=str(account_number),
+            items=[
+                TransactionHistoryItem(
+                    transaction_id=transaction.id,
+                    type=transaction.type.value,
+                    amount=str(transaction.amount.amount),
+                    status=transaction.status.value,
+                    description=transaction.description,
+                    related_account=(
+                        str(transaction.related_account)
+                        if transaction.related_account
+                        else None
+                    ),
+                    created_at=transaction.created_at.isoformat(),
+                )
+                for transaction in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
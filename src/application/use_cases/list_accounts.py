@@ -0,0 +1,96 @@
+"""
+Use Case: Listar contas com filtros.
+
+Ex.: todas as contas em ANALYSIS aguardando aprovação, da mais
+antiga para a mais nova, página a página (paginação por cursor).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from ...domain.entities import AccountStatus
+from ..interfaces import AccountRepository, ReadConsistency
+from ..services import traced_use_case
+
+
+@dataclass
+class ListAccountsInput:
+    """DTO de entrada."""
+    status: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    limit: int = 50
+    cursor: str | None = None
+
+
+@dataclass
+class AccountListItem:
+    """Uma conta da listagem."""
+    account_number: str
+    holder_name: str
+    status: str
+    balance: str
+    created_at: str
+
+
+@dataclass
+class ListAccountsOutput:
+    """DTO de saída: uma página da listagem."""
+    items: list[AccountListItem]
+    next_cursor: str | None
+
+
+class ListAccountsUseCase:
+    """Caso de uso: Listar contas."""
+    
+    def __init__(self, account_repository: AccountRepository) -> None:
+        self.account_repository = account_repository
+    
+    @traced_use_case
+    async def execute(self, input_dto: ListAccountsInput) -> ListAccountsOutput:
+        """
+        Executa o caso de uso.
+        
+        Raises:
+            ValueError: Se status, faixa de datas ou cursor forem inválidos
+        """
+        # 1. Validar filtros
+        status = None
+        if input_dto.status:
+            try:
+                status = AccountStatus(input_dto.status)
+            except ValueError:
+                valid = ", ".join(s.value for s in AccountStatus)
+                raise ValueError(f"Status inválido: {input_dto.status} (use {valid})")
+        
+        if (
+            input_dto.created_from
+            and input_dto.created_to
+            and input_dto.created_from > input_dto.created_to
+        ):
+            raise ValueError("created_from deve ser anterior a created_to")
+        
+        # 2. Buscar a página (listagem tolera leitura de secundário)
+        page = await self.account_repository.list_accounts(
+            status=status,
+            created_from=input_dto.created_from,
+            created_to=input_dto.created_to,
+            limit=input_dto.limit,
+            cursor=input_dto.cursor,
+            consistency=ReadConsistency.EVENTUAL,
+        )
+        
+        # 3. Retornar resultado
+        return ListAccountsOutput(
+            items=[
+                AccountListItem(
+                    account_number=summary.account_number,
+                    holder_name=summary.holder_name,
+                    status=summary.status,
+                    balance=str(summary.balance),
+                    created_at=summary.created_at.isoformat(),
+                )
+                for summary in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
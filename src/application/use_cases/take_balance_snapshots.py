@@ -0,0 +1,108 @@
+"""
+Use Case: Gravar checkpoints de saldo de um lote de contas.
+
+Para cada conta:
+1. Reconstrói o saldo a partir do último checkpoint
+2. Se entraram lançamentos suficientes desde ele, grava um novo
+
+Conta sem nenhum checkpoint (criada antes do livro-razão) ganha o
+checkpoint de abertura, calculado a partir do saldo gravado
+(LedgerReplayer.opening_snapshot).
+
+Só entram lançamentos com mais de `settle_seconds`: o worker grava
+o livro-razão em lotes, então um lançamento recente ainda pode
+chegar com created_at anterior ao último já visto. Um checkpoint
+depois dele o deixaria de fora para sempre.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from ...domain.exceptions import MissingOpeningSnapshotError
+from ...domain.value_objects import AccountNumber
+from ..interfaces import AccountRepository, BalanceSnapshot, SnapshotRepository
+from ..services import LedgerReplayer, traced_use_case
+
+
+@dataclass
+class TakeBalanceSnapshotsOutput:
+    """Resumo do lote."""
+    accounts: int
+    snapshots_taken: int
+    entries_replayed: int
+
+
+class TakeBalanceSnapshotsUseCase:
+    """Caso de uso: Checkpoints de saldo em lote (contas em paralelo)."""
+    
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        replayer: LedgerReplayer,
+        snapshot_repository: SnapshotRepository,
+        min_entries: int = 50,
+        settle_seconds: float = 60.0,
+        concurrency: int = 10,
+    ) -> None:
+        """
+        Args:
+            account_repository: Saldo gravado, para os checkpoints de abertura
+            replayer: Reconstrói saldos a partir do livro-razão
+            snapshot_repository: Onde gravar os checkpoints (interface!)
+            min_entries: Lançamentos novos necessários para um checkpoint
+            settle_seconds: Idade mínima dos lançamentos considerados
+            concurrency: Contas processadas ao mesmo tempo
+        """
+        self.account_repository = account_repository
+        self.replayer = replayer
+        self.snapshot_repository = snapshot_repository
+        self.min_entries = min_entries
+        self.settle_seconds = settle_seconds
+        self._semaphore = asyncio.Semaphore(concurrency)
+    
+    @traced_use_case
+    async def execute(self, account_numbers: list[AccountNumber]) -> TakeBalanceSnapshotsOutput:
+        """Processa o lote com até `concurrency` contas em paralelo."""
+        until = datetime.now() - timedelta(seconds=self.settle_seconds)
+        results = await asyncio.gather(
+            *(self._snapshot(account_number, until) for account_number in account_numbers)
+        )
+        
+        return TakeBalanceSnapshotsOutput(
+            accounts=len(account_numbers),
+            snapshots_taken=sum(1 for taken, _ in results if taken),
+            entries_replayed=sum(replayed for _, replayed in results),
+        )
+    
+    async def _snapshot(self, account_number: AccountNumber, until: datetime) -> tuple[bool, int]:
+        async with self._semaphore:
+            # 1. Saldo a partir do último checkpoint
+            try:
+                result = await self.replayer.balance_at(account_number, until)
+            except MissingOpeningSnapshotError:
+                return await self._open(account_number), 0
+            
+            # 2. Novo checkpoint só se valer a pena
+            if result.replayed_entries < self.min_entries or result.position is None:
+                return False, result.replayed_entries
+            
+            await self.snapshot_repository.save(
+                BalanceSnapshot(
+                    account_number=account_number,
+                    balance=result.balance,
+                    ledger_position=result.position,
+                    taken_at=datetime.now(),
+                )
+            )
+            return True, result.replayed_entries
+    
+    async def _open(self, account_number: AccountNumber) -> bool:
+        """Grava o checkpoint de abertura a partir do saldo gravado."""
+        account = await self.account_repository.find_by_account_number(account_number)
+        if not account:
+            return False  # Removida entre a listagem e agora
+        
+        snapshot = await self.replayer.opening_snapshot(account_number, account.balance.amount)
+        await self.snapshot_repository.save(snapshot)
+        return True
@@ -17,7 +17,8 @@ import uuid
 
 from ...domain.value_objects import AccountNumber, Money
 from ...domain.events import TransferRequested
-from ..interfaces import AccountRepository, EventPublisher
+from ..interfaces import AccountRepository, EventPublisher, ReadConsistency
+from ..services import traced_use_case
 
 
 @dataclass
@@ -53,6 +54,7 @@ class TransferMoneyUseCase:
         self.account_repository = account_repository
         self.event_publisher = event_publisher
     
+    @traced_use_case
     async def execute(self, input_dto: TransferMoneyInput) -> TransferMoneyOutput:
         """
         Solicita uma transferência (envia para fila).
@@ -75,17 +77,18 @@ class TransferMoneyUseCase:
         if from_account_number == to_account_number:
             raise ValueError("Não é possível transferir para a mesma conta")
         
-        # 3. Validar que ambas as contas existem
-        from_account = await self.account_repository.find_by_account_number(
-            from_account_number
+        # 3. Validar que ambas as contas existem (uma única consulta)
+        # Leitura EVENTUAL: o worker revalida tudo na liquidação
+        accounts = await self.account_repository.find_many_by_account_numbers(
+            [from_account_number, to_account_number],
+            ReadConsistency.EVENTUAL,
         )
-        if not from_account:
+        found = {account.account_number for account in accounts}
+        
+        if from_account_number not in found:
             raise ValueError(f"Conta origem {from_account_number} não encontrada")
         
-        to_account = await self.account_repository.find_by_account_number(
-            to_account_number
-        )
-        if not to_account:
+        if to_account_number not in found:
             raise ValueError(f"Conta destino {to_account_number} não encontrada")
         
         # 4. Gerar ID único para a transferência
@@ -21,6 +21,7 @@ class Account:
     status: AccountStatus
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    version: int = 0
 
     @staticmethod
     def create(holder_name: str, cpf: CPF, initial_balance: Money) -> "Account":
@@ -97,6 +98,7 @@ class Account:
             f"balance={self.balance}, "
             f"status={self.status}, "
             f"created_at={self.created_at}, "
-            f"updated_at={self.updated_at})"
+            f"updated_at={self.updated_at}, "
+            f"version={self.version})"
         )
     
\ No newline at end of file
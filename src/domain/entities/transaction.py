@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
 import uuid
 
@@ -36,9 +37,10 @@ class Transaction:
         amount: Money,
         description: str = "",
         related_account: AccountNumber | None = None,
+        id: str | None = None,
     ) -> "Transaction":
         return Transaction(
-            id=str(uuid.uuid4()),
+            id=id or str(uuid.uuid4()),
             account_number=account_number,
             type=type,
             amount=amount,
@@ -67,6 +69,13 @@ class Transaction:
         self.status = TransactionStatus.CANCELLED
         self.completed_at = datetime.now()
 
+    @property
+    def signed_amount(self) -> Decimal:
+        """Valor com sinal: positivo para créditos, negativo para débitos."""
+        if self.type in (TransactionType.DEPOSIT, TransactionType.TRANSFER_IN):
+            return self.amount.amount
+        return -self.amount.amount
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Transaction):
             return False
@@ -68,7 +68,7 @@ class AccountClosed(DomainEvent):
 class MoneyDeposited(DomainEvent):
     account_number: str = field(kw_only=True)
     amount: str = field(kw_only=True)
-    new_balance: str = field(kw_only=True)
+    new_balance: str | None = field(kw_only=True)  # None: saldo dividido
 
     def to_dict(self) -> dict:
         base_dict = super().to_dict()
@@ -83,7 +83,7 @@ class MoneyDeposited(DomainEvent):
 class MoneyWithdrawn(DomainEvent):
     account_number: str = field(kw_only=True)
     amount: str = field(kw_only=True)
-    new_balance: str = field(kw_only=True)
+    new_balance: str | None = field(kw_only=True)  # None: saldo dividido
 
     def to_dict(self) -> dict:
         base_dict = super().to_dict()
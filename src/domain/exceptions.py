@@ -0,0 +1,73 @@
+"""Erros de domínio do sistema bancário.
+
+Herdam de ValueError para continuarem sendo tratados como erros de
+validação (HTTP 400) pelas camadas que já capturam ValueError.
+"""
+
+
+class DuplicateAccountError(ValueError):
+    """Já existe uma conta com o mesmo valor em um campo único."""
+
+    def __init__(self, field: str, value: str) -> None:
+        self.field = field
+        self.value = value
+        if field == "cpf":
+            message = f"CPF {value} já possui uma conta cadastrada"
+        else:
+            message = f"Já existe uma conta com {field} {value}"
+        super().__init__(message)
+
+
+class AccountNotFoundError(ValueError):
+    """A conta informada não existe."""
+
+    def __init__(self, account_number: str) -> None:
+        self.account_number = account_number
+        super().__init__(f"Conta {account_number} não encontrada")
+
+
+class AccountNotActiveError(ValueError):
+    """A conta não está ativa para movimentações."""
+
+    def __init__(self, account_number: str) -> None:
+        self.account_number = account_number
+        super().__init__(f"Account {account_number} is not active")
+
+
+class InsufficientFundsError(ValueError):
+    """O saldo da conta não cobre o débito."""
+
+    def __init__(self, account_number: str) -> None:
+        self.account_number = account_number
+        super().__init__(f"Saldo insuficiente na conta {account_number}")
+
+
+class ConcurrentUpdateError(Exception):
+    """
+    A conta foi alterada por outra operação desde que foi lida.
+
+    Não é um erro de validação: a operação pode ser repetida
+    relendo a conta (ver RetryPolicy).
+    """
+
+    def __init__(self, account_numbers: list[str]) -> None:
+        self.account_numbers = account_numbers
+        super().__init__(
+            f"Conta(s) {', '.join(account_numbers)} alterada(s) por outra operação"
+        )
+
+
+class MissingOpeningSnapshotError(ValueError):
+    """
+    A conta não tem checkpoint de abertura no livro-razão.
+
+    Contas anteriores ao livro-razão têm saldo sem lançamentos que o
+    expliquem: somar o histórico a partir de zero daria um valor errado.
+    """
+
+    def __init__(self, account_number: str) -> None:
+        self.account_number = account_number
+        super().__init__(
+            f"Conta {account_number} ainda sem checkpoint de abertura: "
+            f"saldo pelo livro-razão indisponível"
+        )
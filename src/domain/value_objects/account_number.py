@@ -18,6 +18,13 @@ class AccountNumber:
     def generate() -> "AccountNumber":
         return AccountNumber(value=f"ACC-{uuid.uuid4()}")
 
+    @classmethod
+    def from_trusted(cls, value: str) -> "AccountNumber":
+        """Recria um número já validado (ex.: lido do banco) sem validar de novo."""
+        account_number = object.__new__(cls)
+        object.__setattr__(account_number, "value", value)
+        return account_number
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, AccountNumber):
             return False
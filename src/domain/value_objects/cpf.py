@@ -60,6 +60,18 @@ class CPF:
             int(self.value[10]) == second_digit
         )
 
+    @classmethod
+    def from_trusted(cls, value: str) -> "CPF":
+        """
+        Recria um CPF já validado (ex.: lido do banco) sem validar de novo.
+        
+        Só para dados que passaram pelo construtor antes de serem salvos:
+        pula a limpeza e o cálculo dos dígitos verificadores.
+        """
+        cpf = object.__new__(cls)
+        object.__setattr__(cpf, 'value', value)
+        return cpf
+
     def formatted(self) -> str:
         return f"{self.value[:3]}.{self.value[3:6]}.{self.value[6:9]}-{self.value[-2:]}"
 
@@ -18,6 +18,13 @@ class Money:
         """Factory method para criar Money de vários tipos."""
         return Money(amount=Decimal(str(value)))
     
+    @classmethod
+    def from_trusted(cls, amount: Decimal) -> 'Money':
+        """Recria um valor já validado (ex.: lido do banco) sem validar de novo."""
+        money = object.__new__(cls)
+        object.__setattr__(money, 'amount', amount)
+        return money
+    
     def add(self, other: 'Money') -> 'Money':
         return Money(self.amount + other.amount)
     
@@ -0,0 +1,11 @@
+"""Cache em memória do processo."""
+
+from .account_cache import AccountCache
+from .caching_account_repository import CachingAccountRepository
+from .caching_report_repository import CachingReportRepository
+
+__all__ = [
+    "AccountCache",
+    "CachingAccountRepository",
+    "CachingReportRepository",
+]
@@ -0,0 +1,96 @@
+"""
+Cache LRU com TTL para entidades Account.
+
+LRU (Least Recently Used): quando o cache enche, sai a conta usada há
+mais tempo. TTL (Time To Live): cada conta expira depois de alguns
+segundos, o que limita quanto tempo um dado pode ficar desatualizado
+mesmo que uma invalidação se perca.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable
+
+from ...domain.entities import Account
+
+
+class AccountCache:
+    """Cache LRU + TTL de contas, indexado pelo número da conta."""
+    
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_size: Máximo de contas guardadas
+            ttl_seconds: Tempo de vida de cada conta no cache
+            clock: Relógio (injetável para testes)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, Account]] = OrderedDict()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def get(self, account_number: str) -> Account | None:
+        """
+        Retorna uma CÓPIA da conta (ou None se ausente/expirada).
+        
+        Cópia porque Account é mutável: quem recebe pode alterá-la
+        sem corromper o que está no cache.
+        """
+        entry = self._entries.get(account_number)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, account = entry
+        if expires_at <= self.clock():
+            del self._entries[account_number]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        # Usada agora: vai para o fim da fila do LRU
+        self._entries.move_to_end(account_number)
+        self.hits += 1
+        return replace(account)
+    
+    def put(self, account: Account) -> None:
+        """Guarda uma cópia da conta, removendo a menos usada se estiver cheio."""
+        key = str(account.account_number)
+        self._entries[key] = (self.clock() + self.ttl_seconds, replace(account))
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, account_number: str) -> None:
+        """Remove a conta do cache (se estiver nele)."""
+        if self._entries.pop(account_number, None) is not None:
+            self.invalidations += 1
+    
+    def clear(self) -> None:
+        self._entries.clear()
+    
+    def snapshot(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,175 @@
+"""
+Decorator de AccountRepository com cache de leitura.
+
+Envolve qualquer AccountRepository (ex.: o do MongoDB): leituras por
+número da conta passam primeiro pelo cache, escritas vão direto para o
+repositório real e invalidam o cache. Alterações feitas por outros
+processos chegam como eventos (ver CacheInvalidationConsumer).
+
+O cache é por natureza uma leitura EVENTUAL: leituras STRONG vão
+sempre ao repositório (e aproveitam para atualizar o cache).
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from ...domain.entities import Account, AccountStatus
+from ...domain.value_objects import AccountNumber, CPF, Money
+from ...application.interfaces import AccountPage, AccountRepository, ReadConsistency
+from .account_cache import AccountCache
+
+
+class CachingAccountRepository(AccountRepository):
+    """
+    Repositório com cache read-through.
+    
+    IMPLEMENTA a interface AccountRepository delegando ao repositório real.
+    """
+    
+    def __init__(self, repository: AccountRepository, cache: AccountCache) -> None:
+        """
+        Args:
+            repository: Repositório real (fonte da verdade)
+            cache: Cache LRU + TTL de contas
+        """
+        self.repository = repository
+        self.cache = cache
+    
+    # ==================== LEITURAS ====================
+    
+    async def find_by_account_number(
+        self,
+        account_number: AccountNumber,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
+        if consistency == ReadConsistency.EVENTUAL:
+            account = self.cache.get(str(account_number))
+            if account:
+                return account
+        
+        account = await self.repository.find_by_account_number(account_number, consistency)
+        if account:
+            self.cache.put(account)
+        return account
+    
+    async def find_many_by_account_numbers(
+        self,
+        account_numbers: list[AccountNumber],
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> list[Account]:
+        accounts = []
+        missing = []
+        for account_number in account_numbers:
+            account = (
+                self.cache.get(str(account_number))
+                if consistency == ReadConsistency.EVENTUAL
+                else None
+            )
+            if account:
+                accounts.append(account)
+            else:
+                missing.append(account_number)
+        
+        # Só as ausentes vão ao banco, todas numa única consulta
+        if missing:
+            for account in await self.repository.find_many_by_account_numbers(
+                missing, consistency
+            ):
+                self.cache.put(account)
+                accounts.append(account)
+        return accounts
+    
+    async def find_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
+        account = await self.repository.find_by_cpf(cpf, consistency)
+        if account:
+            self.cache.put(account)
+        return account
+    
+    async def exists_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> bool:
+        return await self.repository.exists_by_cpf(cpf, consistency)
+    
+    async def list_account_numbers(
+        self,
+        after: AccountNumber | None = None,
+        limit: int = 100,
+    ) -> list[AccountNumber]:
+        return await self.repository.list_account_numbers(after, limit)
+    
+    async def list_accounts(
+        self,
+        status: AccountStatus | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AccountPage:
+        return await self.repository.list_accounts(
+            status, created_from, created_to, limit, cursor, consistency
+        )
+    
+    # ==================== ESCRITAS ====================
+    # Invalidam mesmo se falharem: um conflito de versão significa que
+    # a cópia em cache já está desatualizada.
+    
+    async def save(self, account: Account) -> None:
+        try:
+            await self.repository.save(account)
+        finally:
+            self.invalidate(str(account.account_number))
+    
+    async def save_many(self, accounts: list[Account]) -> None:
+        try:
+            await self.repository.save_many(accounts)
+        finally:
+            for account in accounts:
+                self.invalidate(str(account.account_number))
+    
+    async def delete(self, account_number: AccountNumber) -> None:
+        try:
+            await self.repository.delete(account_number)
+        finally:
+            self.invalidate(str(account_number))
+    
+    async def apply_balance_delta(
+        self,
+        account_number: AccountNumber,
+        delta: Decimal,
+        operation_id: str | None = None,
+    ) -> Money | None:
+        try:
+            return await self.repository.apply_balance_delta(
+                account_number, delta, operation_id
+            )
+        finally:
+            self.invalidate(str(account_number))
+    
+    async def settle_transfer(
+        self,
+        transfer_id: str,
+        from_account_number: AccountNumber,
+        to_account_number: AccountNumber,
+        amount: Money,
+    ) -> None:
+        try:
+            await self.repository.settle_transfer(
+                transfer_id, from_account_number, to_account_number, amount
+            )
+        finally:
+            self.invalidate(str(from_account_number))
+            self.invalidate(str(to_account_number))
+    
+    # ==================== INVALIDAÇÃO ====================
+    
+    def invalidate(self, account_number: str) -> None:
+        """Remove a conta do cache (chamado também pelos eventos)."""
+        self.cache.invalidate(account_number)
@@ -0,0 +1,120 @@
+"""
+Decorator de ReportRepository com cache de resultados por TTL curto.
+
+Relatórios são agregações sobre a coleção inteira: caros de calcular
+e tolerantes a alguns segundos de atraso. O resultado de cada
+relatório (com seus parâmetros) fica guardado por `ttl_seconds`.
+
+Requisições simultâneas do mesmo relatório com o cache vazio esperam
+o MESMO cálculo, em vez de dispararem uma agregação cada.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable
+
+from ...application.interfaces import (
+    BalanceBucket,
+    OpeningRatePoint,
+    ReportPeriod,
+    ReportRepository,
+    StatusReportRow,
+)
+
+
+class CachingReportRepository(ReportRepository):
+    """
+    Repositório de relatórios com cache TTL.
+
+    IMPLEMENTA a interface ReportRepository envolvendo outra implementação.
+    """
+
+    def __init__(
+        self,
+        repository: ReportRepository,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            repository: Repositório que calcula os relatórios
+            ttl_seconds: Tempo de vida de cada resultado
+            clock: Relógio (injetável para testes)
+        """
+        self.repository = repository
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: dict[tuple, tuple[float, Any]] = {}
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    async def totals_by_status(self) -> list[StatusReportRow]:
+        return await self._cached(("totals_by_status",), self.repository.totals_by_status)
+
+    async def balance_distribution(self, boundaries: list[Decimal]) -> list[BalanceBucket]:
+        return await self._cached(
+            ("balance_distribution", tuple(boundaries)),
+            lambda: self.repository.balance_distribution(boundaries),
+        )
+
+    async def opening_rate(
+        self,
+        period: ReportPeriod,
+        created_from: datetime,
+        created_to: datetime,
+    ) -> list[OpeningRatePoint]:
+        return await self._cached(
+            ("opening_rate", period, created_from, created_to),
+            lambda: self.repository.opening_rate(period, created_from, created_to),
+        )
+
+    def snapshot(self) -> dict[str, int]:
+        """Contadores do cache (exibidos em GET /metrics)."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def _cached(self, key: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Resultado guardado ou calculado uma vez para todos que esperam."""
+        entry = self._entries.get(key)
+        if entry and entry[0] > self.clock():
+            self.hits += 1
+            return entry[1]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight:
+            self.hits += 1
+            return await asyncio.shield(in_flight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await compute()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Quem esperava recebe o erro; ninguém precisa "consumir" o future
+                future.exception()
+            else:
+                future.cancel()  # Cálculo cancelado: quem esperava também é
+            raise
+        else:
+            future.set_result(result)
+            self._evict_expired()
+            self._entries[key] = (self.clock() + self.ttl_seconds, result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def _evict_expired(self) -> None:
+        """Remove resultados vencidos (as chaves variam com os parâmetros)."""
+        now = self.clock()
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
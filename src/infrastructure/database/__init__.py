@@ -1,5 +1,36 @@
 """Implementações de repositórios."""
 
+from .archiver import ArchiveResult, MongoArchiver
+from .balance_slots import BalanceSlots
+from .mongo_client import MongoCommandMonitor, MongoPoolMonitor, create_mongo_client
 from .mongo_account_repository import MongoAccountRepository
+from .mongo_transaction_repository import MongoTransactionRepository
+from .mongo_report_repository import MongoReportRepository
+from .mongo_snapshot_repository import MongoSnapshotRepository
+from .mongo_stats_repository import MongoStatsRepository
+from .outbox import MongoOutboxPublisher, OutboxRelay
+from .read_routing import ReadRouter, ReadRoutingStats
+from .schema import SchemaManager
+from .stats_projector import StatsProjector
+from .unit_of_work import MongoUnitOfWork
 
-__all__ = ["MongoAccountRepository"]
+__all__ = [
+    "ArchiveResult",
+    "BalanceSlots",
+    "MongoAccountRepository",
+    "MongoArchiver",
+    "MongoCommandMonitor",
+    "MongoOutboxPublisher",
+    "MongoPoolMonitor",
+    "MongoReportRepository",
+    "MongoSnapshotRepository",
+    "MongoStatsRepository",
+    "MongoTransactionRepository",
+    "MongoUnitOfWork",
+    "OutboxRelay",
+    "ReadRouter",
+    "ReadRoutingStats",
+    "SchemaManager",
+    "StatsProjector",
+    "create_mongo_client",
+]
@@ -0,0 +1,104 @@
+"""
+Codificação dos documentos de conta no MongoDB (versionada).
+
+Formato atual (schema_version 2):
+    {
+        account_number: "ACC-...",
+        holder_name: "...",
+        cpf: "12345678909",        # só dígitos
+        balance: Decimal128("150.00"),
+        status: "active",
+        created_at, updated_at, version,
+        schema_version: 2
+    }
+
+Documentos do formato atual foram validados pelo domínio antes de
+serem gravados, então a leitura confia neles: os value objects são
+recriados com `from_trusted`, sem regex de CPF nem checagens de
+número de conta e de valor a cada leitura.
+
+Documentos antigos (sem schema_version) têm CPF formatado e às vezes
+saldo em string: são lidos pelo caminho validado e convertidos pelo
+script `python -m src.scripts.migrate_account_documents`.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from bson.decimal128 import Decimal128
+
+from ...domain.entities import Account, AccountStatus
+from ...domain.value_objects import AccountNumber, CPF, Money
+
+
+SCHEMA_VERSION = 2
+
+
+def encode_account(account: Account) -> dict[str, Any]:
+    """Converte entidade Account para documento MongoDB (sem a versão)."""
+    return {
+        "account_number": account.account_number.value,
+        "holder_name": account.holder_name,
+        "cpf": account.cpf.value,
+        "balance": Decimal128(account.balance.amount),
+        "status": account.status.value,
+        "created_at": account.created_at,
+        "updated_at": account.updated_at,
+        "schema_version": SCHEMA_VERSION,
+    }
+
+
+def decode_account(document: dict) -> Account:
+    """Converte documento MongoDB para entidade Account."""
+    if document.get("schema_version") == SCHEMA_VERSION:
+        account_number = AccountNumber.from_trusted(document["account_number"])
+        cpf = CPF.from_trusted(document["cpf"])
+        balance = Money.from_trusted(decode_decimal(document["balance"]))
+    else:
+        account_number = AccountNumber(value=document["account_number"])
+        cpf = CPF(document["cpf"])
+        balance = Money.create(decode_decimal(document["balance"]))
+
+    return Account(
+        account_number=account_number,
+        holder_name=document["holder_name"],
+        cpf=cpf,
+        balance=balance,
+        status=AccountStatus(document["status"]),
+        created_at=document["created_at"],
+        updated_at=document["updated_at"],
+        version=document.get("version", 0),
+    )
+
+
+def decode_decimal(value: Decimal128 | str) -> Decimal:
+    """Lê o valor salvo como Decimal128 (ou string, em documentos antigos)."""
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    return Decimal(value)
+
+
+def cpf_query(cpf: CPF) -> dict[str, Any]:
+    """
+    Filtro por CPF que casa os dois formatos enquanto houver documentos antigos.
+
+    Query MongoDB: {cpf: {$in: ["12345678909", "123.456.789-09"]}}
+    (continua uma busca pelo índice único de cpf)
+    """
+    return {"$in": [cpf.value, cpf.formatted()]}
+
+
+def migrate_account_document(document: dict) -> dict[str, Any] | None:
+    """
+    Campos a regravar para levar um documento ao formato atual.
+
+    Returns:
+        O $set da migração, ou None se o documento já está atualizado
+    """
+    if document.get("schema_version") == SCHEMA_VERSION:
+        return None
+    return {
+        "cpf": CPF(document["cpf"]).value,
+        "balance": Decimal128(decode_decimal(document["balance"])),
+        "schema_version": SCHEMA_VERSION,
+    }
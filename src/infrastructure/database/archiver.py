@@ -0,0 +1,214 @@
+"""
+Arquivamento em camadas: dados frios saem das coleções quentes.
+
+- Contas encerradas (CLOSED) há mais de N dias: accounts -> accounts_archive
+- Lançamentos mais antigos que a retenção: transactions -> transactions_archive
+
+As coleções quentes (e seus índices) ficam do tamanho do que é usado
+no dia a dia; os repositórios consultam o arquivo quando não acham
+algo na coleção quente (ver MongoAccountRepository e
+MongoTransactionRepository).
+
+Cada lote é copiado para o arquivo e SÓ DEPOIS removido da coleção
+quente: se o processo cair no meio, o lote aparece nas duas e a
+próxima execução copia de novo (idempotente) e remove. O progresso
+de cada passada fica em `archive_checkpoints`, então um job
+interrompido continua de onde parou.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ASCENDING, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from ...domain.entities import AccountStatus
+from .cursors import decode_cursor, encode_cursor
+
+
+ACCOUNTS_ARCHIVE_COLLECTION = "accounts_archive"
+TRANSACTIONS_ARCHIVE_COLLECTION = "transactions_archive"
+CHECKPOINTS_COLLECTION = "archive_checkpoints"
+
+
+@dataclass
+class ArchiveResult:
+    """Resumo de uma passada do arquivamento."""
+    accounts_archived: int
+    ledger_entries_archived: int
+
+
+class MongoArchiver:
+    """
+    Move contas encerradas e lançamentos antigos para as coleções de arquivo.
+
+    Uso:
+        archiver = MongoArchiver(client, "jbank", closed_account_days=30)
+        result = await archiver.run()
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        batch_size: int = 500,
+        closed_account_days: int = 30,
+        ledger_retention_days: int = 365,
+    ) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+            batch_size: Documentos movidos por lote
+            closed_account_days: Dias desde o encerramento para arquivar a conta
+            ledger_retention_days: Dias que um lançamento fica na coleção quente
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.accounts = self.database["accounts"]
+        self.accounts_archive = self.database[ACCOUNTS_ARCHIVE_COLLECTION]
+        self.transactions = self.database["transactions"]
+        self.transactions_archive = self.database[TRANSACTIONS_ARCHIVE_COLLECTION]
+        self.checkpoints = self.database[CHECKPOINTS_COLLECTION]
+        self.batch_size = batch_size
+        self.closed_account_days = closed_account_days
+        self.ledger_retention_days = ledger_retention_days
+
+    async def run(self) -> ArchiveResult:
+        """Uma passada completa: contas e depois lançamentos."""
+        now = datetime.now()
+        accounts = await self.archive_closed_accounts(
+            now - timedelta(days=self.closed_account_days)
+        )
+        entries = await self.archive_ledger(now - timedelta(days=self.ledger_retention_days))
+        return ArchiveResult(accounts_archived=accounts, ledger_entries_archived=entries)
+
+    async def archive_closed_accounts(self, closed_before: datetime) -> int:
+        """
+        Arquiva as contas encerradas antes de `closed_before`.
+
+        Percorre as contas CLOSED pelo índice (status, created_at,
+        account_number). Contas com saldo dividido ficam de fora:
+        desative o modo antes (manage_balance_slots disable).
+
+        Uma conta que mudou entre a cópia e a remoção (versão diferente)
+        continua na coleção quente e a cópia no arquivo é descartada.
+        """
+        query: dict[str, Any] = {
+            "status": AccountStatus.CLOSED.value,
+            "updated_at": {"$lt": closed_before},
+            "balance_slots": {"$exists": False},
+        }
+
+        async def move(documents: list[dict]) -> int:
+            await self.accounts_archive.bulk_write(
+                [
+                    ReplaceOne({"_id": document["_id"]}, document, upsert=True)
+                    for document in documents
+                ],
+                ordered=False,
+            )
+            result = await self.accounts.delete_many(
+                {
+                    "$or": [
+                        {"_id": document["_id"], "version": document.get("version")}
+                        for document in documents
+                    ]
+                }
+            )
+            if result.deleted_count < len(documents):
+                still_hot = await self.accounts.distinct(
+                    "_id", {"_id": {"$in": [document["_id"] for document in documents]}}
+                )
+                await self.accounts_archive.delete_many({"_id": {"$in": still_hot}})
+            return result.deleted_count
+
+        return await self._archive_in_batches(
+            "accounts", self.accounts, query, ("created_at", "account_number"), move
+        )
+
+    async def archive_ledger(self, created_before: datetime) -> int:
+        """
+        Arquiva os lançamentos criados antes de `created_before`.
+
+        Lançamentos são imutáveis: basta copiar (ids repetidos de uma
+        passada interrompida são ignorados) e remover.
+        """
+        query: dict[str, Any] = {"created_at": {"$lt": created_before}}
+
+        async def move(documents: list[dict]) -> int:
+            try:
+                await self.transactions_archive.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                    raise
+            result = await self.transactions.delete_many(
+                {"_id": {"$in": [document["_id"] for document in documents]}}
+            )
+            return result.deleted_count
+
+        return await self._archive_in_batches(
+            "transactions", self.transactions, query, ("created_at", "_id"), move
+        )
+
+    async def _archive_in_batches(
+        self,
+        name: str,
+        collection: AsyncIOMotorCollection,
+        query: dict[str, Any],
+        sort_fields: tuple[str, str],
+        move,
+    ) -> int:
+        """
+        Laço comum: keyset pela ordenação, um checkpoint por lote.
+
+        O checkpoint guarda a posição do último documento do lote; ao
+        terminar a passada ele é apagado, e a próxima passada recomeça do
+        início (novos documentos ficam elegíveis com o tempo).
+        """
+        time_field, tiebreaker = sort_fields
+        checkpoint = await self.checkpoints.find_one({"_id": name})
+        position = decode_cursor(checkpoint["position"]) if checkpoint else None
+        moved = checkpoint["moved"] if checkpoint else 0
+
+        while True:
+            batch_query = dict(query)
+            if position:
+                created_at, last_key = position
+                batch_query["$and"] = [
+                    {
+                        "$or": [
+                            {time_field: {"$gt": created_at}},
+                            {time_field: created_at, tiebreaker: {"$gt": last_key}},
+                        ]
+                    }
+                ]
+
+            documents = await (
+                collection.find(batch_query)
+                .sort([(time_field, ASCENDING), (tiebreaker, ASCENDING)])
+                .limit(self.batch_size)
+                .to_list(length=self.batch_size)
+            )
+            if not documents:
+                break
+
+            moved += await move(documents)
+            last = documents[-1]
+            position = (last[time_field], last[tiebreaker])
+            await self.checkpoints.update_one(
+                {"_id": name},
+                {
+                    "$set": {
+                        "position": encode_cursor(*position),
+                        "moved": moved,
+                        "updated_at": datetime.now(),
+                    }
+                },
+                upsert=True,
+            )
+
+        await self.checkpoints.delete_one({"_id": name})
+        return moved
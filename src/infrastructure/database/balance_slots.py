@@ -0,0 +1,356 @@
+"""
+Saldo dividido (sub-ledger) para contas com muitos créditos simultâneos.
+
+Uma conta comum guarda o saldo em um único documento, então todos os
+créditos concorrentes disputam o mesmo documento. No modo dividido a
+conta ganha N documentos de "slot" em `account_balance_slots`:
+
+    saldo total = saldo do documento da conta + soma dos slots
+
+- Créditos vão para um slot sorteado (N documentos = N escritores em paralelo)
+- Débitos continuam no documento da conta; se faltar saldo, os slots
+  são "varridos" (o saldo deles passa para o documento da conta) e o
+  débito é tentado de novo
+- Leituras somam os slots em uma única agregação
+
+O modo é opt-in por conta (campo `balance_slots` no documento da conta)
+e fica inteiro dentro do MongoAccountRepository. Os use cases só deixam
+de receber o saldo novo nos créditos e débitos dessas contas (somar os
+slots custaria mais uma ida ao banco em toda movimentação).
+"""
+
+import random
+import uuid
+import zlib
+from decimal import Decimal
+
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+
+from ...domain.entities import AccountStatus
+
+
+# Status de slots sendo desativados: não aceitam mais créditos
+RETIRED_STATUS = "retired"
+
+# Marcadores de idempotência guardados por slot (mesma janela da conta)
+_MARKERS_KEPT = 1000
+
+# Ids de varreduras guardados por slot: só há uma varredura pendente por
+# conta, então basta reconhecer as últimas
+_SWEEPS_KEPT = 10
+
+
+class BalanceSlots:
+    """
+    Operações sobre os slots de saldo das contas em modo dividido.
+
+    Cada slot é um documento:
+        {_id: "ACC-...:3", account_number: "ACC-...", slot: 3,
+         balance: Decimal128, status: "active"}
+
+    O status da conta é replicado nos slots para que o crédito seja uma
+    única escrita condicional (sem ler o documento da conta antes).
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        use_transactions: bool = False,
+    ) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+            use_transactions: Varre os slots dentro de uma transação
+                (exige replica set, ver sweep)
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.accounts: AsyncIOMotorCollection = self.database["accounts"]
+        self.collection: AsyncIOMotorCollection = self.database["account_balance_slots"]
+        self.use_transactions = use_transactions
+
+    async def credit(
+        self,
+        account_number: str,
+        slots: int,
+        delta: Decimal,
+        operation_id: str | None = None,
+        session=None,
+    ) -> bool:
+        """
+        Credita em um slot sorteado.
+
+        Query MongoDB:
+            db.account_balance_slots.updateOne(
+                {_id: "ACC-...:k", status: "active"},
+                {$inc: {balance: delta}}
+            )
+
+        Com `operation_id` o slot deixa de ser sorteado: sai de um hash do
+        id, então uma repetição cai no mesmo slot, e o id fica gravado em
+        `applied_transfers` do slot na mesma escrita. Uma repetição depois
+        de mudar o número de slots (enable/disable) não é reconhecida.
+
+        Returns:
+            True se o crédito está no slot (agora ou numa chamada anterior
+            com o mesmo operation_id). False se o slot não aceitou o
+            crédito (conta inativa, modo desativado ou número de slots
+            alterado): quem chamou deve voltar ao caminho normal, que
+            diagnostica o motivo
+        """
+        if operation_id is None:
+            slot = random.randrange(slots)
+            result = await self.collection.update_one(
+                {"_id": f"{account_number}:{slot}", "status": AccountStatus.ACTIVE.value},
+                {"$inc": {"balance": Decimal128(delta)}},
+                session=session,
+            )
+            return result.modified_count == 1
+
+        slot_id = f"{account_number}:{zlib.crc32(operation_id.encode()) % slots}"
+        result = await self.collection.update_one(
+            {
+                "_id": slot_id,
+                "status": AccountStatus.ACTIVE.value,
+                "applied_transfers": {"$ne": operation_id},
+            },
+            {
+                "$inc": {"balance": Decimal128(delta)},
+                "$push": {
+                    "applied_transfers": {"$each": [operation_id], "$slice": -_MARKERS_KEPT}
+                },
+            },
+            session=session,
+        )
+        if result.modified_count == 1:
+            return True
+        # Só no caminho de erro: a operação já estava neste slot?
+        return bool(
+            await self.collection.count_documents(
+                {"_id": slot_id, "applied_transfers": operation_id}, limit=1, session=session
+            )
+        )
+
+    async def slot_totals(
+        self,
+        account_numbers: list[str],
+        collection: AsyncIOMotorCollection | None = None,
+    ) -> dict[str, Decimal]:
+        """
+        Soma dos slots de várias contas em uma única agregação.
+
+        Args:
+            account_numbers: Contas em modo dividido
+            collection: Coleção de slots com a preferência de leitura
+                desejada (padrão: primário)
+        """
+        if not account_numbers:
+            return {}
+
+        pipeline = [
+            {"$match": {"account_number": {"$in": account_numbers}}},
+            {"$group": {"_id": "$account_number", "total": {"$sum": "$balance"}}},
+        ]
+        cursor = (collection or self.collection).aggregate(pipeline)
+        return {document["_id"]: document["total"].to_decimal() async for document in cursor}
+
+    async def sweep(self, account_number: str, session=None) -> Decimal:
+        """
+        Move o saldo de todos os slots para o documento da conta.
+
+        Sem transação, a varredura é um diário gravado na própria conta
+        (ver _sweep): uma queda do processo no meio deixa o registro em
+        `pending_sweep`, e a próxima varredura da conta termina a anterior.
+        Nenhuma escrita perde dinheiro nem o aplica duas vezes.
+
+        Com `session` (transação já aberta por quem chamou) as escritas
+        entram nela; com use_transactions=True (liquidação "transaction",
+        replica set) a varredura abre a sua própria.
+
+        Returns:
+            Valor movido (0 se a conta não tem slots com saldo)
+        """
+        if session is not None:
+            return await self._sweep(account_number, session)
+        if self.use_transactions:
+            async with await self.client.start_session() as session:
+                return await session.with_transaction(
+                    lambda session: self._sweep(account_number, session)
+                )
+        return await self._sweep(account_number)
+
+    async def _sweep(self, account_number: str, session=None) -> Decimal:
+        """
+        Varredura em três escritas, cada uma segura para repetir:
+
+        1. Grava na conta `pending_sweep`: id da varredura e o valor a
+           tirar de cada slot (só se não houver outra em andamento)
+        2. Desconta de cada slot o valor registrado, marcando o slot com o
+           id da varredura (repetir não desconta de novo). $inc e não
+           zerar: créditos que chegarem no meio ficam no slot
+        3. Soma o total na conta e apaga o registro, na mesma escrita
+
+        Entre 2 e 3 o valor está só no registro da conta (as leituras
+        mostram um saldo menor, nunca maior), e débitos continuam
+        limitados ao saldo do documento da conta.
+        """
+        # Varredura anterior interrompida (ou em andamento): termina primeiro
+        swept = await self._finish_pending(account_number, session)
+
+        cursor = self.collection.find(
+            {"account_number": account_number, "balance": {"$gt": Decimal128("0")}},
+            projection={"_id": 1, "balance": 1},
+            session=session,
+        )
+        slots = [
+            {"slot_id": document["_id"], "amount": document["balance"]}
+            async for document in cursor
+        ]
+        if not slots:
+            return swept
+
+        # 1. Registro na conta
+        pending = {"id": str(uuid.uuid4()), "slots": slots}
+        result = await self.accounts.update_one(
+            {"account_number": account_number, "pending_sweep": {"$exists": False}},
+            {"$set": {"pending_sweep": pending}},
+            session=session,
+        )
+        if result.modified_count == 0:
+            # Outra varredura começou no meio: ajuda a terminar a dela
+            return swept + await self._finish_pending(account_number, session)
+
+        # 2. e 3.
+        return swept + await self._apply_pending(account_number, pending, session)
+
+    async def _finish_pending(self, account_number: str, session=None) -> Decimal:
+        """Termina a varredura registrada na conta, se houver."""
+        account = await self.accounts.find_one(
+            {"account_number": account_number, "pending_sweep": {"$exists": True}},
+            projection={"_id": 0, "pending_sweep": 1},
+            session=session,
+        )
+        if not account:
+            return Decimal("0")
+        return await self._apply_pending(account_number, account["pending_sweep"], session)
+
+    async def _apply_pending(self, account_number: str, pending: dict, session=None) -> Decimal:
+        """
+        Passos 2 e 3 de uma varredura registrada.
+
+        Returns:
+            Valor da varredura (já na conta, por esta chamada ou por outra
+            que terminou a mesma varredura)
+        """
+        total = Decimal("0")
+        for slot in pending["slots"]:
+            amount = slot["amount"].to_decimal()
+            await self.collection.update_one(
+                {"_id": slot["slot_id"], "applied_sweeps": {"$ne": pending["id"]}},
+                {
+                    "$inc": {"balance": Decimal128(-amount)},
+                    "$push": {
+                        "applied_sweeps": {"$each": [pending["id"]], "$slice": -_SWEEPS_KEPT}
+                    },
+                },
+                session=session,
+            )
+            total += amount
+
+        await self.accounts.update_one(
+            {"account_number": account_number, "pending_sweep.id": pending["id"]},
+            {
+                "$inc": {"balance": Decimal128(total), "version": 1},
+                "$unset": {"pending_sweep": ""},
+            },
+            session=session,
+        )
+        return total
+
+    async def mirror_status(
+        self, account_numbers: list[str], status: str, session=None
+    ) -> None:
+        """
+        Replica o status da conta nos seus slots.
+
+        Slots em desativação (RETIRED_STATUS) não voltam a aceitar créditos.
+        Chamado pelo save() e pelo save_many() só quando o status de uma
+        conta dividida muda.
+        """
+        await self.collection.update_many(
+            {
+                "account_number": {"$in": account_numbers},
+                "status": {"$nin": [status, RETIRED_STATUS]},
+            },
+            {"$set": {"status": status}},
+            session=session,
+        )
+
+    async def enable(self, account_number: str, slots: int) -> None:
+        """
+        Ativa (ou redimensiona) o modo dividido de uma conta.
+
+        Cria os slots que faltam com saldo zero e marca a conta com
+        `balance_slots`. Nenhum dinheiro é movido: o saldo atual continua
+        no documento da conta. Ao reduzir o número de slots, os excedentes
+        são desativados e varridos.
+
+        Raises:
+            ValueError: Se slots < 1 ou a conta não existir
+        """
+        if slots < 1:
+            raise ValueError("O número de slots deve ser pelo menos 1")
+
+        account = await self.accounts.find_one(
+            {"account_number": account_number}, projection={"_id": 0, "status": 1}
+        )
+        if not account:
+            raise ValueError(f"Conta {account_number} não encontrada")
+
+        for slot in range(slots):
+            await self.collection.update_one(
+                {"_id": f"{account_number}:{slot}"},
+                {
+                    "$set": {"status": account["status"]},
+                    "$setOnInsert": {
+                        "account_number": account_number,
+                        "slot": slot,
+                        "balance": Decimal128("0"),
+                    },
+                },
+                upsert=True,
+            )
+
+        await self._retire({"account_number": account_number, "slot": {"$gte": slots}})
+        await self.accounts.update_one(
+            {"account_number": account_number},
+            {"$set": {"balance_slots": slots}, "$inc": {"version": 1}},
+        )
+
+    async def disable(self, account_number: str) -> None:
+        """
+        Desativa o modo dividido: varre todos os slots para a conta e os remove.
+
+        Os slots são desativados antes da varredura, então créditos que
+        chegarem no meio vão para o documento da conta (caminho normal).
+        """
+        await self._retire({"account_number": account_number})
+        await self.accounts.update_one(
+            {"account_number": account_number},
+            {"$unset": {"balance_slots": ""}, "$inc": {"version": 1}},
+        )
+
+    async def _retire(self, query: dict) -> None:
+        """Bloqueia créditos nos slots, varre o saldo e remove os slots vazios."""
+        result = await self.collection.update_many(query, {"$set": {"status": RETIRED_STATUS}})
+        if result.matched_count == 0:
+            return
+
+        account_number = query["account_number"]
+        await self.sweep(account_number)
+        await self.collection.delete_many(
+            {**query, "status": RETIRED_STATUS, "balance": Decimal128("0")}
+        )
@@ -0,0 +1,29 @@
+"""
+Cursores opacos da paginação por keyset.
+
+O cursor guarda a chave de ordenação do último item da página
+(created_at + um desempate único) em base64, para o cliente só
+devolvê-lo sem depender do formato.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, tiebreaker: str) -> str:
+    """Cursor para continuar depois do item (created_at, tiebreaker)."""
+    raw = json.dumps([created_at.isoformat(), tiebreaker])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Raises:
+        ValueError: Se o cursor não veio de encode_cursor
+    """
+    try:
+        created_at, tiebreaker = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), tiebreaker
+    except (ValueError, TypeError) as e:
+        raise ValueError("Cursor inválido") from e
@@ -2,14 +2,68 @@
 Implementação do AccountRepository usando MongoDB.
 
 Motor é o driver assíncrono oficial do MongoDB para Python.
+
+Contas com `balance_slots` no documento estão em modo de saldo dividido
+(ver balance_slots.py): o saldo devolvido nas leituras já inclui os slots.
+
+Contas encerradas há tempo ficam em `accounts_archive` (ver archiver.py):
+as buscas por número e por CPF consultam o arquivo quando não acham a
+conta na coleção quente.
 """
 
-from typing import Optional
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+from bson.decimal128 import Decimal128
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ASCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from ...domain.entities import Account, AccountStatus
+from ...domain.exceptions import (
+    AccountNotActiveError,
+    AccountNotFoundError,
+    ConcurrentUpdateError,
+    DuplicateAccountError,
+    InsufficientFundsError,
+)
 from ...domain.value_objects import AccountNumber, CPF, Money
-from ...application.interfaces import AccountRepository
+from ...application.interfaces import (
+    AccountPage,
+    AccountRepository,
+    AccountSummary,
+    ReadConsistency,
+)
+from .account_codec import cpf_query, decode_account, decode_decimal, encode_account
+from .archiver import ACCOUNTS_ARCHIVE_COLLECTION
+from .balance_slots import BalanceSlots
+from .cursors import decode_cursor, encode_cursor
+from .read_routing import ReadRouter
+from .unit_of_work import current_session
+
+
+# Marcadores de idempotência e varredura pendente dos slots não fazem
+# parte da entidade
+_ACCOUNT_PROJECTION = {"applied_transfers": 0, "pending_sweep": 0}
+
+# Listagem: só os campos exibidos saem do banco
+_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "account_number": 1,
+    "holder_name": 1,
+    "status": 1,
+    "balance": 1,
+    "balance_slots": 1,
+    "created_at": 1,
+}
+
+# Quantos transfer_ids recentes cada conta guarda para detectar reentregas.
+# Precisa ser bem maior que o número de mensagens sem ack de todos os
+# workers (prefetch = ledger_batch_size): uma reentrega tem que achar o
+# seu marcador mesmo que a conta tenha recebido outras transferências
+# no meio. Reentregas mais antigas o worker reconhece pelo livro-razão.
+_APPLIED_TRANSFERS_KEPT = 1000
 
 
 class MongoAccountRepository(AccountRepository):
@@ -19,88 +73,245 @@ class MongoAccountRepository(AccountRepository):
     IMPLEMENTA a interface AccountRepository.
     """
     
-    def __init__(self, mongodb_url: str, database_name: str) -> None:
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        transfer_settlement: str = "bulk",
+        read_router: ReadRouter | None = None,
+    ) -> None:
         """
-        Inicializa conexão com MongoDB.
+        Inicializa o repositório sobre um cliente já existente.
+        
+        O cliente (e seu pool de conexões) é compartilhado pelo processo
+        e fechado por quem o criou, não pelo repositório.
         
         Args:
-            mongodb_url: URL de conexão do MongoDB
+            client: Cliente Motor compartilhado
             database_name: Nome do banco de dados
+            transfer_settlement: "bulk" ou "transaction" (ver settle_transfer)
+            read_router: Destino das leituras por consistência (compartilhado)
         """
-        self.client = AsyncIOMotorClient(mongodb_url)
+        self.client = client
+        self.transfer_settlement = transfer_settlement
         self.database = self.client[database_name]
         self.collection: AsyncIOMotorCollection = self.database["accounts"]
+        self.archive: AsyncIOMotorCollection = self.database[ACCOUNTS_ARCHIVE_COLLECTION]
+        self.read_router = read_router or ReadRouter()
+        self.balance_slots = BalanceSlots(
+            client, database_name, use_transactions=transfer_settlement == "transaction"
+        )
+        # Contas em modo dividido já vistas por este processo: número -> slots
+        self._split_accounts: dict[str, int] = {}
     
     async def save(self, account: Account) -> None:
         """
-        Salva ou atualiza uma conta no MongoDB.
+        Salva ou atualiza uma conta no MongoDB com controle de versão.
+        
+        Compare-and-swap: o update só casa se a versão no banco ainda for
+        a versão lida (account.version). Se outra operação salvou antes,
+        nada é escrito e ConcurrentUpdateError é lançado.
         
-        Usa upsert (update + insert):
-        - Se existir: atualiza
-        - Se não existir: insere
+        - version == 0: conta nova (ou documento antigo sem versão) -> upsert
+        - version > 0: conta lida do banco -> update condicional
+        
+        A unicidade de número e CPF é garantida pelos índices únicos
+        (ver schema.py), sem consulta prévia.
+        
+        Em contas com saldo dividido o saldo não é regravado (ver
+        _save_pipeline): lá ele só muda por apply_balance_delta e
+        settle_transfer. Se o status mudou, ele é replicado nos slots.
+        
+        Raises:
+            DuplicateAccountError: Se o CPF já pertencer a outra conta
+            ConcurrentUpdateError: Se a conta mudou desde que foi lida
         """
         # Converte Account (entidade) para dict (MongoDB)
-        account_dict = {
-            "account_number": str(account.account_number),
-            "holder_name": account.holder_name,
-            "cpf": str(account.cpf),
-            "balance": str(account.balance.amount),
-            "status": account.status.value,
-            "created_at": account.created_at,
-            "updated_at": account.updated_at,
-        }
+        account_dict = encode_account(account)
+        account_dict["version"] = account.version + 1
         
-        # Upsert: atualiza se existe, insere se não existe
-        await self.collection.update_one(
-            {"account_number": account_dict["account_number"]},  # Filtro
-            {"$set": account_dict},  # Dados
-            upsert=True  # Cria se não existir
-        )
+        if account.version > 0:
+            error = await self._update_existing(account, account_dict)
+            if error:
+                raise error
+            account.version += 1
+            return
+        
+        try:
+            result = await self.collection.update_one(
+                self._version_filter(account),  # Filtro (número + versão lida)
+                self._save_pipeline(account_dict),  # Dados
+                upsert=True,  # Cria se for conta nova
+                session=current_session(),
+            )
+        except DuplicateKeyError as e:
+            raise self._duplicate_error(e.details, account_dict) from e
+        
+        if result.matched_count == 0 and result.upserted_id is None:
+            raise ConcurrentUpdateError([account_dict["account_number"]])
+        account.version += 1
     
     async def find_by_account_number(
         self, 
-        account_number: AccountNumber
+        account_number: AccountNumber,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
     ) -> Optional[Account]:
         """
         Busca uma conta pelo número.
         
         Query MongoDB: db.accounts.findOne({account_number: "ACC-..."})
+        (se não achar, a mesma busca em db.accounts_archive)
         """
-        document = await self.collection.find_one(
-            {"account_number": str(account_number)}
-        )
+        query = {"account_number": str(account_number)}
+        collection = self._reader("find_by_account_number", consistency)
+        document = await collection.find_one(query, projection=_ACCOUNT_PROJECTION)
+        if not document:
+            document = await self._find_archived("find_by_account_number", query, consistency)
         
         if not document:
             return None
         
+        await self._add_slot_balances([document], consistency)
         # Converte dict (MongoDB) para Account (entidade)
-        return self._document_to_account(document)
+        return decode_account(document)
     
-    async def find_by_cpf(self, cpf: CPF) -> Optional[Account]:
+    async def find_many_by_account_numbers(
+        self,
+        account_numbers: list[AccountNumber],
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> list[Account]:
         """
-        Busca uma conta pelo CPF.
+        Busca várias contas em uma única ida ao banco.
         
-        Query MongoDB: db.accounts.findOne({cpf: "12345678900"})
+        Query MongoDB: db.accounts.find({account_number: {$in: [...]}})
+        (as que faltarem são buscadas em db.accounts_archive)
         """
-        document = await self.collection.find_one(
-            {"cpf": str(cpf)}
+        numbers = [str(number) for number in account_numbers]
+        collection = self._reader("find_many_by_account_numbers", consistency)
+        cursor = collection.find(
+            {"account_number": {"$in": numbers}},
+            projection=_ACCOUNT_PROJECTION,
         )
+        documents = await cursor.to_list(length=None)
+        await self._add_slot_balances(documents, consistency)
+        
+        found = {document["account_number"] for document in documents}
+        missing = [number for number in numbers if number not in found]
+        if missing:
+            archive = self.read_router.collection(
+                self.archive, "find_many_by_account_numbers_archived", consistency
+            )
+            documents += await archive.find(
+                {"account_number": {"$in": missing}}, projection=_ACCOUNT_PROJECTION
+            ).to_list(length=None)
+        return [decode_account(document) for document in documents]
+    
+    async def save_many(self, accounts: list[Account]) -> None:
+        """
+        Salva várias contas com o mesmo compare-and-swap do save().
+        
+        - contas novas (version == 0): um único bulk_write não ordenado com
+          upsert; o erro de cada operação vem com o seu índice, então um
+          CPF ou número repetido é atribuído à conta certa
+        - contas existentes: um update condicional por conta, em paralelo
+          e SEM upsert (uma conta apagada ou arquivada no meio não pode
+          ressurgir). O bulk_write só devolveria contagens agregadas, sem
+          dizer QUAIS contas conflitaram; cada update diz exatamente
+        
+        Raises:
+            DuplicateAccountError: Se o CPF de uma conta nova já existir
+            ConcurrentUpdateError: Com as contas que mudaram desde a leitura
+        """
+        if not accounts:
+            return
+        
+        documents = []
+        for account in accounts:
+            account_dict = encode_account(account)
+            account_dict["version"] = account.version + 1
+            documents.append(account_dict)
+        
+        new = [index for index, account in enumerate(accounts) if account.version == 0]
+        existing = [index for index, account in enumerate(accounts) if account.version > 0]
+        
+        failed: dict[int, DuplicateAccountError | ConcurrentUpdateError] = {}
+        if new:
+            operations = [
+                UpdateOne(
+                    self._version_filter(accounts[index]),
+                    self._save_pipeline(documents[index]),
+                    upsert=True,
+                )
+                for index in new
+            ]
+            try:
+                await self.collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details["writeErrors"]:
+                    if write_error["code"] != 11000:
+                        raise
+                    index = new[write_error["index"]]
+                    failed[index] = self._duplicate_error(write_error, documents[index])
+        
+        errors = await asyncio.gather(
+            *(self._update_existing(accounts[index], documents[index]) for index in existing)
+        )
+        for index, error in zip(existing, errors):
+            if error:
+                failed[index] = error
+        
+        # Contas salvas avançam de versão, mesmo que outras tenham falhado
+        for index, account in enumerate(accounts):
+            if index not in failed:
+                account.version += 1
+        
+        for error in failed.values():
+            if isinstance(error, DuplicateAccountError):
+                raise error
+        if failed:
+            raise ConcurrentUpdateError(
+                [documents[index]["account_number"] for index in sorted(failed)]
+            )
+    
+    async def find_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
+        """
+        Busca uma conta pelo CPF.
+        
+        Query MongoDB: db.accounts.findOne({cpf: {$in: ["12345678909", "123.456.789-09"]}})
+        (se não achar, a mesma busca em db.accounts_archive)
+        """
+        query = {"cpf": cpf_query(cpf)}
+        collection = self._reader("find_by_cpf", consistency)
+        document = await collection.find_one(query, projection=_ACCOUNT_PROJECTION)
+        if not document:
+            document = await self._find_archived("find_by_cpf", query, consistency)
         
         if not document:
             return None
         
-        return self._document_to_account(document)
+        await self._add_slot_balances([document], consistency)
+        return decode_account(document)
     
-    async def exists_by_cpf(self, cpf: CPF) -> bool:
+    async def exists_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> bool:
         """
         Verifica se existe conta com este CPF.
         
-        Query MongoDB: db.accounts.countDocuments({cpf: "..."}) > 0
+        Query MongoDB: db.accounts.countDocuments({cpf: {$in: [...]}}) > 0
+        (contas arquivadas também contam: o CPF continua em uso)
         """
-        count = await self.collection.count_documents(
-            {"cpf": str(cpf)}
-        )
-        return count > 0
+        query = {"cpf": cpf_query(cpf)}
+        collection = self._reader("exists_by_cpf", consistency)
+        if await collection.count_documents(query, limit=1):
+            return True
+        return await self._find_archived("exists_by_cpf", query, consistency) is not None
     
     async def delete(self, account_number: AccountNumber) -> None:
         """
@@ -112,22 +323,587 @@ class MongoAccountRepository(AccountRepository):
             {"account_number": str(account_number)}
         )
     
-    def _document_to_account(self, document: dict) -> Account:
+    async def list_account_numbers(
+        self,
+        after: AccountNumber | None = None,
+        limit: int = 100,
+    ) -> list[AccountNumber]:
+        """
+        Lista números de conta em lotes (keyset pelo índice único).
+        
+        Query MongoDB:
+            db.accounts.find({account_number: {$gt: after}}, {account_number: 1})
+                .sort({account_number: 1}).limit(limit)
+        
+        Coberta pelo índice: não lê os documentos das contas.
+        """
+        query = {"account_number": {"$gt": str(after)}} if after else {}
+        documents = await (
+            self.collection.find(query, projection={"_id": 0, "account_number": 1})
+            .sort("account_number", ASCENDING)
+            .limit(limit)
+            .to_list(length=limit)
+        )
+        return [AccountNumber.from_trusted(document["account_number"]) for document in documents]
+    
+    async def list_accounts(
+        self,
+        status: AccountStatus | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AccountPage:
+        """
+        Lista contas por keyset sobre o índice (status, created_at, account_number).
+        
+        Query MongoDB (com cursor):
+            db.accounts.find({
+                status: "analysis",
+                created_at: {$gte: from, $lte: to},
+                $or: [
+                    {created_at: {$gt: t}},
+                    {created_at: t, account_number: {$gt: n}}
+                ]
+            }, {account_number: 1, holder_name: 1, status: 1, balance: 1, created_at: 1})
+            .sort({created_at: 1, account_number: 1}).limit(limit + 1)
+        
+        Sem filtro de status, a consulta usa status $in [todos]: o
+        MongoDB lê a faixa de cada status já ordenada no índice e
+        intercala (SORT_MERGE), sem ordenar em memória.
+        """
+        query: dict[str, Any] = {
+            "status": status.value if status else {"$in": [s.value for s in AccountStatus]}
+        }
+        created_range = {}
+        if created_from:
+            created_range["$gte"] = created_from
+        if created_to:
+            created_range["$lte"] = created_to
+        if created_range:
+            query["created_at"] = created_range
+        if cursor:
+            created_at, account_number = decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$gt": created_at}},
+                {"created_at": created_at, "account_number": {"$gt": account_number}},
+            ]
+        
+        collection = self._reader("list_accounts", consistency)
+        # Um a mais para saber se existe próxima página
+        documents = await (
+            collection.find(query, projection=_SUMMARY_PROJECTION)
+            .sort([("created_at", ASCENDING), ("account_number", ASCENDING)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = encode_cursor(last["created_at"], last["account_number"])
+        
+        await self._add_slot_balances(documents, consistency)
+        return AccountPage(
+            items=[
+                AccountSummary(
+                    account_number=document["account_number"],
+                    holder_name=document["holder_name"],
+                    status=document["status"],
+                    balance=decode_decimal(document["balance"]),
+                    created_at=document["created_at"],
+                )
+                for document in documents
+            ],
+            next_cursor=next_cursor,
+        )
+    
+    async def apply_balance_delta(
+        self,
+        account_number: AccountNumber,
+        delta: Decimal,
+        operation_id: str | None = None,
+    ) -> Money | None:
+        """
+        Aplica um crédito (delta > 0) ou débito (delta < 0) no próprio servidor.
+        
+        Uma única ida ao MongoDB: o filtro só casa se a conta estiver ativa
+        e (para débitos) tiver saldo suficiente, e o $inc é atômico, então
+        operações concorrentes na mesma conta não perdem dinheiro.
+        
+        Query MongoDB (crédito usa balance: {$type: "decimal"}):
+            db.accounts.findOneAndUpdate(
+                {account_number: "...", status: "active", balance: {$gte: -delta}},
+                {$inc: {balance: delta}},
+                {returnDocument: "after"}
+            )
+        
+        O filtro de saldo também deixa de fora documentos antigos com o
+        saldo em string (um $inc neles falharia com TypeMismatch): o
+        diagnóstico converte o saldo e a escrita é repetida.
+        
+        Contas com saldo dividido: créditos vão para um slot sorteado
+        (BalanceSlots.credit) e débitos sem saldo suficiente no documento
+        da conta varrem os slots antes de desistir.
+        
+        Com `operation_id` a operação é idempotente: o id entra em
+        `applied_transfers` na mesma escrita do $inc (como as pernas de
+        uma transferência), e repetir a chamada com o mesmo id não move
+        o dinheiro de novo. Nos créditos em slots o marcador fica no slot.
+        
+        Dentro de uma MongoUnitOfWork todas as operações usam a sessão
+        da transação.
+        
+        Returns:
+            Novo saldo da conta, ou None se ela tem saldo dividido (o
+            total exigiria somar os slots: mais uma ida ao banco em toda
+            movimentação) ou se a operação já tinha sido aplicada
+        
+        Raises:
+            ConcurrentUpdateError: Se a conta mudou a cada tentativa
+        """
+        number = str(account_number)
+        session = current_session()
+        
+        slots = self._split_accounts.get(number)
+        if delta > 0 and slots:
+            if await self.balance_slots.credit(number, slots, delta, operation_id, session):
+                return None
+            # Slot recusou: o modo mudou ou a conta não está ativa.
+            # Segue pelo documento da conta, que diagnostica o motivo.
+            self._split_accounts.pop(number, None)
+        
+        query: dict[str, Any] = {
+            "account_number": number,
+            "status": AccountStatus.ACTIVE.value,
+        }
+        if delta < 0:
+            query["balance"] = {"$gte": Decimal128(-delta)}
+        else:
+            query["balance"] = {"$type": "decimal"}
+        update: dict[str, Any] = {
+            "$inc": {"balance": Decimal128(delta), "version": 1},
+            "$set": {"updated_at": datetime.now()},
+        }
+        projection: dict[str, Any] = {"_id": 0, "balance": 1, "status": 1, "balance_slots": 1}
+        if operation_id:
+            query["applied_transfers"] = {"$ne": operation_id}
+            update["$push"] = {
+                "applied_transfers": {
+                    "$each": [operation_id],
+                    "$slice": -_APPLIED_TRANSFERS_KEPT,
+                }
+            }
+            projection["applied_transfers"] = {"$elemMatch": {"$eq": operation_id}}
+        
+        # Poucas tentativas: só repetimos se o diagnóstico abaixo mostrar
+        # que a conta mudou entre a escrita e a leitura
+        swept = False
+        for _ in range(3):
+            document = await self.collection.find_one_and_update(
+                query,
+                update,
+                projection={"_id": 0, "balance": 1, "balance_slots": 1},
+                return_document=ReturnDocument.AFTER,
+                session=session,
+            )
+            if document:
+                if "balance_slots" in document:
+                    # Descobriu uma conta dividida: próximos créditos vão aos slots
+                    self._split_accounts[number] = document["balance_slots"]
+                    return None
+                return Money.create(decode_decimal(document["balance"]))
+            
+            # Filtro não casou: descobre o motivo (só no caminho de erro)
+            current = await self.collection.find_one(
+                {"account_number": number},
+                projection=projection,
+                session=session,
+            )
+            if not current:
+                if await self.archive.count_documents(
+                    {"account_number": number}, limit=1, session=session
+                ):
+                    raise AccountNotActiveError(number)  # Encerrada e arquivada
+                raise AccountNotFoundError(number)
+            if current.get("applied_transfers"):
+                return None  # Repetição: a operação já foi aplicada
+            if current["status"] != AccountStatus.ACTIVE.value:
+                raise AccountNotActiveError(number)
+            if isinstance(current["balance"], str):
+                # Documento antigo com saldo em string: converte e tenta de novo
+                await self._convert_legacy_balance(number, current["balance"], session)
+                continue
+            if delta < 0 and decode_decimal(current["balance"]) < -delta:
+                if "balance_slots" in current and not swept:
+                    # Saldo pode estar nos slots: traz para a conta e tenta de novo
+                    swept = True
+                    if await self.balance_slots.sweep(number, session):
+                        continue
+                raise InsufficientFundsError(number)
+        
+        # A conta mudou entre cada escrita e o diagnóstico: quem chamou
+        # pode repetir (RetryPolicy)
+        raise ConcurrentUpdateError([number])
+    
+    async def settle_transfer(
+        self,
+        transfer_id: str,
+        from_account_number: AccountNumber,
+        to_account_number: AccountNumber,
+        amount: Money,
+    ) -> None:
+        """
+        Liquida uma transferência: débito na origem e crédito no destino juntos.
+        
+        Dois modos (Settings.mongodb_transfer_settlement):
+        - "bulk": débito condicional primeiro e só depois o crédito (duas
+          idas ao banco no caminho feliz). O dinheiro nunca é criado: se
+          o crédito for recusado (destino inexistente ou inativo), o
+          débito é devolvido à origem (compensação)
+        - "transaction": as mesmas pernas numa transação multi-documento
+          (exige replica set), tudo ou nada
+        
+        Cada perna grava o transfer_id em `applied_transfers`, então
+        reprocessar a mesma mensagem não move o dinheiro duas vezes: uma
+        perna já aplicada é pulada. Se a liquidação parar no meio por erro
+        de infraestrutura, a reentrega retoma do crédito.
+        
+        As duas pernas escrevem no documento da conta, também para contas
+        com saldo dividido (o marcador de idempotência mora lá). Se faltar
+        saldo na origem, os slots dela são varridos e a liquidação é
+        tentada mais uma vez.
+        
+        Raises:
+            AccountNotFoundError: Se alguma das contas não existir
+            AccountNotActiveError: Se alguma das contas não estiver ativa
+            InsufficientFundsError: Se a origem não tiver saldo
+            ConcurrentUpdateError: Se uma conta mudou a cada tentativa
+        """
+        from_number = str(from_account_number)
+        to_number = str(to_account_number)
+        settle = (
+            self._settle_in_transaction
+            if self.transfer_settlement == "transaction"
+            else self._settle_in_sequence
+        )
+        
+        try:
+            await settle(transfer_id, from_number, to_number, amount.amount)
+        except InsufficientFundsError:
+            if not await self.balance_slots.sweep(from_number):
+                raise
+            await settle(transfer_id, from_number, to_number, amount.amount)
+    
+    def _settlement_leg(
+        self,
+        transfer_id: str,
+        number: str,
+        delta: Decimal,
+    ) -> tuple[dict, dict]:
+        """
+        Monta (filtro, update) de uma perna.
+        
+        O filtro só casa se a conta estiver ativa, a transferência ainda não
+        tiver sido aplicada nela e houver saldo (débito) ou o saldo já for
+        Decimal128 (crédito: um $inc num saldo antigo em string falharia).
+        """
+        query: dict[str, Any] = {
+            "account_number": number,
+            "status": AccountStatus.ACTIVE.value,
+            "applied_transfers": {"$ne": transfer_id},
+        }
+        if delta < 0:
+            query["balance"] = {"$gte": Decimal128(-delta)}
+        else:
+            query["balance"] = {"$type": "decimal"}
+        update = {
+            "$inc": {"balance": Decimal128(delta), "version": 1},
+            "$set": {"updated_at": datetime.now()},
+            "$push": {
+                "applied_transfers": {
+                    "$each": [transfer_id],
+                    "$slice": -_APPLIED_TRANSFERS_KEPT,
+                }
+            },
+        }
+        return query, update
+    
+    async def _settle_in_sequence(
+        self,
+        transfer_id: str,
+        from_number: str,
+        to_number: str,
+        amount: Decimal,
+    ) -> None:
+        """
+        Débito primeiro, crédito depois, sem transação.
+        
+        Só a recusa do crédito por motivo de domínio desfaz o débito; um
+        erro de infraestrutura sobe com o débito aplicado e o marcador
+        gravado, e a reentrega completa o crédito.
+        """
+        await self._apply_leg(transfer_id, from_number, -amount)
+        try:
+            await self._apply_leg(transfer_id, to_number, amount)
+        except (AccountNotFoundError, AccountNotActiveError):
+            await self._compensate(transfer_id, from_number, amount)
+            raise
+    
+    async def _settle_in_transaction(
+        self,
+        transfer_id: str,
+        from_number: str,
+        to_number: str,
+        amount: Decimal,
+    ) -> None:
+        """
+        As duas pernas dentro de uma transação: tudo ou nada, sem compensação.
+        
+        with_transaction repete sozinho em erros transitórios (ex.: conflito
+        de escrita com outra transação na mesma conta).
+        """
+        async def callback(session) -> None:
+            # Uma exceção em qualquer perna aborta a transação
+            await self._apply_leg(transfer_id, from_number, -amount, session)
+            await self._apply_leg(transfer_id, to_number, amount, session)
+        
+        async with await self.client.start_session() as session:
+            await session.with_transaction(callback)
+    
+    async def _apply_leg(
+        self,
+        transfer_id: str,
+        number: str,
+        delta: Decimal,
+        session=None,
+    ) -> None:
+        """
+        Aplica uma perna com escrita condicional.
+        
+        Se o filtro não casar, o diagnóstico decide: perna já aplicada
+        (reentrega) conta como sucesso, saldo antigo em string é
+        convertido e a escrita repetida, e os demais casos viram o erro
+        de domínio correspondente.
+        """
+        query, update = self._settlement_leg(transfer_id, number, delta)
+        
+        for _ in range(3):
+            result = await self.collection.update_one(query, update, session=session)
+            if result.modified_count == 1:
+                return
+            
+            # Descobre o motivo (só no caminho de erro)
+            state = await self._settlement_state(transfer_id, [number], session=session)
+            document = state.get(number)
+            if document and document["applied"]:
+                return  # Reentrega: esta perna já foi aplicada
+            if await self._convert_legacy_balances(state, session=session):
+                continue
+            
+            error = self._leg_error(number, document, -delta if delta < 0 else None)
+            if error:
+                raise error
+            # Nenhum motivo aparente: a conta mudou no meio, tenta de novo
+        
+        raise ConcurrentUpdateError([number])
+    
+    async def _settlement_state(
+        self,
+        transfer_id: str,
+        numbers: list[str],
+        session=None,
+    ) -> dict[str, dict]:
+        """Lê status, saldo e se a transferência já foi aplicada em cada conta."""
+        cursor = self.collection.find(
+            {"account_number": {"$in": numbers}},
+            projection={
+                "_id": 0,
+                "account_number": 1,
+                "status": 1,
+                "balance": 1,
+                "applied_transfers": {"$elemMatch": {"$eq": transfer_id}},
+            },
+            session=session,
+        )
+        state = {}
+        async for document in cursor:
+            document["applied"] = bool(document.pop("applied_transfers", None))
+            state[document["account_number"]] = document
+        return state
+    
+    def _leg_error(
+        self,
+        number: str,
+        document: dict | None,
+        debit_amount: Decimal | None = None,
+    ) -> ValueError | None:
+        """Motivo pelo qual uma perna não foi aplicada (None se válida)."""
+        if document is None:
+            return AccountNotFoundError(number)
+        if document["status"] != AccountStatus.ACTIVE.value:
+            return AccountNotActiveError(number)
+        if debit_amount is not None and decode_decimal(document["balance"]) < debit_amount:
+            return InsufficientFundsError(number)
+        return None
+    
+    async def _compensate(self, transfer_id: str, number: str, delta: Decimal) -> None:
+        """
+        Desfaz uma perna aplicada isoladamente e remove o seu marcador.
+        
+        Desfazer um crédito exige que o dinheiro ainda esteja na conta.
+        """
+        query: dict[str, Any] = {"account_number": number, "applied_transfers": transfer_id}
+        if delta < 0:
+            query["balance"] = {"$gte": Decimal128(-delta)}
+        
+        result = await self.collection.update_one(
+            query,
+            {
+                "$inc": {"balance": Decimal128(delta), "version": 1},
+                "$set": {"updated_at": datetime.now()},
+                "$pull": {"applied_transfers": transfer_id},
+            },
+        )
+        if result.modified_count == 0:
+            raise RuntimeError(
+                f"Não foi possível compensar a transferência {transfer_id} na conta {number}"
+            )
+    
+    async def _convert_legacy_balances(self, state: dict[str, dict], session=None) -> bool:
+        """Converte saldos antigos em string encontrados no diagnóstico."""
+        converted = False
+        for number, document in state.items():
+            if isinstance(document["balance"], str):
+                await self._convert_legacy_balance(number, document["balance"], session)
+                converted = True
+        return converted
+    
+    async def _convert_legacy_balance(self, number: str, balance: str, session=None) -> None:
+        """Troca o saldo salvo como string (formato antigo) por Decimal128."""
+        await self.collection.update_one(
+            {"account_number": number, "balance": balance},
+            {"$set": {"balance": Decimal128(Decimal(balance))}},
+            session=session,
+        )
+    
+    def _reader(self, operation: str, consistency: ReadConsistency) -> AsyncIOMotorCollection:
+        """Coleção com a preferência de leitura da consistência pedida."""
+        return self.read_router.collection(self.collection, operation, consistency)
+    
+    async def _find_archived(
+        self, operation: str, query: dict, consistency: ReadConsistency
+    ) -> dict | None:
+        """Busca de fallback no arquivo de contas encerradas."""
+        archive = self.read_router.collection(self.archive, f"{operation}_archived", consistency)
+        return await archive.find_one(query, projection=_ACCOUNT_PROJECTION)
+    
+    async def _add_slot_balances(
+        self, documents: list[dict], consistency: ReadConsistency
+    ) -> None:
         """
-        Converte documento MongoDB para entidade Account.
+        Soma o saldo dos slots ao saldo das contas em modo dividido.
         
-        Helper method privado.
+        Só custa uma ida ao banco (uma agregação para todas as contas) se
+        algum documento tiver `balance_slots`.
         """
-        return Account(
-            account_number=AccountNumber(value=document["account_number"]),
-            holder_name=document["holder_name"],
-            cpf=CPF(document["cpf"]),
-            balance=Money.create(document["balance"]),
-            status=AccountStatus(document["status"]),
-            created_at=document["created_at"],
-            updated_at=document["updated_at"],
+        split = [document for document in documents if "balance_slots" in document]
+        if not split:
+            return
+        
+        slots_collection = self.read_router.collection(
+            self.balance_slots.collection, "slot_totals", consistency
+        )
+        totals = await self.balance_slots.slot_totals(
+            [document["account_number"] for document in split], slots_collection
         )
+        for document in split:
+            number = document["account_number"]
+            self._split_accounts[number] = document["balance_slots"]
+            document["balance"] = Decimal128(
+                decode_decimal(document["balance"]) + totals.get(number, Decimal("0"))
+            )
     
-    async def close(self) -> None:
-        """Fecha conexão com MongoDB."""
-        self.client.close()
\ No newline at end of file
+    def _save_pipeline(self, account_dict: dict) -> list[dict]:
+        """
+        Update em pipeline do save(): grava todos os campos, mas mantém o
+        saldo do banco se a conta estiver em modo dividido.
+        
+        O saldo da entidade lida de uma conta dividida é conta + slots;
+        regravá-lo no documento da conta contaria os slots duas vezes.
+        Valores entram com $literal (um nome começando com "$" não pode
+        virar referência de campo).
+        """
+        fields = {field: {"$literal": value} for field, value in account_dict.items()}
+        fields["balance"] = {
+            "$cond": [
+                {"$ifNull": ["$balance_slots", False]},
+                "$balance",
+                {"$literal": account_dict["balance"]},
+            ]
+        }
+        return [{"$set": fields}]
+    
+    async def _update_existing(
+        self, account: Account, account_dict: dict
+    ) -> DuplicateAccountError | ConcurrentUpdateError | None:
+        """
+        Update condicional (sem upsert) de uma conta lida do banco.
+        
+        Devolve o documento de ANTES da escrita (só status e slots) para
+        saber se o status mudou: só então, e só em contas com saldo
+        dividido, ele é replicado nos slots (na mesma sessão).
+        """
+        session = current_session()
+        try:
+            previous = await self.collection.find_one_and_update(
+                self._version_filter(account),
+                self._save_pipeline(account_dict),
+                projection={"_id": 0, "status": 1, "balance_slots": 1},
+                return_document=ReturnDocument.BEFORE,
+                session=session,
+            )
+        except DuplicateKeyError as e:
+            return self._duplicate_error(e.details, account_dict)
+        if previous is None:
+            return ConcurrentUpdateError([account_dict["account_number"]])
+        
+        if "balance_slots" in previous and previous["status"] != account_dict["status"]:
+            await self.balance_slots.mirror_status(
+                [account_dict["account_number"]], account_dict["status"], session
+            )
+        return None
+    
+    def _version_filter(self, account: Account) -> dict:
+        """
+        Filtro do compare-and-swap: número da conta + versão lida.
+        
+        Versão 0 também casa documentos gravados antes do versionamento
+        (sem o campo `version`).
+        """
+        if account.version == 0:
+            version: Any = {"$in": [0, None]}
+        else:
+            version = account.version
+        return {"account_number": str(account.account_number), "version": version}
+    
+    def _duplicate_error(
+        self, error_details: dict | None, account_dict: dict
+    ) -> DuplicateAccountError | ConcurrentUpdateError:
+        """
+        Converte o erro de chave duplicada do MongoDB em erro de domínio.
+        
+        O campo violado vem em `keyPattern` nos detalhes do erro. Duplicar
+        o número da conta num upsert significa que a conta "nova" já foi
+        salva por outra operação: é um conflito de versão.
+        """
+        key_pattern = (error_details or {}).get("keyPattern") or {}
+        field = next(iter(key_pattern), "cpf")
+        if field == "account_number":
+            return ConcurrentUpdateError([account_dict["account_number"]])
+        value = str(account_dict.get(field, ""))
+        if field == "cpf":
+            value = CPF.from_trusted(value).formatted()
+        return DuplicateAccountError(field, value)
@@ -0,0 +1,276 @@
+"""
+Cliente MongoDB compartilhado pelo processo.
+
+O AsyncIOMotorClient já mantém um pool de conexões internamente,
+então o correto é criar UM cliente por processo e reaproveitá-lo
+em todos os repositórios (e não um cliente por requisição!).
+"""
+
+import threading
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from ...application.services import current_use_case
+from ..config.settings import Settings
+
+
+# Limites superiores (ms) das faixas dos histogramas de latência
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Rótulos para comandos sem coleção (ex.: commitTransaction) e para
+# comandos disparados fora de um use case
+_NO_COLLECTION = "-"
+_NO_USE_CASE = "-"
+
+
+class MongoPoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Coleta estatísticas do pool de conexões do MongoDB.
+
+    O PyMongo chama estes métodos a partir das threads do Motor,
+    por isso os contadores são protegidos por um lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open = 0
+        self._checked_out = 0
+        self._waiting = 0
+        self._checkout_failures = 0
+        self._pools_cleared = 0
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pools_cleared += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._open += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._open -= 1
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        with self._lock:
+            self._waiting += 1
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self._checkout_failures += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self._checked_out += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._checked_out -= 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Retorna uma cópia dos contadores atuais."""
+        with self._lock:
+            return {
+                "open_connections": self._open,
+                "checked_out": self._checked_out,
+                "waiting": self._waiting,
+                "checkout_failures": self._checkout_failures,
+                "pools_cleared": self._pools_cleared,
+            }
+
+
+class _LatencyHistogram:
+    """Contagem de comandos por faixa de latência, mais soma e máximo."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # Última: acima de todas
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float, failed: bool) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.failures += failed
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def merge(self, other: "_LatencyHistogram") -> None:
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.failures += other.failures
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{limit}ms" for limit in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class MongoCommandMonitor(monitoring.CommandListener):
+    """
+    Latência de cada comando enviado ao MongoDB.
+
+    Agrupa por (use case, coleção, comando) e guarda amostras dos
+    comandos mais lentos que `slow_threshold_ms`. O use case vem de
+    `current_use_case()`: o Motor roda o PyMongo numa thread com uma
+    cópia do contexto de quem chamou, então o listener enxerga a marca
+    posta pelo use case (ou pelo worker).
+
+    Só o formato do comando vai para as amostras (nomes dos campos do
+    filtro), nunca os valores: CPFs e saldos não vazam para as métricas.
+    """
+
+    def __init__(self, slow_threshold_ms: float = 100.0, max_slow_samples: int = 50) -> None:
+        """
+        Args:
+            slow_threshold_ms: Duração a partir da qual o comando vira amostra
+            max_slow_samples: Amostras guardadas (as mais recentes)
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str, str], _LatencyHistogram] = {}
+        self._slow_samples: deque[dict] = deque(maxlen=max_slow_samples)
+        # Comandos em andamento: (request_id, connection_id) -> dados do início
+        self._started: dict[tuple, tuple[str, str, str, list[str]]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command = event.command
+        collection = command.get(event.command_name)
+        if event.command_name == "getMore":
+            collection = command.get("collection")
+        if not isinstance(collection, str):
+            collection = _NO_COLLECTION
+        shape = sorted(command.get("filter") or command.get("query") or {})
+
+        with self._lock:
+            self._started[(event.request_id, event.connection_id)] = (
+                current_use_case() or _NO_USE_CASE,
+                collection,
+                event.command_name,
+                shape,
+            )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool) -> None:
+        duration_ms = event.duration_micros / 1000
+        with self._lock:
+            started = self._started.pop((event.request_id, event.connection_id), None)
+            if started is None:
+                return  # Comando iniciado antes do listener existir
+            use_case, collection, command_name, shape = started
+
+            key = (use_case, collection, command_name)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _LatencyHistogram()
+            histogram.record(duration_ms, failed)
+
+            if duration_ms >= self.slow_threshold_ms:
+                self._slow_samples.append(
+                    {
+                        "at": datetime.now().isoformat(timespec="milliseconds"),
+                        "use_case": use_case,
+                        "collection": collection,
+                        "command": command_name,
+                        "filter_fields": shape,
+                        "duration_ms": round(duration_ms, 3),
+                        "failed": failed,
+                    }
+                )
+
+    def snapshot(self) -> dict:
+        """
+        Histogramas por comando, por coleção e por use case, e amostras lentas.
+
+        Ex: {"by_use_case": {"DepositMoneyUseCase": {"accounts.findAndModify": {...}}}}
+        """
+        with self._lock:
+            histograms = list(self._histograms.items())
+            slow_samples = list(self._slow_samples)
+
+        by_command: dict[str, _LatencyHistogram] = {}
+        by_collection: dict[str, _LatencyHistogram] = {}
+        by_use_case: dict[str, dict[str, _LatencyHistogram]] = {}
+        for (use_case, collection, command_name), histogram in histograms:
+            for groups, name in (
+                (by_command, command_name),
+                (by_collection, collection),
+                (by_use_case.setdefault(use_case, {}), f"{collection}.{command_name}"),
+            ):
+                groups.setdefault(name, _LatencyHistogram()).merge(histogram)
+
+        def render(groups: dict[str, _LatencyHistogram]) -> dict:
+            return {name: groups[name].snapshot() for name in sorted(groups)}
+
+        return {
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "by_command": render(by_command),
+            "by_collection": render(by_collection),
+            "by_use_case": {
+                use_case: render(by_use_case[use_case]) for use_case in sorted(by_use_case)
+            },
+            "slow_samples": slow_samples,
+        }
+
+
+def create_mongo_client(
+    settings: Settings,
+    pool_monitor: MongoPoolMonitor | None = None,
+    command_monitor: MongoCommandMonitor | None = None,
+) -> AsyncIOMotorClient:
+    """
+    Cria o cliente Motor com o pool configurado no Settings.
+
+    Args:
+        settings: Configurações da aplicação (URL e tamanhos do pool)
+        pool_monitor: Listener opcional para estatísticas do pool
+        command_monitor: Listener opcional para latência dos comandos
+    """
+    event_listeners = [
+        listener for listener in (pool_monitor, command_monitor) if listener
+    ]
+
+    return AsyncIOMotorClient(
+        settings.mongodb_url,
+        maxPoolSize=settings.mongodb_max_pool_size,
+        minPoolSize=settings.mongodb_min_pool_size,
+        maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+        waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms,
+        serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+        event_listeners=event_listeners,
+    )
@@ -0,0 +1,235 @@
+"""
+Implementação do ReportRepository com pipelines de agregação do MongoDB.
+
+Os relatórios agrupam no servidor ($group, $bucket) e só os totais
+voltam para a aplicação. Todas as agregações usam allowDiskUse (o
+MongoDB pode usar disco quando o agrupamento passa do limite de
+memória por estágio) e leem dos secundários (consistência EVENTUAL).
+
+Contas com saldo dividido (ver balance_slots.py) entram com o saldo
+total: elas são poucas, então só elas passam pelo $lookup nos slots.
+Contas arquivadas (ver archiver.py) entram por um $unionWith com
+accounts_archive.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from ...domain.entities import AccountStatus
+from ...application.interfaces import (
+    BalanceBucket,
+    OpeningRatePoint,
+    ReadConsistency,
+    ReportPeriod,
+    ReportRepository,
+    StatusReportRow,
+)
+from .account_codec import decode_decimal
+from .archiver import ACCOUNTS_ARCHIVE_COLLECTION
+from .read_routing import ReadRouter
+
+
+# Todos os status: casa tudo, mas deixa o filtro usar o índice
+# (status, created_at, account_number)
+_ALL_STATUSES = {"$in": [status.value for status in AccountStatus]}
+
+# _id do $bucket para saldos a partir do último limite
+_OVERFLOW_BUCKET = "overflow"
+
+
+class MongoReportRepository(ReportRepository):
+    """
+    Relatórios de contas calculados no MongoDB.
+
+    IMPLEMENTA a interface ReportRepository.
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        read_router: ReadRouter | None = None,
+    ) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+            read_router: Destino das leituras por consistência (compartilhado)
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.collection = self.database["accounts"]
+        self.read_router = read_router or ReadRouter()
+
+    async def totals_by_status(self) -> list[StatusReportRow]:
+        """
+        Pipeline:
+            [saldo efetivo de cada conta,
+             {$group: {_id: "$status", count: {$sum: 1},
+                       total: {$sum: "$balance"}, average: {$avg: "$balance"}}},
+             {$sort: {_id: 1}}]
+        """
+        pipeline = self._effective_balances() + [
+            {
+                "$group": {
+                    "_id": "$status",
+                    "count": {"$sum": 1},
+                    "total": {"$sum": "$balance"},
+                    "average": {"$avg": "$balance"},
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+        groups = await self._aggregate("report_totals_by_status", pipeline)
+        return [
+            StatusReportRow(
+                status=group["_id"],
+                count=group["count"],
+                total_balance=decode_decimal(group["total"]),
+                average_balance=decode_decimal(group["average"] or "0"),
+            )
+            for group in groups
+        ]
+
+    async def balance_distribution(self, boundaries: list[Decimal]) -> list[BalanceBucket]:
+        """
+        Pipeline:
+            [saldo efetivo de cada conta,
+             {$bucket: {groupBy: "$balance", boundaries: [...], default: "overflow",
+                        output: {count: {$sum: 1}, total: {$sum: "$balance"}}}}]
+
+        Faixas sem contas não saem do $bucket: são completadas com zero aqui.
+        """
+        pipeline = self._effective_balances() + [
+            {
+                "$bucket": {
+                    "groupBy": "$balance",
+                    "boundaries": [Decimal128(boundary) for boundary in boundaries],
+                    "default": _OVERFLOW_BUCKET,
+                    "output": {
+                        "count": {"$sum": 1},
+                        "total": {"$sum": "$balance"},
+                    },
+                }
+            }
+        ]
+        groups = {}
+        for group in await self._aggregate("report_balance_distribution", pipeline):
+            lower = group["_id"]
+            groups[lower if lower == _OVERFLOW_BUCKET else decode_decimal(lower)] = group
+
+        buckets = []
+        limits = list(zip(boundaries, boundaries[1:])) + [(boundaries[-1], None)]
+        for lower, upper in limits:
+            group = groups.get(lower if upper is not None else _OVERFLOW_BUCKET, {})
+            buckets.append(
+                BalanceBucket(
+                    lower=lower,
+                    upper=upper,
+                    count=group.get("count", 0),
+                    total_balance=decode_decimal(group.get("total", "0")),
+                )
+            )
+        return buckets
+
+    async def opening_rate(
+        self,
+        period: ReportPeriod,
+        created_from: datetime,
+        created_to: datetime,
+    ) -> list[OpeningRatePoint]:
+        """
+        Pipeline:
+            [{$match: {status: {$in: [...]}, created_at: {$gte: from, $lt: to}}},
+             {$unionWith: {coll: "accounts_archive", pipeline: [mesmo $match]}},
+             {$group: {_id: {$dateTrunc: {date: "$created_at", unit: "day"}},
+                       count: {$sum: 1}}},
+             {$sort: {_id: 1}}]
+
+        Na coleção quente o $match usa o índice (status, created_at,
+        account_number) e o $group só lê campos do índice: nenhum documento
+        de conta é carregado. No arquivo, o índice de created_at.
+        """
+        match = {
+            "$match": {
+                "status": _ALL_STATUSES,
+                "created_at": {"$gte": created_from, "$lt": created_to},
+            }
+        }
+        pipeline = [
+            match,
+            # Contas já arquivadas também foram abertas no intervalo
+            {"$unionWith": {"coll": ACCOUNTS_ARCHIVE_COLLECTION, "pipeline": [match]}},
+            {
+                "$group": {
+                    "_id": {
+                        "$dateTrunc": {
+                            "date": "$created_at",
+                            "unit": period.value,
+                            "startOfWeek": "monday",
+                        }
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+        groups = await self._aggregate("report_opening_rate", pipeline)
+        return [
+            OpeningRatePoint(period_start=group["_id"], count=group["count"])
+            for group in groups
+        ]
+
+    def _effective_balances(self) -> list[dict[str, Any]]:
+        """
+        Estágios que produzem {status, balance} por conta (quentes e
+        arquivadas), já somando os slots das contas em modo dividido.
+
+        $toDecimal converte os saldos em string de documentos ainda não
+        migrados (senão $sum e $bucket os deixariam de fora).
+        """
+        balance = {"$toDecimal": "$balance"}
+        return [
+            {"$match": {"balance_slots": {"$exists": False}}},
+            {"$project": {"_id": 0, "status": 1, "balance": balance}},
+            {
+                "$unionWith": {
+                    "coll": self.collection.name,
+                    "pipeline": [
+                        {"$match": {"balance_slots": {"$exists": True}}},
+                        {
+                            "$lookup": {
+                                "from": "account_balance_slots",
+                                "localField": "account_number",
+                                "foreignField": "account_number",
+                                "as": "slots",
+                            }
+                        },
+                        {
+                            "$project": {
+                                "_id": 0,
+                                "status": 1,
+                                "balance": {"$add": [balance, {"$sum": "$slots.balance"}]},
+                            }
+                        },
+                    ],
+                }
+            },
+            {
+                "$unionWith": {
+                    "coll": ACCOUNTS_ARCHIVE_COLLECTION,
+                    "pipeline": [{"$project": {"_id": 0, "status": 1, "balance": balance}}],
+                }
+            },
+        ]
+
+    async def _aggregate(self, operation: str, pipeline: list[dict]) -> list[dict]:
+        """Roda a agregação num secundário, com permissão para usar disco."""
+        collection = self.read_router.collection(
+            self.collection, operation, ReadConsistency.EVENTUAL
+        )
+        return await collection.aggregate(pipeline, allowDiskUse=True).to_list(length=None)
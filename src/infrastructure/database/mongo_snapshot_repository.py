@@ -0,0 +1,94 @@
+"""
+Implementação do SnapshotRepository usando MongoDB.
+
+Cada checkpoint é um documento em `balance_snapshots`. O _id é
+(conta, lançamento), então recalcular o mesmo checkpoint não
+duplica nada.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import DESCENDING
+from pymongo.errors import DuplicateKeyError
+
+from ...domain.value_objects import AccountNumber
+from ...application.interfaces import (
+    BalanceSnapshot,
+    LedgerPosition,
+    SnapshotRepository,
+)
+
+
+class MongoSnapshotRepository(SnapshotRepository):
+    """
+    Checkpoints de saldo no MongoDB.
+
+    IMPLEMENTA a interface SnapshotRepository.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, database_name: str) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.collection: AsyncIOMotorCollection = self.database["balance_snapshots"]
+
+    async def save(self, snapshot: BalanceSnapshot) -> None:
+        """Insere o checkpoint (ignorado se a posição já foi gravada)."""
+        try:
+            await self.collection.insert_one(self._snapshot_to_document(snapshot))
+        except DuplicateKeyError:
+            pass
+
+    async def find_latest(
+        self,
+        account_number: AccountNumber,
+        at: datetime | None = None,
+    ) -> BalanceSnapshot | None:
+        """
+        Query MongoDB:
+            db.balance_snapshots.find({account_number: "...", position_created_at: {$lte: at}})
+                .sort({position_created_at: -1, position_id: -1}).limit(1)
+        """
+        query: dict[str, Any] = {"account_number": str(account_number)}
+        if at:
+            query["position_created_at"] = {"$lte": at}
+
+        document = await self.collection.find_one(
+            query,
+            sort=[("position_created_at", DESCENDING), ("position_id", DESCENDING)],
+        )
+        if not document:
+            return None
+
+        return self._document_to_snapshot(document)
+
+    def _snapshot_to_document(self, snapshot: BalanceSnapshot) -> dict:
+        """Converte BalanceSnapshot para documento MongoDB."""
+        position = snapshot.ledger_position
+        return {
+            "_id": f"{snapshot.account_number}:{position.transaction_id}",
+            "account_number": str(snapshot.account_number),
+            "balance": Decimal128(snapshot.balance),
+            "position_created_at": position.created_at,
+            "position_id": position.transaction_id,
+            "taken_at": snapshot.taken_at,
+        }
+
+    def _document_to_snapshot(self, document: dict) -> BalanceSnapshot:
+        """Converte documento MongoDB para BalanceSnapshot."""
+        return BalanceSnapshot(
+            account_number=AccountNumber.from_trusted(document["account_number"]),
+            balance=document["balance"].to_decimal(),
+            ledger_position=LedgerPosition(
+                created_at=document["position_created_at"],
+                transaction_id=document["position_id"],
+            ),
+            taken_at=document["taken_at"],
+        )
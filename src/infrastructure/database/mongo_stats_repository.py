@@ -0,0 +1,85 @@
+"""
+Implementação do StatsRepository usando MongoDB.
+
+Só lê as visões materializadas mantidas pelo StatsProjector
+(ver stats_projector.py): um documento com os totais por status e
+um documento por dia de lançamentos. O custo da consulta não cresce
+com o número de contas nem de lançamentos.
+"""
+
+from datetime import date
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DESCENDING
+
+from ...application.interfaces import (
+    LedgerDayTotals,
+    StatsRepository,
+    StatusTotals,
+    SystemStats,
+)
+from .account_codec import decode_decimal
+
+
+# Coleções e documentos das visões
+STATS_VIEWS_COLLECTION = "stats_views"
+LEDGER_DAILY_COLLECTION = "stats_ledger_daily"
+ACCOUNTS_VIEW_ID = "accounts_by_status"
+
+
+class MongoStatsRepository(StatsRepository):
+    """
+    Leitura das visões agregadas no MongoDB.
+
+    IMPLEMENTA a interface StatsRepository.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, database_name: str) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.views = self.database[STATS_VIEWS_COLLECTION]
+        self.ledger_daily = self.database[LEDGER_DAILY_COLLECTION]
+
+    async def get_stats(self, days: int = 30) -> SystemStats:
+        """
+        Query MongoDB:
+            db.stats_views.findOne({_id: "accounts_by_status"})
+            db.stats_ledger_daily.find().sort({_id: -1}).limit(days)
+        """
+        view = await self.views.find_one({"_id": ACCOUNTS_VIEW_ID}) or {}
+        daily = await (
+            self.ledger_daily.find()
+            .sort("_id", DESCENDING)
+            .limit(days)
+            .to_list(length=days)
+        )
+
+        return SystemStats(
+            accounts_by_status={
+                status: StatusTotals(
+                    count=totals.get("count", 0),
+                    balance=decode_decimal(totals.get("balance", "0")),
+                )
+                for status, totals in view.get("statuses", {}).items()
+            },
+            ledger_days=[
+                LedgerDayTotals(
+                    day=date.fromisoformat(document["_id"]),
+                    by_type={
+                        transaction_type: (
+                            totals.get("count", 0),
+                            decode_decimal(totals.get("amount", "0")),
+                        )
+                        for transaction_type, totals in document.get("types", {}).items()
+                    },
+                )
+                for document in daily
+            ],
+            updated_at=view.get("updated_at"),
+        )
+
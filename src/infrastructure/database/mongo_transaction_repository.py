@@ -0,0 +1,261 @@
+"""
+Implementação do TransactionRepository usando MongoDB.
+
+A coleção `transactions` é append-only: só recebe inserções.
+O histórico é paginado por cursor (keyset) sobre o índice
+(account_number, created_at, _id), então a página 1000 custa o
+mesmo que a primeira (sem skip).
+
+Lançamentos mais antigos que a retenção ficam em `transactions_archive`
+(ver archiver.py). Como o arquivo só tem lançamentos ANTERIORES aos da
+coleção quente, as leituras continuam nele pela mesma ordenação quando
+a coleção quente acaba.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from ...domain.entities import Transaction, TransactionStatus, TransactionType
+from ...domain.value_objects import AccountNumber, Money
+from ...application.interfaces import (
+    LedgerPosition,
+    ReadConsistency,
+    TransactionPage,
+    TransactionRepository,
+)
+from .archiver import TRANSACTIONS_ARCHIVE_COLLECTION
+from .cursors import decode_cursor, encode_cursor
+from .read_routing import ReadRouter
+from .unit_of_work import current_session
+
+
+class MongoTransactionRepository(TransactionRepository):
+    """
+    Livro-razão de transações no MongoDB.
+
+    IMPLEMENTA a interface TransactionRepository.
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        read_router: ReadRouter | None = None,
+    ) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+            read_router: Destino das leituras por consistência (compartilhado)
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.collection: AsyncIOMotorCollection = self.database["transactions"]
+        self.archive: AsyncIOMotorCollection = self.database[TRANSACTIONS_ARCHIVE_COLLECTION]
+        self.read_router = read_router or ReadRouter()
+
+    async def save(self, transaction: Transaction) -> None:
+        """
+        Insere um lançamento.
+
+        O id da transação é o _id do documento: inserir de novo o mesmo
+        lançamento (ex.: mensagem reprocessada) é ignorado.
+        """
+        try:
+            await self.collection.insert_one(
+                self._transaction_to_document(transaction), session=current_session()
+            )
+        except DuplicateKeyError:
+            pass
+
+    async def save_many(self, transactions: list[Transaction]) -> None:
+        """
+        Insere vários lançamentos em uma única ida ao banco.
+
+        insert_many não ordenado: um id repetido não impede os demais.
+        """
+        if not transactions:
+            return
+
+        try:
+            await self.collection.insert_many(
+                [self._transaction_to_document(transaction) for transaction in transactions],
+                ordered=False,
+                session=current_session(),
+            )
+        except BulkWriteError as e:
+            if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise
+
+    async def exists(self, transaction_id: str) -> bool:
+        """
+        Busca pelo _id na coleção quente.
+
+        Usado para reconhecer reentregas recentes, então o arquivo (só
+        lançamentos antigos) não é consultado.
+        """
+        return bool(
+            await self.collection.count_documents(
+                {"_id": transaction_id}, limit=1, session=current_session()
+            )
+        )
+
+    async def find_page_by_account(
+        self,
+        account_number: AccountNumber,
+        limit: int,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> TransactionPage:
+        """
+        Busca uma página do histórico (mais recentes primeiro).
+
+        Query MongoDB (com cursor):
+            db.transactions.find({
+                account_number: "...",
+                $or: [
+                    {created_at: {$lt: t}},
+                    {created_at: t, _id: {$lt: id}}
+                ]
+            }).sort({created_at: -1, _id: -1}).limit(limit + 1)
+
+        Se a coleção quente não completar a página, o restante vem de
+        db.transactions_archive, a partir do último lançamento lido.
+        """
+        query: dict[str, Any] = {"account_number": str(account_number)}
+        if cursor:
+            created_at, transaction_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": transaction_id}},
+            ]
+
+        collection = self.read_router.collection(
+            self.collection, "find_page_by_account", consistency
+        )
+        
+        # Um a mais para saber se existe próxima página
+        documents = await (
+            collection.find(query)
+            .sort([("created_at", DESCENDING), ("_id", DESCENDING)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+
+        if len(documents) <= limit:
+            if documents:
+                # Continua depois do último lido (um lançamento sendo
+                # arquivado pode estar nas duas coleções)
+                last = documents[-1]
+                query["$or"] = [
+                    {"created_at": {"$lt": last["created_at"]}},
+                    {"created_at": last["created_at"], "_id": {"$lt": last["_id"]}},
+                ]
+            remaining = limit + 1 - len(documents)
+            archive = self.read_router.collection(
+                self.archive, "find_page_by_account_archived", consistency
+            )
+            documents += await (
+                archive.find(query)
+                .sort([("created_at", DESCENDING), ("_id", DESCENDING)])
+                .limit(remaining)
+                .to_list(length=remaining)
+            )
+
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = encode_cursor(last["created_at"], last["_id"])
+
+        return TransactionPage(
+            items=[self._document_to_transaction(document) for document in documents],
+            next_cursor=next_cursor,
+        )
+
+    async def stream_by_account(
+        self,
+        account_number: AccountNumber,
+        batch_size: int = 1000,
+        after: LedgerPosition | None = None,
+        until: datetime | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Itera o histórico em ordem cronológica direto do cursor do Motor.
+
+        Usa o mesmo índice da paginação (percorrido ao contrário).
+        O batch_size define quantos documentos vêm por ida ao banco:
+        lotes maiores = menos round-trips, lotes menores = menos memória.
+
+        Os lançamentos arquivados (os mais antigos) vêm primeiro; depois,
+        os da coleção quente posteriores ao último já entregue.
+        """
+        for source, operation in (
+            (self.archive, "stream_by_account_archived"),
+            (self.collection, "stream_by_account"),
+        ):
+            query: dict[str, Any] = {"account_number": str(account_number)}
+            if after:
+                query["$or"] = [
+                    {"created_at": {"$gt": after.created_at}},
+                    {"created_at": after.created_at, "_id": {"$gt": after.transaction_id}},
+                ]
+            if until:
+                query["created_at"] = {"$lte": until}
+
+            collection = self.read_router.collection(source, operation, consistency)
+            cursor = (
+                collection.find(query)
+                .sort([("created_at", ASCENDING), ("_id", ASCENDING)])
+                .batch_size(batch_size)
+            )
+            async for document in cursor:
+                after = LedgerPosition(
+                    created_at=document["created_at"], transaction_id=document["_id"]
+                )
+                yield self._document_to_transaction(document)
+
+    def _transaction_to_document(self, transaction: Transaction) -> dict:
+        """Converte entidade Transaction para documento MongoDB."""
+        return {
+            "_id": transaction.id,
+            "account_number": str(transaction.account_number),
+            "type": transaction.type.value,
+            "amount": Decimal128(transaction.amount.amount),
+            "status": transaction.status.value,
+            "created_at": transaction.created_at,
+            "completed_at": transaction.completed_at,
+            "description": transaction.description,
+            "related_account": (
+                str(transaction.related_account) if transaction.related_account else None
+            ),
+        }
+
+    def _document_to_transaction(self, document: dict) -> Transaction:
+        """
+        Converte documento MongoDB para entidade Transaction.
+
+        Lançamentos só são gravados a partir de entidades já validadas,
+        então os value objects são recriados sem validar de novo.
+        """
+        related_account = document.get("related_account")
+        return Transaction(
+            id=document["_id"],
+            account_number=AccountNumber.from_trusted(document["account_number"]),
+            type=TransactionType(document["type"]),
+            amount=Money.from_trusted(document["amount"].to_decimal()),
+            status=TransactionStatus(document["status"]),
+            created_at=document["created_at"],
+            completed_at=document.get("completed_at"),
+            description=document.get("description", ""),
+            related_account=(
+                AccountNumber.from_trusted(related_account) if related_account else None
+            ),
+        )
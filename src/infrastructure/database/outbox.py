@@ -0,0 +1,171 @@
+"""
+Outbox transacional: eventos gravados no MongoDB e publicados depois.
+
+MongoOutboxPublisher grava cada evento na coleção `outbox`. Dentro de
+uma MongoUnitOfWork a gravação entra na MESMA transação da alteração
+da conta: ou os dois acontecem, ou nenhum. A requisição HTTP nunca
+espera o broker.
+
+OutboxRelay (python -m src.scripts.run_outbox_relay) lê as linhas não
+enviadas em ordem de criação, publica em lotes grandes com publisher
+confirms e marca as confirmadas como enviadas com um único
+update_many. A marca `sent` é o checkpoint: um relay reiniciado
+continua da primeira linha não enviada. Uma queda entre a publicação e
+a marca reenvia o lote (entrega pelo menos uma vez: consumidores
+deduplicam pelo event_id).
+
+Rode UM relay por banco: dois relays publicariam as mesmas linhas.
+"""
+
+import asyncio
+import dataclasses
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+
+from ...domain import events as domain_events
+from ...domain.events import DomainEvent
+from ...application.interfaces import EventPublishError, EventPublisher
+from .unit_of_work import current_session
+
+
+OUTBOX_COLLECTION = "outbox"
+
+# Classes de evento pelo nome gravado em event_type
+_EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    name: getattr(domain_events, name)
+    for name in domain_events.__all__
+    if name != "DomainEvent"
+}
+
+
+def _encode_event(event: DomainEvent) -> dict:
+    """Evento -> linha da outbox (o payload é o mesmo to_dict() publicado)."""
+    return {
+        "_id": event.event_id,
+        "event_type": event.event_type,
+        "payload": event.to_dict(),
+        "created_at": datetime.now(),
+        "sent": False,
+        "sent_at": None,
+    }
+
+
+def _decode_event(document: dict) -> DomainEvent:
+    """Linha da outbox -> evento (os campos do to_dict() são os do dataclass)."""
+    event_class = _EVENT_TYPES[document["event_type"]]
+    fields = {field.name for field in dataclasses.fields(event_class) if field.init}
+    payload = document["payload"]
+    return event_class(**{key: value for key, value in payload.items() if key in fields})
+
+
+class MongoOutboxPublisher(EventPublisher):
+    """
+    Publicador que grava os eventos na outbox.
+
+    IMPLEMENTA a interface EventPublisher.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, database_name: str) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+        """
+        self.client = client
+        self.collection = self.client[database_name][OUTBOX_COLLECTION]
+
+    async def publish(self, event: DomainEvent) -> None:
+        await self.collection.insert_one(_encode_event(event), session=current_session())
+
+    async def publish_many(self, events: list[DomainEvent]) -> None:
+        if not events:
+            return
+        await self.collection.insert_many(
+            [_encode_event(event) for event in events], session=current_session()
+        )
+
+    async def close(self) -> None:
+        """Nada a fechar: o cliente é compartilhado."""
+
+
+class OutboxRelay:
+    """
+    Publica as linhas pendentes da outbox no broker.
+
+    Uso:
+        relay = OutboxRelay(client, "jbank", rabbitmq_publisher, batch_size=1000)
+        await relay.run()
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        publisher: EventPublisher,
+        batch_size: int = 1000,
+        poll_interval_ms: int = 200,
+    ) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+            publisher: Publicador do broker (com confirms)
+            batch_size: Linhas publicadas por lote
+            poll_interval_ms: Espera quando a outbox está vazia
+        """
+        self.client = client
+        self.collection = self.client[database_name][OUTBOX_COLLECTION]
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval_ms / 1000
+        self.relayed = 0
+        self.failed = 0
+
+    async def run(self) -> None:
+        """Publica indefinidamente; só espera quando não há pendências."""
+        while True:
+            if not await self.relay_batch():
+                await asyncio.sleep(self.poll_interval)
+
+    async def relay_batch(self) -> int:
+        """
+        Publica um lote de linhas pendentes e marca as confirmadas.
+
+        Query MongoDB (índice parcial das linhas não enviadas):
+            db.outbox.find({sent: false}).sort({created_at: 1, _id: 1}).limit(batch_size)
+
+        Returns:
+            Quantas linhas foram lidas (0 = outbox vazia)
+        """
+        documents = await (
+            self.collection.find({"sent": False})
+            .sort([("created_at", ASCENDING), ("_id", ASCENDING)])
+            .limit(self.batch_size)
+            .to_list(length=self.batch_size)
+        )
+        if not documents:
+            return 0
+
+        events = [_decode_event(document) for document in documents]
+        failed_ids: set[str] = set()
+        try:
+            await self.publisher.publish_many(events)
+        except EventPublishError as e:
+            # Recusadas continuam pendentes e voltam no próximo lote
+            failed_ids = {event.event_id for event in e.failed_events}
+            self.failed += len(failed_ids)
+            print(f"⚠️ {len(failed_ids)} evento(s) recusado(s) pelo broker, nova tentativa")
+
+        sent_ids = [event.event_id for event in events if event.event_id not in failed_ids]
+        if sent_ids:
+            await self.collection.update_many(
+                {"_id": {"$in": sent_ids}},
+                {"$set": {"sent": True, "sent_at": datetime.now()}},
+            )
+        self.relayed += len(sent_ids)
+
+        if failed_ids:
+            await asyncio.sleep(self.poll_interval)
+        return len(documents)
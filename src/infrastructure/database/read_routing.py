@@ -0,0 +1,81 @@
+"""
+Roteamento de leituras entre primário e secundários do replica set.
+
+Leituras EVENTUAL vão para um secundário (secondaryPreferred) com um
+atraso máximo configurável (maxStalenessSeconds); se nenhum secundário
+estiver dentro do limite, o driver usa o primário. Leituras STRONG
+ficam sempre no primário.
+
+Em um servidor standalone a preferência de leitura é ignorada e tudo
+vai para o mesmo nó.
+"""
+
+from collections import Counter
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.read_preferences import SecondaryPreferred
+
+from ...application.interfaces import ReadConsistency
+
+
+class ReadRoutingStats:
+    """Contadores de leituras por operação e destino."""
+    
+    def __init__(self) -> None:
+        self._counts: Counter[tuple[str, str]] = Counter()
+    
+    def record(self, operation: str, route: str) -> None:
+        self._counts[(operation, route)] += 1
+    
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Ex: {"find_by_account_number": {"primary": 10, "secondary_preferred": 3}}"""
+        result: dict[str, dict[str, int]] = {}
+        for (operation, route), count in sorted(self._counts.items()):
+            result.setdefault(operation, {})[route] = count
+        return result
+
+
+class ReadRouter:
+    """
+    Escolhe a coleção (com a preferência de leitura certa) por operação.
+    
+    Compartilhado pelos repositórios do processo, para que os
+    contadores sejam um só.
+    """
+    
+    def __init__(
+        self,
+        stats: ReadRoutingStats | None = None,
+        max_staleness_seconds: int = -1,
+    ) -> None:
+        """
+        Args:
+            stats: Contadores (um novo se None)
+            max_staleness_seconds: Atraso máximo aceito de um secundário
+                (-1 = sem limite; o MongoDB exige no mínimo 90)
+        """
+        if 0 <= max_staleness_seconds < 90:
+            raise ValueError("max_staleness_seconds deve ser -1 ou no mínimo 90")
+        
+        self.stats = stats or ReadRoutingStats()
+        self._secondary_preferred = SecondaryPreferred(max_staleness=max_staleness_seconds)
+        self._secondary_collections: dict[str, AsyncIOMotorCollection] = {}
+    
+    def collection(
+        self,
+        collection: AsyncIOMotorCollection,
+        operation: str,
+        consistency: ReadConsistency,
+    ) -> AsyncIOMotorCollection:
+        """Retorna a coleção a usar nesta leitura e registra o destino."""
+        if consistency == ReadConsistency.STRONG:
+            self.stats.record(operation, "primary")
+            return collection
+        
+        self.stats.record(operation, "secondary_preferred")
+        # with_options cria um objeto novo: um por coleção basta
+        secondary = self._secondary_collections.get(collection.full_name)
+        if secondary is None:
+            secondary = collection.with_options(read_preference=self._secondary_preferred)
+            self._secondary_collections[collection.full_name] = secondary
+        return secondary
@@ -0,0 +1,207 @@
+"""
+Declaração e aplicação dos índices das coleções do MongoDB.
+
+Os índices (e opções de coleção) ficam declarados aqui, em um só
+lugar, e são aplicados de forma idempotente no startup da API e pelo
+script `python -m src.scripts.apply_schema`.
+
+As imagens anterior/posterior dos change streams só interessam ao
+projetor de estatísticas, que as liga no próprio startup
+(SchemaManager.enable_change_stream_images).
+"""
+
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+
+ACCOUNT_INDEXES = [
+    # find_by_account_number, save (upsert) e delete
+    IndexModel(
+        [("account_number", ASCENDING)],
+        name="account_number_unique",
+        unique=True,
+    ),
+    # find_by_cpf e unicidade do CPF (sem checagem prévia no use case)
+    IndexModel(
+        [("cpf", ASCENDING)],
+        name="cpf_unique",
+        unique=True,
+    ),
+    # list_accounts: filtro por status + faixa de criação, keyset na ordem
+    IndexModel(
+        [("status", ASCENDING), ("created_at", ASCENDING), ("account_number", ASCENDING)],
+        name="status_created_at",
+    ),
+]
+
+TRANSACTION_INDEXES = [
+    # Histórico por conta com paginação por cursor (keyset)
+    IndexModel(
+        [("account_number", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="account_number_created_at",
+    ),
+    # Arquivamento: lançamentos mais antigos que a retenção, em ordem
+    IndexModel(
+        [("created_at", ASCENDING), ("_id", ASCENDING)],
+        name="created_at_id",
+    ),
+]
+
+SNAPSHOT_INDEXES = [
+    # Checkpoint mais recente da conta (até um instante)
+    IndexModel(
+        [
+            ("account_number", ASCENDING),
+            ("position_created_at", DESCENDING),
+            ("position_id", DESCENDING),
+        ],
+        name="account_number_position",
+    ),
+]
+
+BALANCE_SLOT_INDEXES = [
+    # Soma, varredura e replicação de status dos slots de uma conta
+    IndexModel(
+        [("account_number", ASCENDING), ("slot", ASCENDING)],
+        name="account_number_slot",
+    ),
+]
+
+# Coleções de arquivo (ver archiver.py): só as buscas de fallback
+ACCOUNT_ARCHIVE_INDEXES = [
+    IndexModel(
+        [("account_number", ASCENDING)],
+        name="account_number_unique",
+        unique=True,
+    ),
+    # Não é único: o CPF pode ter aberto outra conta depois
+    IndexModel([("cpf", ASCENDING)], name="cpf"),
+    # Relatório de aberturas por período
+    IndexModel([("created_at", ASCENDING)], name="created_at"),
+]
+
+TRANSACTION_ARCHIVE_INDEXES = [
+    IndexModel(
+        [("account_number", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+        name="account_number_created_at",
+    ),
+]
+
+# Linhas enviadas ficam 7 dias na outbox (auditoria) e o TTL as remove
+OUTBOX_RETENTION_SECONDS = 7 * 24 * 3600
+
+OUTBOX_INDEXES = [
+    # Relay: pendentes em ordem de criação; o índice parcial só tem as
+    # linhas não enviadas, então fica pequeno com a outbox em dia
+    IndexModel(
+        [("created_at", ASCENDING), ("_id", ASCENDING)],
+        name="unsent_created_at",
+        partialFilterExpression={"sent": False},
+    ),
+    # TTL: só linhas com sent_at (as pendentes têm null e ficam)
+    IndexModel(
+        [("sent_at", ASCENDING)],
+        name="sent_at_ttl",
+        expireAfterSeconds=OUTBOX_RETENTION_SECONDS,
+    ),
+]
+
+COLLECTION_INDEXES: dict[str, list[IndexModel]] = {
+    "accounts": ACCOUNT_INDEXES,
+    "transactions": TRANSACTION_INDEXES,
+    "balance_snapshots": SNAPSHOT_INDEXES,
+    "account_balance_slots": BALANCE_SLOT_INDEXES,
+    "accounts_archive": ACCOUNT_ARCHIVE_INDEXES,
+    "transactions_archive": TRANSACTION_ARCHIVE_INDEXES,
+    "outbox": OUTBOX_INDEXES,
+}
+
+# Imagens anterior/posterior nos change streams (collMod): o StatsProjector
+# calcula a diferença de status e saldo de cada escrita (MongoDB 6.0+).
+# Cada escrita nessas coleções passa a gravar também as imagens, então
+# só são ligadas onde o projetor roda.
+CHANGE_STREAM_IMAGE_OPTIONS: dict[str, dict[str, Any]] = {
+    "accounts": {"changeStreamPreAndPostImages": {"enabled": True}},
+    "account_balance_slots": {"changeStreamPreAndPostImages": {"enabled": True}},
+    "accounts_archive": {"changeStreamPreAndPostImages": {"enabled": True}},
+}
+
+# Opções que diferenciam dois índices com a mesma chave
+_COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+class SchemaManager:
+    """
+    Aplica os índices declarados nas coleções do banco.
+    
+    Idempotente: índices já existentes com a mesma definição são
+    mantidos, os que mudaram de definição são recriados e os que
+    faltam são criados.
+    """
+    
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_indexes: dict[str, list[IndexModel]] = COLLECTION_INDEXES,
+    ) -> None:
+        self.database = database
+        self.collection_indexes = collection_indexes
+    
+    async def apply(self) -> dict[str, list[str]]:
+        """
+        Aplica os índices de todas as coleções.
+        
+        Returns:
+            Nomes dos índices criados (ou recriados) por coleção
+        """
+        report = {}
+        for collection_name, indexes in self.collection_indexes.items():
+            report[collection_name] = await self._apply_collection(collection_name, indexes)
+        return report
+    
+    async def enable_change_stream_images(self) -> None:
+        """
+        Liga as imagens anterior/posterior usadas pelo StatsProjector.
+        
+        Chame depois de apply(): collMod exige que a coleção já exista.
+        """
+        for collection_name, options in CHANGE_STREAM_IMAGE_OPTIONS.items():
+            await self.database.command("collMod", collection_name, **options)
+    
+    async def _apply_collection(
+        self, collection_name: str, indexes: list[IndexModel]
+    ) -> list[str]:
+        collection = self.database[collection_name]
+        existing = await collection.index_information()
+        
+        missing = []
+        for index in indexes:
+            wanted = index.document
+            current = existing.get(wanted["name"])
+            
+            if current is not None:
+                if self._same_definition(wanted, current):
+                    continue
+                # Mesmo nome com outra definição: recria
+                await collection.drop_index(wanted["name"])
+            elif any(self._same_definition(wanted, info) for info in existing.values()):
+                # Já existe com outro nome (ex.: criado manualmente)
+                continue
+            
+            missing.append(index)
+        
+        if not missing:
+            return []
+        return await collection.create_indexes(missing)
+    
+    @staticmethod
+    def _same_definition(wanted: dict[str, Any], current: dict[str, Any]) -> bool:
+        """Compara chave e opções relevantes de dois índices."""
+        if list(wanted["key"].items()) != list(current["key"]):
+            return False
+        return all(
+            wanted.get(option) == current.get(option)
+            for option in _COMPARED_OPTIONS
+        )
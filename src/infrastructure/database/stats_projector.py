@@ -0,0 +1,331 @@
+"""
+Projetor de estatísticas via change streams do MongoDB.
+
+Mantém as visões lidas pelo MongoStatsRepository somando, evento a
+evento, o efeito de cada escrita:
+
+- accounts / account_balance_slots / accounts_archive: quantidade e
+  saldo por status, pela diferença entre a imagem anterior e a
+  posterior do documento (exige changeStreamPreAndPostImages, ligado
+  pelo run_stats_projector). Arquivar uma conta é uma remoção em accounts e
+  uma inserção em accounts_archive: o total não muda.
+- transactions: quantidade e valor por dia e tipo (só inserções)
+
+Os deltas de um lote e o resume token do último evento são gravados
+na MESMA transação: se o processo cair, ele retoma do token salvo sem
+contar nenhum evento duas vezes. Change streams e transações exigem
+replica set.
+"""
+
+import time
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure
+
+from .account_codec import decode_decimal
+from .mongo_stats_repository import (
+    ACCOUNTS_VIEW_ID,
+    LEDGER_DAILY_COLLECTION,
+    STATS_VIEWS_COLLECTION,
+)
+
+
+CHECKPOINTS_COLLECTION = "stats_projector_checkpoints"
+CHECKPOINT_ID = "stats"
+
+# Código do MongoDB quando o token já saiu do oplog (ChangeStreamHistoryLost)
+_HISTORY_LOST = 286
+
+_BALANCE_COLLECTIONS = ["accounts", "account_balance_slots", "accounts_archive"]
+# Coleções em que cada documento é uma conta (os slots só somam saldo)
+_ACCOUNT_COLLECTIONS = {"accounts", "accounts_archive"}
+
+# Só os eventos e campos que afetam as visões
+_WATCH_PIPELINE = [
+    {
+        "$match": {
+            "$or": [
+                {
+                    "ns.coll": {"$in": _BALANCE_COLLECTIONS},
+                    "operationType": {"$in": ["insert", "update", "replace", "delete"]},
+                },
+                {"ns.coll": "transactions", "operationType": "insert"},
+            ]
+        }
+    },
+    {
+        "$project": {
+            "ns": 1,
+            "operationType": 1,
+            "fullDocument.status": 1,
+            "fullDocument.balance": 1,
+            "fullDocument.type": 1,
+            "fullDocument.amount": 1,
+            "fullDocument.created_at": 1,
+            "fullDocumentBeforeChange.status": 1,
+            "fullDocumentBeforeChange.balance": 1,
+        }
+    },
+]
+
+
+def _totals() -> list:
+    """Acumulador [quantidade, valor]."""
+    return [0, Decimal("0")]
+
+
+class StatsProjector:
+    """
+    Consome o change stream do banco e mantém as visões agregadas.
+
+    Uso:
+        projector = StatsProjector(client, "jbank")
+        await projector.run()  # reconstrói na primeira vez, depois retoma
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        batch_size: int = 500,
+        flush_interval_ms: int = 1000,
+    ) -> None:
+        """
+        Args:
+            client: Cliente Motor compartilhado
+            database_name: Nome do banco de dados
+            batch_size: Eventos acumulados antes de gravar
+            flush_interval_ms: Tempo máximo de um evento sem ser gravado
+        """
+        self.client = client
+        self.database = self.client[database_name]
+        self.views = self.database[STATS_VIEWS_COLLECTION]
+        self.ledger_daily = self.database[LEDGER_DAILY_COLLECTION]
+        self.checkpoints = self.database[CHECKPOINTS_COLLECTION]
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.processed_events = 0
+
+        self._status_deltas: dict[str, list] = defaultdict(_totals)
+        self._daily_deltas: dict[str, dict[str, list]] = defaultdict(
+            lambda: defaultdict(_totals)
+        )
+
+    async def run(self) -> None:
+        """
+        Processa eventos indefinidamente a partir do último checkpoint.
+
+        Sem checkpoint (primeira execução), reconstrói as visões antes.
+
+        Raises:
+            RuntimeError: Se o token salvo já saiu do oplog (rode rebuild)
+        """
+        checkpoint = await self.checkpoints.find_one({"_id": CHECKPOINT_ID})
+        if not checkpoint:
+            await self.rebuild()
+            checkpoint = await self.checkpoints.find_one({"_id": CHECKPOINT_ID})
+
+        try:
+            async with self._watch(checkpoint["resume_token"]) as stream:
+                pending = 0
+                last_flush = time.monotonic()
+                while stream.alive:
+                    change = await stream.try_next()
+                    if change:
+                        self._apply(change)
+                        pending += 1
+
+                    elapsed_ms = (time.monotonic() - last_flush) * 1000
+                    if pending and (
+                        pending >= self.batch_size
+                        or change is None
+                        or elapsed_ms >= self.flush_interval_ms
+                    ):
+                        await self._flush(stream.resume_token)
+                        self.processed_events += pending
+                        pending = 0
+                        last_flush = time.monotonic()
+        except OperationFailure as e:
+            if e.code == _HISTORY_LOST:
+                raise RuntimeError(
+                    "Checkpoint fora do oplog: reconstrua as visões (--rebuild)"
+                ) from e
+            raise
+
+    async def rebuild(self) -> None:
+        """
+        Recalcula as visões do zero com agregações e grava o checkpoint.
+
+        O change stream é aberto ANTES das agregações e o checkpoint
+        aponta para esse instante, então nenhuma escrita feita durante a
+        reconstrução se perde (as que já entraram nas agregações podem
+        ser contadas de novo: prefira um momento de pouca escrita).
+        """
+        async with self._watch(None) as stream:
+            resume_token = stream.resume_token
+
+            statuses: dict[str, dict[str, Any]] = {}
+            for collection_name in _BALANCE_COLLECTIONS:
+                counts = collection_name in _ACCOUNT_COLLECTIONS
+                pipeline = [
+                    {
+                        "$group": {
+                            "_id": "$status",
+                            "count": {"$sum": 1},
+                            # $sum ignora strings: $toDecimal inclui os saldos
+                            # de documentos ainda não migrados
+                            "balance": {"$sum": {"$toDecimal": "$balance"}},
+                        }
+                    }
+                ]
+                async for group in self.database[collection_name].aggregate(pipeline):
+                    totals = statuses.setdefault(
+                        group["_id"], {"count": 0, "balance": Decimal("0")}
+                    )
+                    if counts:
+                        totals["count"] += group["count"]
+                    totals["balance"] += decode_decimal(group["balance"])
+
+            days: dict[str, dict[str, dict]] = defaultdict(dict)
+            pipeline = [
+                {
+                    "$group": {
+                        "_id": {
+                            "day": {
+                                "$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}
+                            },
+                            "type": "$type",
+                        },
+                        "count": {"$sum": 1},
+                        "amount": {"$sum": "$amount"},
+                    }
+                }
+            ]
+            # Lançamentos arquivados também contam no histórico por dia
+            pipeline.insert(0, {"$unionWith": "transactions_archive"})
+            cursor = self.database["transactions"].aggregate(pipeline, allowDiskUse=True)
+            async for group in cursor:
+                days[group["_id"]["day"]][group["_id"]["type"]] = {
+                    "count": group["count"],
+                    "amount": group["amount"],
+                }
+
+            now = datetime.now()
+
+            async def callback(session) -> None:
+                await self.views.replace_one(
+                    {"_id": ACCOUNTS_VIEW_ID},
+                    {
+                        "statuses": {
+                            status: {
+                                "count": totals["count"],
+                                "balance": Decimal128(totals["balance"]),
+                            }
+                            for status, totals in statuses.items()
+                        },
+                        "updated_at": now,
+                    },
+                    upsert=True,
+                    session=session,
+                )
+                await self.ledger_daily.delete_many({}, session=session)
+                if days:
+                    await self.ledger_daily.insert_many(
+                        [{"_id": day, "types": types} for day, types in days.items()],
+                        session=session,
+                    )
+                await self._save_checkpoint(resume_token, now, session)
+
+            async with await self.client.start_session() as session:
+                await session.with_transaction(callback)
+
+    def _watch(self, resume_token: dict | None):
+        """Change stream do banco com imagens anterior e posterior."""
+        return self.database.watch(
+            _WATCH_PIPELINE,
+            resume_after=resume_token,
+            full_document="required",
+            full_document_before_change="required",
+            max_await_time_ms=self.flush_interval_ms,
+        )
+
+    def _apply(self, change: dict) -> None:
+        """Acumula o efeito de um evento nos deltas do lote."""
+        collection_name = change["ns"]["coll"]
+        document = change.get("fullDocument")
+
+        if collection_name == "transactions":
+            day = document["created_at"].date().isoformat()
+            totals = self._daily_deltas[day][document["type"]]
+            totals[0] += 1
+            totals[1] += decode_decimal(document["amount"])
+            return
+
+        before = change.get("fullDocumentBeforeChange")
+        if before == document:
+            return  # Escrita que não mexeu em status nem saldo
+
+        counts = collection_name in _ACCOUNT_COLLECTIONS
+        if before:
+            self._move(before, -1, counts)
+        if document:
+            self._move(document, 1, counts)
+
+    def _move(self, document: dict, sign: int, counts: bool) -> None:
+        """Soma (sign=1) ou tira (sign=-1) um documento do seu status."""
+        totals = self._status_deltas[document["status"]]
+        if counts:
+            totals[0] += sign
+        totals[1] += sign * decode_decimal(document.get("balance", "0"))
+
+    async def _flush(self, resume_token: dict) -> None:
+        """Grava os deltas acumulados e o token na mesma transação."""
+        status_inc: dict[str, Any] = {}
+        for status, (count, balance) in self._status_deltas.items():
+            if count:
+                status_inc[f"statuses.{status}.count"] = count
+            if balance:
+                status_inc[f"statuses.{status}.balance"] = Decimal128(balance)
+
+        daily_incs: dict[str, dict[str, Any]] = {}
+        for day, types in self._daily_deltas.items():
+            daily_incs[day] = {}
+            for transaction_type, (count, amount) in types.items():
+                daily_incs[day][f"types.{transaction_type}.count"] = count
+                daily_incs[day][f"types.{transaction_type}.amount"] = Decimal128(amount)
+
+        now = datetime.now()
+
+        # with_transaction pode repetir o callback: ele só lê os deltas
+        async def callback(session) -> None:
+            if status_inc:
+                await self.views.update_one(
+                    {"_id": ACCOUNTS_VIEW_ID},
+                    {"$inc": status_inc, "$set": {"updated_at": now}},
+                    upsert=True,
+                    session=session,
+                )
+            for day, inc in daily_incs.items():
+                await self.ledger_daily.update_one(
+                    {"_id": day}, {"$inc": inc}, upsert=True, session=session
+                )
+            await self._save_checkpoint(resume_token, now, session)
+
+        async with await self.client.start_session() as session:
+            await session.with_transaction(callback)
+
+        self._status_deltas.clear()
+        self._daily_deltas.clear()
+
+    async def _save_checkpoint(self, resume_token: dict, now: datetime, session) -> None:
+        await self.checkpoints.update_one(
+            {"_id": CHECKPOINT_ID},
+            {"$set": {"resume_token": resume_token, "updated_at": now}},
+            upsert=True,
+            session=session,
+        )
@@ -0,0 +1,56 @@
+"""
+Unidade de trabalho com transação multi-documento do MongoDB.
+
+A sessão da transação em andamento fica num ContextVar: os
+repositórios que participam (ver `current_session()`) passam a sessão
+para as suas operações sem que ela apareça nas interfaces da camada
+de aplicação. Fora de um `run`, `current_session()` é None e as
+operações rodam como sempre.
+
+Transações exigem replica set.
+"""
+
+from contextvars import ContextVar
+from typing import Awaitable, Callable, TypeVar
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+
+from ...application.interfaces import UnitOfWork
+
+
+T = TypeVar("T")
+
+_current_session: ContextVar[AsyncIOMotorClientSession | None] = ContextVar(
+    "current_session", default=None
+)
+
+
+def current_session() -> AsyncIOMotorClientSession | None:
+    """Sessão da transação em andamento (None fora de uma unidade de trabalho)."""
+    return _current_session.get()
+
+
+class MongoUnitOfWork(UnitOfWork):
+    """
+    IMPLEMENTA a interface UnitOfWork com session.with_transaction.
+
+    with_transaction repete `work` sozinho em erros transitórios
+    (ex.: conflito de escrita com outra transação).
+    """
+
+    def __init__(self, client: AsyncIOMotorClient) -> None:
+        self.client = client
+
+    async def run(self, work: Callable[[], Awaitable[T]]) -> T:
+        if current_session() is not None:
+            return await work()  # Já dentro de uma transação: participa dela
+
+        async def callback(session: AsyncIOMotorClientSession) -> T:
+            token = _current_session.set(session)
+            try:
+                return await work()
+            finally:
+                _current_session.reset(token)
+
+        async with await self.client.start_session() as session:
+            return await session.with_transaction(callback)
@@ -0,0 +1,22 @@
+"""
+Implementações em memória (sem MongoDB nem RabbitMQ).
+
+Para testes de carga dos use cases e para subir a API localmente:
+STORAGE_BACKEND=memory e MESSAGING_BACKEND=memory.
+"""
+
+from .account_repository import InMemoryAccountRepository
+from .event_publisher import InMemoryEventPublisher
+from .report_repository import InMemoryReportRepository
+from .snapshot_repository import InMemorySnapshotRepository
+from .stats_repository import InMemoryStatsRepository
+from .transaction_repository import InMemoryTransactionRepository
+
+__all__ = [
+    "InMemoryAccountRepository",
+    "InMemoryEventPublisher",
+    "InMemoryReportRepository",
+    "InMemorySnapshotRepository",
+    "InMemoryStatsRepository",
+    "InMemoryTransactionRepository",
+]
@@ -0,0 +1,306 @@
+"""
+AccountRepository em memória.
+
+Mesmo contrato do MongoAccountRepository (versão, CPF único,
+liquidação idempotente), sem nenhuma ida à rede: serve para medir a
+vazão dos use cases isolada do banco e para subir a API localmente
+sem MongoDB.
+
+Os dados vivem só neste processo e somem quando ele termina. Como
+há uma única cópia, toda leitura é STRONG (o parâmetro `consistency`
+é aceito e ignorado).
+"""
+
+import asyncio
+from bisect import bisect_right, insort
+from collections import defaultdict, deque
+from dataclasses import replace
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from ...domain.entities import Account, AccountStatus
+from ...domain.exceptions import (
+    AccountNotActiveError,
+    AccountNotFoundError,
+    ConcurrentUpdateError,
+    DuplicateAccountError,
+    InsufficientFundsError,
+)
+from ...domain.value_objects import AccountNumber, CPF, Money
+from ...application.interfaces import (
+    AccountPage,
+    AccountRepository,
+    AccountSummary,
+    ReadConsistency,
+)
+
+# Mesmo limite de transferências lembradas por conta do MongoDB
+_APPLIED_TRANSFERS_KEPT = 1000
+
+
+class InMemoryAccountRepository(AccountRepository):
+    """
+    Contas em dicionários indexados por número e por CPF.
+    
+    IMPLEMENTA a interface AccountRepository.
+    
+    Cada escrita roda sob o lock da(s) conta(s) envolvida(s); a
+    transferência pega os dois locks sempre na mesma ordem para que
+    duas transferências opostas não se travem.
+    """
+    
+    def __init__(self) -> None:
+        self._accounts: dict[str, Account] = {}
+        self._by_cpf: dict[str, str] = {}
+        self._sorted_numbers: list[str] = []
+        self._applied_transfers: dict[str, deque[str]] = defaultdict(
+            lambda: deque(maxlen=_APPLIED_TRANSFERS_KEPT)
+        )
+        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+    
+    # ==================== LEITURAS ====================
+    # Devolvem cópias: alterar a entidade não altera o "banco"
+    
+    async def find_by_account_number(
+        self,
+        account_number: AccountNumber,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
+        account = self._accounts.get(str(account_number))
+        return replace(account) if account else None
+    
+    async def find_many_by_account_numbers(
+        self,
+        account_numbers: list[AccountNumber],
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> list[Account]:
+        return [
+            replace(self._accounts[str(number)])
+            for number in account_numbers
+            if str(number) in self._accounts
+        ]
+    
+    async def find_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> Optional[Account]:
+        account_number = self._by_cpf.get(str(cpf))
+        return replace(self._accounts[account_number]) if account_number else None
+    
+    async def exists_by_cpf(
+        self,
+        cpf: CPF,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> bool:
+        return str(cpf) in self._by_cpf
+    
+    async def list_account_numbers(
+        self,
+        after: AccountNumber | None = None,
+        limit: int = 100,
+    ) -> list[AccountNumber]:
+        start = bisect_right(self._sorted_numbers, str(after)) if after else 0
+        return [
+            AccountNumber(value=number)
+            for number in self._sorted_numbers[start:start + limit]
+        ]
+    
+    async def list_accounts(
+        self,
+        status: AccountStatus | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AccountPage:
+        """Filtra e ordena a cada chamada (suficiente para testes locais)."""
+        after = self._decode_cursor(cursor) if cursor else None
+        matches = sorted(
+            (
+                account
+                for account in self._accounts.values()
+                if (status is None or account.status == status)
+                and (created_from is None or account.created_at >= created_from)
+                and (created_to is None or account.created_at <= created_to)
+                and (after is None or (account.created_at, str(account.account_number)) > after)
+            ),
+            key=lambda account: (account.created_at, str(account.account_number)),
+        )
+        
+        page = matches[:limit]
+        next_cursor = None
+        if len(matches) > limit:
+            last = page[-1]
+            next_cursor = f"{last.created_at.isoformat()}|{last.account_number}"
+        
+        return AccountPage(
+            items=[
+                AccountSummary(
+                    account_number=str(account.account_number),
+                    holder_name=account.holder_name,
+                    status=account.status.value,
+                    balance=account.balance.amount,
+                    created_at=account.created_at,
+                )
+                for account in page
+            ],
+            next_cursor=next_cursor,
+        )
+    
+    # ==================== ESCRITAS ====================
+    
+    async def save(self, account: Account) -> None:
+        """
+        Compare-and-swap pela versão, como no MongoDB.
+        
+        Raises:
+            DuplicateAccountError: Se o CPF já pertencer a outra conta
+            ConcurrentUpdateError: Se a conta mudou desde que foi lida
+        """
+        async with self._locks[str(account.account_number)]:
+            self._store(account)
+        account.version += 1
+    
+    async def save_many(self, accounts: list[Account]) -> None:
+        """
+        Salva cada conta de forma independente (como o bulk não ordenado).
+        
+        Raises:
+            DuplicateAccountError: Se o CPF de uma conta nova já existir
+            ConcurrentUpdateError: Com as contas que mudaram desde a leitura
+        """
+        duplicate: DuplicateAccountError | None = None
+        conflicts: list[str] = []
+        for account in accounts:
+            try:
+                await self.save(account)
+            except DuplicateAccountError as e:
+                duplicate = duplicate or e
+            except ConcurrentUpdateError:
+                conflicts.append(str(account.account_number))
+        
+        if duplicate:
+            raise duplicate
+        if conflicts:
+            raise ConcurrentUpdateError(conflicts)
+    
+    async def delete(self, account_number: AccountNumber) -> None:
+        number = str(account_number)
+        async with self._locks[number]:
+            account = self._accounts.pop(number, None)
+            if account:
+                del self._by_cpf[str(account.cpf)]
+                self._sorted_numbers.remove(number)
+                self._applied_transfers.pop(number, None)
+    
+    async def apply_balance_delta(
+        self,
+        account_number: AccountNumber,
+        delta: Decimal,
+        operation_id: str | None = None,
+    ) -> Money | None:
+        """
+        Soma `delta` ao saldo sob o lock da conta.
+        
+        Com `operation_id`, uma repetição da mesma operação devolve None
+        sem alterar o saldo (marcadores da conta, como nas transferências).
+        
+        Raises:
+            AccountNotFoundError: Se a conta não existir
+            AccountNotActiveError: Se a conta não estiver ativa
+            InsufficientFundsError: Se o saldo ficaria negativo
+        """
+        number = str(account_number)
+        async with self._locks[number]:
+            if operation_id and operation_id in self._applied_transfers[number]:
+                return None
+            account = self._active_account(number)
+            self._apply(account, delta)
+            if operation_id:
+                self._applied_transfers[number].append(operation_id)
+            return account.balance
+    
+    async def settle_transfer(
+        self,
+        transfer_id: str,
+        from_account_number: AccountNumber,
+        to_account_number: AccountNumber,
+        amount: Money,
+    ) -> None:
+        """
+        Debita e credita sob os locks das duas contas.
+        
+        Idempotente por transfer_id, como no MongoDB.
+        
+        Raises:
+            AccountNotFoundError: Se alguma das contas não existir
+            AccountNotActiveError: Se alguma das contas não estiver ativa
+            InsufficientFundsError: Se a origem não tiver saldo
+        """
+        from_number = str(from_account_number)
+        to_number = str(to_account_number)
+        
+        # Ordem fixa dos locks: evita deadlock entre A->B e B->A
+        first, second = sorted((from_number, to_number))
+        async with self._locks[first], self._locks[second]:
+            if transfer_id in self._applied_transfers[from_number]:
+                return
+            
+            source = self._active_account(from_number)
+            target = self._active_account(to_number)
+            if source.balance.amount < amount.amount:
+                raise InsufficientFundsError(from_number)
+            
+            self._apply(source, -amount.amount)
+            self._apply(target, amount.amount)
+            self._applied_transfers[from_number].append(transfer_id)
+            self._applied_transfers[to_number].append(transfer_id)
+    
+    # ==================== AUXILIARES ====================
+    
+    def _store(self, account: Account) -> None:
+        """Grava uma cópia da conta com a versão seguinte."""
+        number = str(account.account_number)
+        cpf = str(account.cpf)
+        
+        stored = self._accounts.get(number)
+        if (stored.version if stored else 0) != account.version:
+            raise ConcurrentUpdateError([number])
+        if self._by_cpf.get(cpf, number) != number:
+            raise DuplicateAccountError("cpf", cpf)
+        
+        if not stored:
+            insort(self._sorted_numbers, number)
+        elif str(stored.cpf) != cpf:
+            del self._by_cpf[str(stored.cpf)]
+        
+        self._accounts[number] = replace(account, version=account.version + 1)
+        self._by_cpf[cpf] = number
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            created_at, account_number = cursor.split("|", 1)
+            return datetime.fromisoformat(created_at), account_number
+        except ValueError as e:
+            raise ValueError("Cursor inválido") from e
+    
+    def _active_account(self, number: str) -> Account:
+        account = self._accounts.get(number)
+        if not account:
+            raise AccountNotFoundError(number)
+        if account.status != AccountStatus.ACTIVE:
+            raise AccountNotActiveError(number)
+        return account
+    
+    @staticmethod
+    def _apply(account: Account, delta: Decimal) -> None:
+        """Altera o saldo da conta armazenada (versão avança junto)."""
+        if account.balance.amount + delta < 0:
+            raise InsufficientFundsError(str(account.account_number))
+        account.balance = Money(account.balance.amount + delta)
+        account.version += 1
+        account.updated_at = datetime.now()
@@ -0,0 +1,82 @@
+"""
+EventPublisher em memória.
+
+Guarda os últimos eventos publicados num ring buffer (os mais antigos
+são descartados quando ele enche) e entrega cada evento aos assinantes
+do seu tipo no próprio processo, sem broker.
+"""
+
+import asyncio
+from collections import defaultdict, deque
+from typing import Awaitable, Callable
+
+from ...domain.events import DomainEvent
+from ...application.interfaces import EventPublisher
+
+EventHandler = Callable[[dict], Awaitable[None]]
+
+
+class InMemoryEventPublisher(EventPublisher):
+    """
+    Publicador de eventos em memória.
+    
+    IMPLEMENTA a interface EventPublisher.
+    
+    Os assinantes rodam em tasks separadas: publish() não espera o
+    processamento, como numa fila de verdade.
+    """
+    
+    def __init__(self, buffer_size: int = 10_000) -> None:
+        """
+        Args:
+            buffer_size: Quantos eventos recentes ficam guardados
+        """
+        self.events: deque[DomainEvent] = deque(maxlen=buffer_size)
+        self.published = 0
+        self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
+        self._tasks: set[asyncio.Task] = set()
+    
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        Registra um assinante para um tipo de evento.
+        
+        Args:
+            event_type: Nome do evento (ex: "TransferRequested")
+            handler: Recebe o evento como dict (o mesmo do to_dict())
+        """
+        self._handlers[event_type].append(handler)
+    
+    async def publish(self, event: DomainEvent) -> None:
+        """Guarda o evento e agenda a entrega aos assinantes."""
+        self.events.append(event)
+        self.published += 1
+        
+        for handler in self._handlers.get(event.event_type, ()):
+            task = asyncio.create_task(self._deliver(handler, event.to_dict()))
+            # Referência forte até terminar (senão a task pode ser coletada)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def publish_many(self, events: list[DomainEvent]) -> None:
+        """Publica múltiplos eventos."""
+        for event in events:
+            await self.publish(event)
+    
+    async def _deliver(self, handler: EventHandler, event_data: dict) -> None:
+        try:
+            await handler(event_data)
+        except Exception as e:
+            print(f"❌ Erro ao entregar {event_data['event_type']}: {e}")
+    
+    def snapshot(self) -> dict[str, int]:
+        """Contadores do publisher."""
+        return {
+            "published": self.published,
+            "buffered": len(self.events),
+            "pending_deliveries": len(self._tasks),
+        }
+    
+    async def close(self) -> None:
+        """Espera as entregas em andamento terminarem."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
@@ -0,0 +1,90 @@
+"""
+ReportRepository em memória.
+
+Mesmos relatórios do MongoReportRepository, calculados com uma
+passada pelas contas do InMemoryAccountRepository.
+"""
+
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from ...application.interfaces import (
+    BalanceBucket,
+    OpeningRatePoint,
+    ReportPeriod,
+    ReportRepository,
+    StatusReportRow,
+)
+from .account_repository import InMemoryAccountRepository
+
+
+def _period_start(moment: datetime, period: ReportPeriod) -> datetime:
+    """Início do dia, da semana (segunda-feira) ou do mês de `moment`."""
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == ReportPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == ReportPeriod.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+class InMemoryReportRepository(ReportRepository):
+    """
+    Relatórios calculados das contas em memória.
+
+    IMPLEMENTA a interface ReportRepository.
+    """
+
+    def __init__(self, account_repository: InMemoryAccountRepository) -> None:
+        self.account_repository = account_repository
+
+    async def totals_by_status(self) -> list[StatusReportRow]:
+        totals: dict[str, list] = defaultdict(lambda: [0, Decimal("0")])
+        for account in self.account_repository._accounts.values():
+            row = totals[account.status.value]
+            row[0] += 1
+            row[1] += account.balance.amount
+
+        return [
+            StatusReportRow(
+                status=status,
+                count=count,
+                total_balance=total,
+                average_balance=total / count,
+            )
+            for status, (count, total) in sorted(totals.items())
+        ]
+
+    async def balance_distribution(self, boundaries: list[Decimal]) -> list[BalanceBucket]:
+        counts = [0] * len(boundaries)
+        totals = [Decimal("0")] * len(boundaries)
+        for account in self.account_repository._accounts.values():
+            # Faixa i: boundaries[i] <= saldo < boundaries[i + 1]
+            index = bisect_right(boundaries, account.balance.amount) - 1
+            if index >= 0:
+                counts[index] += 1
+                totals[index] += account.balance.amount
+
+        uppers = boundaries[1:] + [None]
+        return [
+            BalanceBucket(lower=lower, upper=upper, count=count, total_balance=total)
+            for lower, upper, count, total in zip(boundaries, uppers, counts, totals)
+        ]
+
+    async def opening_rate(
+        self,
+        period: ReportPeriod,
+        created_from: datetime,
+        created_to: datetime,
+    ) -> list[OpeningRatePoint]:
+        counts = Counter(
+            _period_start(account.created_at, period)
+            for account in self.account_repository._accounts.values()
+            if created_from <= account.created_at < created_to
+        )
+        return [
+            OpeningRatePoint(period_start=start, count=count)
+            for start, count in sorted(counts.items())
+        ]
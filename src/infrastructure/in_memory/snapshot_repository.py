@@ -0,0 +1,42 @@
+"""SnapshotRepository em memória."""
+
+from bisect import bisect_right, insort
+from collections import defaultdict
+from datetime import datetime
+
+from ...domain.value_objects import AccountNumber
+from ...application.interfaces import BalanceSnapshot, SnapshotRepository
+
+
+def _position(snapshot: BalanceSnapshot) -> tuple[datetime, str]:
+    position = snapshot.ledger_position
+    return position.created_at, position.transaction_id
+
+
+class InMemorySnapshotRepository(SnapshotRepository):
+    """
+    Checkpoints de cada conta ordenados pela posição no livro-razão.
+    
+    IMPLEMENTA a interface SnapshotRepository.
+    """
+    
+    def __init__(self) -> None:
+        self._by_account: dict[str, list[BalanceSnapshot]] = defaultdict(list)
+    
+    async def save(self, snapshot: BalanceSnapshot) -> None:
+        snapshots = self._by_account[str(snapshot.account_number)]
+        if any(_position(existing) == _position(snapshot) for existing in snapshots):
+            return
+        insort(snapshots, snapshot, key=_position)
+    
+    async def find_latest(
+        self,
+        account_number: AccountNumber,
+        at: datetime | None = None,
+    ) -> BalanceSnapshot | None:
+        snapshots = self._by_account.get(str(account_number), [])
+        end = len(snapshots)
+        if at:
+            # Checkpoints de lançamentos criados até `at`
+            end = bisect_right(snapshots, at, key=lambda s: s.ledger_position.created_at)
+        return snapshots[end - 1] if end else None
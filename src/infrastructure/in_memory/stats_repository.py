@@ -0,0 +1,61 @@
+"""
+StatsRepository em memória.
+
+Sem change streams: os totais são calculados na hora a partir dos
+repositórios em memória. Custa uma passada pelas contas e lançamentos
+por consulta, o que basta para subir a API localmente.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+
+from ...application.interfaces import (
+    LedgerDayTotals,
+    StatsRepository,
+    StatusTotals,
+    SystemStats,
+)
+from .account_repository import InMemoryAccountRepository
+from .transaction_repository import InMemoryTransactionRepository
+
+
+class InMemoryStatsRepository(StatsRepository):
+    """
+    Estatísticas calculadas dos repositórios em memória.
+
+    IMPLEMENTA a interface StatsRepository.
+    """
+
+    def __init__(
+        self,
+        account_repository: InMemoryAccountRepository,
+        transaction_repository: InMemoryTransactionRepository,
+    ) -> None:
+        self.account_repository = account_repository
+        self.transaction_repository = transaction_repository
+
+    async def get_stats(self, days: int = 30) -> SystemStats:
+        by_status: dict[str, StatusTotals] = defaultdict(StatusTotals)
+        for account in self.account_repository._accounts.values():
+            totals = by_status[account.status.value]
+            totals.count += 1
+            totals.balance += account.balance.amount
+
+        by_day: dict = defaultdict(lambda: defaultdict(lambda: (0, Decimal("0"))))
+        for entries in self.transaction_repository._by_account.values():
+            for transaction in entries:
+                day_totals = by_day[transaction.created_at.date()]
+                count, amount = day_totals[transaction.type.value]
+                day_totals[transaction.type.value] = (
+                    count + 1, amount + transaction.amount.amount
+                )
+
+        return SystemStats(
+            accounts_by_status=dict(by_status),
+            ledger_days=[
+                LedgerDayTotals(day=day, by_type=dict(by_day[day]))
+                for day in sorted(by_day, reverse=True)[:days]
+            ],
+            updated_at=datetime.now(),
+        )
@@ -0,0 +1,99 @@
+"""
+TransactionRepository em memória.
+
+Lançamentos de cada conta numa lista ordenada por (created_at, id),
+a mesma ordem do índice do MongoDB.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from ...domain.entities import Transaction
+from ...domain.value_objects import AccountNumber
+from ...application.interfaces import (
+    LedgerPosition,
+    ReadConsistency,
+    TransactionPage,
+    TransactionRepository,
+)
+
+
+def _position(transaction: Transaction) -> tuple[datetime, str]:
+    return transaction.created_at, transaction.id
+
+
+class InMemoryTransactionRepository(TransactionRepository):
+    """
+    Livro-razão em memória.
+    
+    IMPLEMENTA a interface TransactionRepository.
+    """
+    
+    def __init__(self) -> None:
+        self._by_account: dict[str, list[Transaction]] = defaultdict(list)
+        self._ids: set[str] = set()
+    
+    async def save(self, transaction: Transaction) -> None:
+        if transaction.id in self._ids:
+            return
+        self._ids.add(transaction.id)
+        insort(self._by_account[str(transaction.account_number)], transaction, key=_position)
+    
+    async def save_many(self, transactions: list[Transaction]) -> None:
+        for transaction in transactions:
+            await self.save(transaction)
+    
+    async def exists(self, transaction_id: str) -> bool:
+        return transaction_id in self._ids
+    
+    async def find_page_by_account(
+        self,
+        account_number: AccountNumber,
+        limit: int,
+        cursor: str | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> TransactionPage:
+        """Mais recentes primeiro; o cursor é a posição do último item."""
+        entries = self._by_account.get(str(account_number), [])
+        end = len(entries)
+        if cursor:
+            end = bisect_left(entries, self._decode_cursor(cursor), key=_position)
+        
+        items = entries[max(end - limit, 0):end][::-1]
+        next_cursor = None
+        if end > limit:
+            next_cursor = self._encode_cursor(items[-1])
+        return TransactionPage(items=items, next_cursor=next_cursor)
+    
+    async def stream_by_account(
+        self,
+        account_number: AccountNumber,
+        batch_size: int = 1000,
+        after: LedgerPosition | None = None,
+        until: datetime | None = None,
+        consistency: ReadConsistency = ReadConsistency.STRONG,
+    ) -> AsyncIterator[Transaction]:
+        entries = self._by_account.get(str(account_number), [])
+        start = 0
+        if after:
+            start = bisect_right(
+                entries, (after.created_at, after.transaction_id), key=_position
+            )
+        for transaction in entries[start:]:
+            if until and transaction.created_at > until:
+                return
+            yield transaction
+    
+    @staticmethod
+    def _encode_cursor(transaction: Transaction) -> str:
+        return f"{transaction.created_at.isoformat()}|{transaction.id}"
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            created_at, transaction_id = cursor.split("|", 1)
+            return datetime.fromisoformat(created_at), transaction_id
+        except ValueError as e:
+            raise ValueError("Cursor inválido") from e
@@ -1,9 +1,19 @@
 """Implementações de mensageria."""
 
+from .buffered_event_publisher import BufferedEventPublisher
+from .event_codec import EventCodec
 from .rabbitmq_event_publisher import RabbitMQEventPublisher
+from .topology import QueueSpec, TopologyManager, build_topology
 from .transfer_worker import TransferWorker
+from .cache_invalidation_consumer import CacheInvalidationConsumer
 
 __all__ = [
+    "BufferedEventPublisher",
+    "CacheInvalidationConsumer",
+    "EventCodec",
+    "QueueSpec",
     "RabbitMQEventPublisher",
+    "TopologyManager",
     "TransferWorker",
+    "build_topology",
 ]
@@ -0,0 +1,258 @@
+"""
+Decorator de EventPublisher que publica em segundo plano, em lotes.
+
+publish() só coloca o evento num buffer em memória e retorna: a
+latência do broker sai do caminho da requisição HTTP. Uma task de
+fundo esvazia o buffer com publish_many() quando junta `batch_size`
+eventos ou quando o evento mais antigo espera `flush_interval_ms`.
+
+O buffer é limitado. Cheio, publish() espera uma vaga (overflow
+"block": a lentidão do broker volta como backpressure para quem
+publica) ou descarta o evento e conta em `rejected` (overflow "drop").
+publish() nunca falha por falta de vaga: quem publica já gravou a
+mudança (ex.: o depósito), e um erro aqui viraria um 500 para uma
+operação concluída, que o cliente repetiria.
+
+Eventos de um lote que o broker recusou são republicados depois de
+`retry_delay_ms`, então podem chegar depois de eventos mais novos.
+Depois de `max_flush_attempts` tentativas o lote é descartado e
+contado em `dropped` (senão um broker fora do ar travaria o flush
+para sempre, com o buffer cheio).
+
+ATENÇÃO: um evento aceito pelo buffer ainda não está no broker. Se o
+processo morrer antes do flush, ele se perde; no shutdown normal,
+close() publica tudo que ficou pendente.
+
+Por isso comandos não passam pelo buffer: TransferRequested é o único
+registro de uma transferência aceita (a API responde 202 e o worker
+liquida a partir dele). Ele é publicado direto no publicador de
+dentro, e uma falha do broker sobe para quem publicou antes da
+resposta, em vez de sumir num descarte. Só notificações (eventos que
+descrevem uma mudança já gravada) podem ser descartadas.
+"""
+
+import asyncio
+import time
+
+from ...domain.events import DomainEvent
+from ...application.interfaces import EventPublishError, EventPublisher
+
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+# Comandos: publicados direto, nunca descartados
+COMMAND_EVENT_TYPES = ("TransferRequested",)
+
+
+class BufferedEventPublisher(EventPublisher):
+    """
+    Publicador com buffer limitado e flush em lote.
+
+    IMPLEMENTA a interface EventPublisher envolvendo outra implementação.
+
+    Uso:
+        publisher = BufferedEventPublisher(rabbitmq_publisher, max_size=10_000)
+        await publisher.start()
+        ...
+        await publisher.close()  # Publica o que restou e fecha o de dentro
+    """
+
+    def __init__(
+        self,
+        publisher: EventPublisher,
+        max_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 50,
+        overflow: str = "block",
+        retry_delay_ms: int = 1000,
+        max_flush_attempts: int = 5,
+        command_event_types: tuple[str, ...] = COMMAND_EVENT_TYPES,
+    ) -> None:
+        """
+        Args:
+            publisher: Publicador que envia os lotes ao broker
+            max_size: Máximo de eventos aguardando publicação
+            batch_size: Eventos por publish_many
+            flush_interval_ms: Espera máxima de um evento no buffer
+            overflow: "block" (espera vaga) ou "drop" (descarta e conta)
+            retry_delay_ms: Espera antes de republicar os eventos de um lote que falhou
+            max_flush_attempts: Tentativas por lote antes de descartá-lo
+            command_event_types: Eventos publicados direto, sem buffer
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow deve ser um de {OVERFLOW_POLICIES}")
+        if max_size < 1 or batch_size < 1 or max_flush_attempts < 1:
+            raise ValueError("max_size, batch_size e max_flush_attempts devem ser no mínimo 1")
+
+        self.publisher = publisher
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.overflow = overflow
+        self.retry_delay = retry_delay_ms / 1000
+        self.max_flush_attempts = max_flush_attempts
+        self.command_event_types = frozenset(command_event_types)
+
+        self._queue: asyncio.Queue[DomainEvent] = asyncio.Queue(maxsize=max_size)
+        self._batch_ready = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self._closing = False
+
+        self.enqueued = 0
+        self.published = 0
+        self.commands = 0
+        self.rejected = 0
+        self.blocked = 0
+        self.dropped = 0
+        self.failed_flushes = 0
+        self.flushes = 0
+        self._flush_total_ms = 0.0
+        self._flush_max_ms = 0.0
+        self._last_flush_ms = 0.0
+
+    async def start(self) -> None:
+        """Inicia a task de flush. Deve ser chamado uma vez, no startup."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run())
+
+    async def publish(self, event: DomainEvent) -> None:
+        """
+        Coloca o evento no buffer (comandos vão direto ao broker).
+
+        Com overflow "drop" e o buffer cheio, o evento é descartado (e
+        contado em `rejected`) em vez de falhar.
+
+        Raises:
+            Exception: Só para comandos, o erro do publicador de dentro
+        """
+        if self._closing:
+            raise RuntimeError("Publisher fechado: não aceita novos eventos")
+
+        if event.event_type in self.command_event_types:
+            await self.publisher.publish(event)
+            self.commands += 1
+            return
+
+        if self._queue.full():
+            if self.overflow == "drop":
+                self.rejected += 1
+                print(f"⚠️ Buffer de eventos cheio: {event.event_type} descartado")
+                return
+            self.blocked += 1
+        await self._queue.put(event)
+        self.enqueued += 1
+
+        # Já tem um lote completo: não espera o intervalo
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    async def publish_many(self, events: list[DomainEvent]) -> None:
+        """Coloca os eventos no buffer, na ordem."""
+        for event in events:
+            await self.publish(event)
+
+    async def close(self) -> None:
+        """
+        Publica todos os eventos pendentes e fecha o publicador de dentro.
+
+        Durante o fechamento um lote que falha não é repetido: os eventos
+        são descartados e contados em `dropped`.
+        """
+        self._closing = True
+        self._batch_ready.set()
+        if self._flusher is None:
+            # Nunca iniciado: publica o que houver aqui mesmo
+            while not self._queue.empty():
+                size = min(self.batch_size, self._queue.qsize())
+                await self._flush([self._queue.get_nowait() for _ in range(size)])
+        else:
+            if not self._flusher.done():
+                await self._queue.join()
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        await self.publisher.close()
+
+    def snapshot(self) -> dict:
+        """Profundidade do buffer e latência dos flushes (exibidos em GET /metrics)."""
+        return {
+            "depth": self._queue.qsize(),
+            "capacity": self.max_size,
+            "overflow": self.overflow,
+            "enqueued": self.enqueued,
+            "published": self.published,
+            "commands": self.commands,
+            "rejected": self.rejected,
+            "blocked": self.blocked,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "flush_last_ms": round(self._last_flush_ms, 3),
+            "flush_avg_ms": round(self._flush_total_ms / self.flushes, 3) if self.flushes else 0.0,
+            "flush_max_ms": round(self._flush_max_ms, 3),
+        }
+
+    async def _run(self) -> None:
+        """Laço de fundo: junta um lote (por tamanho ou tempo) e publica."""
+        while True:
+            first = await self._queue.get()
+
+            # Espera completar o lote, no máximo flush_interval
+            if not self._closing and self._queue.qsize() + 1 < self.batch_size:
+                self._batch_ready.clear()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = [first]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[DomainEvent]) -> None:
+        """
+        Publica o lote; os eventos que falharem são republicados depois,
+        até max_flush_attempts tentativas.
+        """
+        pending = batch
+        for attempt in range(1, self.max_flush_attempts + 1):
+            started = time.perf_counter()
+            try:
+                await self.publisher.publish_many(pending)
+                failed: list[DomainEvent] = []
+            except EventPublishError as e:
+                failed = e.failed_events
+                error: Exception = e
+            except Exception as e:
+                failed = pending
+                error = e
+            self._record_flush((time.perf_counter() - started) * 1000)
+            self.published += len(pending) - len(failed)
+
+            if not failed:
+                return
+
+            self.failed_flushes += 1
+            pending = failed
+            if self._closing or attempt == self.max_flush_attempts:
+                break
+
+            print(f"⚠️ {len(failed)} evento(s) não publicado(s), nova tentativa: {error}")
+            await asyncio.sleep(self.retry_delay)
+
+        self.dropped += len(pending)
+        print(f"❌ {len(pending)} evento(s) descartado(s): {error}")
+
+    def _record_flush(self, elapsed_ms: float) -> None:
+        self.flushes += 1
+        self._last_flush_ms = elapsed_ms
+        self._flush_total_ms += elapsed_ms
+        self._flush_max_ms = max(self._flush_max_ms, elapsed_ms)
@@ -0,0 +1,85 @@
+"""
+Consumidor de eventos que invalida o cache de contas.
+
+Cada processo da API tem o seu próprio cache, então cada um cria uma
+fila exclusiva (apagada quando o processo cai) ligada ao exchange de
+eventos. Assim TODOS os processos recebem cada evento e descartam a
+conta alterada, inclusive as alterações feitas pelo worker.
+
+Se a conexão cair, eventos podem ser perdidos nesse intervalo: o TTL
+do cache limita por quanto tempo uma conta fica desatualizada.
+"""
+
+from aio_pika import connect_robust, ExchangeType
+from aio_pika.abc import AbstractIncomingMessage, AbstractRobustConnection
+
+from ..cache import CachingAccountRepository
+from .event_codec import EventCodec
+
+
+# Eventos que alteram saldo ou status de uma conta
+INVALIDATING_ROUTING_KEYS = (
+    "money.deposited",
+    "money.withdrawn",
+    "transfer.completed",
+    "account.blocked",
+)
+
+# Campos dos eventos que carregam números de conta
+_ACCOUNT_FIELDS = ("account_number", "from_account", "to_account")
+
+
+class CacheInvalidationConsumer:
+    """Escuta eventos de conta e invalida o cache local."""
+    
+    def __init__(
+        self,
+        rabbitmq_url: str,
+        exchange_name: str,
+        repository: CachingAccountRepository,
+    ) -> None:
+        """
+        Args:
+            rabbitmq_url: URL do RabbitMQ
+            exchange_name: Nome do exchange de eventos
+            repository: Repositório com cache a invalidar
+        """
+        self.rabbitmq_url = rabbitmq_url
+        self.exchange_name = exchange_name
+        self.repository = repository
+        self.connection: AbstractRobustConnection | None = None
+    
+    async def start(self) -> None:
+        """Cria a fila exclusiva, faz os bindings e começa a consumir."""
+        self.connection = await connect_robust(self.rabbitmq_url)
+        channel = await self.connection.channel()
+        
+        exchange = await channel.declare_exchange(
+            self.exchange_name,
+            ExchangeType.TOPIC,
+            durable=True,
+        )
+        
+        # Nome gerado pelo broker, exclusiva deste processo
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        for routing_key in INVALIDATING_ROUTING_KEYS:
+            await queue.bind(exchange, routing_key=routing_key)
+        
+        await queue.consume(self._on_event, no_ack=True)
+    
+    async def _on_event(self, message: AbstractIncomingMessage) -> None:
+        """Invalida as contas citadas no evento."""
+        try:
+            event_data = EventCodec.decode(message.body, message.content_type)
+        except ValueError:
+            return
+        
+        for field in _ACCOUNT_FIELDS:
+            account_number = event_data.get(field)
+            if account_number:
+                self.repository.invalidate(account_number)
+    
+    async def close(self) -> None:
+        """Fecha a conexão (a fila exclusiva some junto)."""
+        if self.connection:
+            await self.connection.close()
@@ -0,0 +1,213 @@
+"""
+Codec dos eventos publicados no broker.
+
+Antes, cada publicação percorria a cadeia de `to_dict()` (um `super()`
+por classe), serializava com `json.dumps(..., default=str)` e calculava
+a routing key com uma regex. O EventCodec faz esse trabalho UMA vez por
+classe de evento, no registro: guarda a routing key, o nome da classe
+e a lista de campos. Por evento sobra só ler os atributos e serializar.
+
+Formatos no fio (escolhidos pelo content_type da mensagem):
+- application/json: o mesmo conteúdo de sempre (usa orjson se instalado)
+- application/msgpack: binário, menor e mais rápido (requer msgpack)
+
+Quem consome decide pelo content_type de cada mensagem, então API e
+worker podem trocar de formato em momentos diferentes.
+
+Cada mensagem leva o header `x-schema-version` com a versão do payload
+da classe (1 até alguém mudar os campos de um evento).
+"""
+
+import dataclasses
+import json
+import re
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from ...domain import events as domain_events
+from ...domain.events import DomainEvent
+
+try:
+    import orjson
+except ImportError:  # Opcional: sem ele o JSON sai pelo módulo json
+    orjson = None
+
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+SCHEMA_VERSION_HEADER = "x-schema-version"
+
+# Formato configurável (EVENT_WIRE_FORMAT) -> content_type
+WIRE_FORMATS = {
+    "json": JSON_CONTENT_TYPE,
+    "msgpack": MSGPACK_CONTENT_TYPE,
+}
+
+
+def routing_key_for(event_type: str) -> str:
+    """
+    Converte tipo do evento para routing key.
+
+    AccountCreated -> account.created
+    MoneyDeposited -> money.deposited
+    TransferRequested -> transfer.requested
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", ".", event_type).lower()
+
+
+class EventSpec(NamedTuple):
+    """O que o codec sabe de uma classe de evento (calculado no registro)."""
+
+    event_class: type[DomainEvent]
+    event_type: str
+    routing_key: str
+    fields: tuple[str, ...]  # Na ordem do to_dict()
+    init_fields: frozenset[str]  # Aceitos pelo construtor
+    schema_version: int
+
+
+class EncodedEvent(NamedTuple):
+    """Evento pronto para virar mensagem AMQP."""
+
+    body: bytes
+    content_type: str
+    routing_key: str
+    event_type: str
+    headers: dict[str, Any]
+
+
+def _msgpack():
+    """Importa o msgpack só quando o formato binário é usado."""
+    try:
+        import msgpack
+    except ImportError as e:
+        raise RuntimeError(
+            "Formato msgpack requer o pacote msgpack (pip install msgpack)"
+        ) from e
+    return msgpack
+
+
+class EventCodec:
+    """
+    Registro de classes de evento e serialização no formato escolhido.
+
+    Uso:
+        codec = EventCodec("msgpack")
+        encoded = codec.encode(event)       # body, content_type, routing key...
+        data = codec.decode(body, content_type)  # dict igual ao to_dict()
+        event = codec.to_event(data)        # de volta à classe do evento
+    """
+
+    def __init__(self, wire_format: str = "json") -> None:
+        """
+        Args:
+            wire_format: "json" ou "msgpack" (formato das mensagens publicadas)
+        """
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"wire_format deve ser um de {tuple(WIRE_FORMATS)}")
+
+        self.wire_format = wire_format
+        self.content_type = WIRE_FORMATS[wire_format]
+        self._specs: dict[type[DomainEvent], EventSpec] = {}
+        self._by_type: dict[str, EventSpec] = {}
+
+        # Falha no startup, não na primeira publicação
+        self._packb = _msgpack().packb if wire_format == "msgpack" else None
+
+        for name in domain_events.__all__:
+            event_class = getattr(domain_events, name)
+            if event_class is not DomainEvent:
+                self.register(event_class)
+
+    def register(self, event_class: type[DomainEvent], schema_version: int = 1) -> EventSpec:
+        """
+        Registra (ou re-registra com outra versão) uma classe de evento.
+
+        Os campos são os do dataclass, que são as chaves do to_dict().
+        """
+        event_type = event_class.__name__
+        spec = EventSpec(
+            event_class=event_class,
+            event_type=event_type,
+            routing_key=routing_key_for(event_type),
+            fields=tuple(field.name for field in dataclasses.fields(event_class)),
+            init_fields=frozenset(
+                field.name for field in dataclasses.fields(event_class) if field.init
+            ),
+            schema_version=schema_version,
+        )
+        self._specs[event_class] = spec
+        self._by_type[event_type] = spec
+        return spec
+
+    def spec(self, event: DomainEvent) -> EventSpec:
+        """Spec da classe do evento (registra na hora uma classe desconhecida)."""
+        spec = self._specs.get(type(event))
+        if spec is None:
+            spec = self.register(type(event))
+        return spec
+
+    def routing_key(self, event: DomainEvent) -> str:
+        return self.spec(event).routing_key
+
+    def encode(self, event: DomainEvent) -> EncodedEvent:
+        """Evento -> corpo no formato configurado, com routing key e headers."""
+        spec = self.spec(event)
+        data = {name: getattr(event, name) for name in spec.fields}
+        data["occurred_at"] = str(data["occurred_at"])
+
+        if self._packb is not None:
+            body = self._packb(data)
+        elif orjson is not None:
+            body = orjson.dumps(data)
+        else:
+            body = json.dumps(data).encode()
+
+        return EncodedEvent(
+            body=body,
+            content_type=self.content_type,
+            routing_key=spec.routing_key,
+            event_type=spec.event_type,
+            headers={SCHEMA_VERSION_HEADER: spec.schema_version},
+        )
+
+    @staticmethod
+    def decode(body: bytes, content_type: str | None = None) -> dict[str, Any]:
+        """
+        Corpo da mensagem -> dict (as chaves do to_dict()).
+
+        O formato vem do content_type da MENSAGEM, não da configuração
+        local. Sem content_type, assume JSON (mensagens antigas).
+
+        Raises:
+            ValueError: Corpo inválido para o formato
+        """
+        if content_type == MSGPACK_CONTENT_TYPE:
+            try:
+                data = _msgpack().unpackb(body)
+            except (ValueError, TypeError) as e:  # Erros do msgpack herdam de ValueError
+                raise ValueError(f"Corpo msgpack inválido: {e}") from e
+        elif orjson is not None:
+            data = orjson.loads(body)  # orjson.JSONDecodeError herda de ValueError
+        else:
+            data = json.loads(body)
+
+        if not isinstance(data, dict):
+            raise ValueError("Corpo do evento deve ser um objeto")
+        return data
+
+    def to_event(self, data: dict[str, Any]) -> DomainEvent:
+        """
+        Dict decodificado -> instância da classe do evento.
+
+        Raises:
+            ValueError: event_type desconhecido
+        """
+        spec = self._by_type.get(data.get("event_type"))
+        if spec is None:
+            raise ValueError(f"Tipo de evento desconhecido: {data.get('event_type')}")
+
+        values = {key: value for key, value in data.items() if key in spec.init_fields}
+        if isinstance(values.get("occurred_at"), str):
+            values["occurred_at"] = datetime.fromisoformat(values["occurred_at"])
+        return spec.event_class(**values)
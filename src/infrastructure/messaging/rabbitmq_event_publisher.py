@@ -2,14 +2,24 @@
 Implementação do EventPublisher usando RabbitMQ.
 
 aio-pika é um cliente assíncrono para RabbitMQ/AMQP.
+
+Com publisher confirms (padrão), o broker confirma (ack) ou recusa
+(nack) cada mensagem. publish() espera a confirmação da sua mensagem;
+publish_many() envia várias sem esperar e aguarda as confirmações
+juntas, com no máximo `confirm_window` mensagens pendentes.
+
+Serialização, routing key e headers vêm do EventCodec (ver
+event_codec.py): JSON por padrão, msgpack com wire_format="msgpack".
 """
 
-import json
+import asyncio
 from aio_pika import connect_robust, Message, ExchangeType
-from aio_pika.abc import AbstractConnection, AbstractChannel, AbstractExchange
+from aio_pika.abc import AbstractRobustConnection, AbstractChannel
+from aio_pika.pool import Pool
 
 from ...domain.events import DomainEvent
-from ...application.interfaces import EventPublisher
+from ...application.interfaces import EventPublishError, EventPublisher
+from .event_codec import EventCodec
 
 
 class RabbitMQEventPublisher(EventPublisher):
@@ -17,93 +27,170 @@ class RabbitMQEventPublisher(EventPublisher):
     Publicador de eventos usando RabbitMQ.
     
     IMPLEMENTA a interface EventPublisher.
+    
+    Deve ser criado UMA vez por processo: mantém uma conexão robusta
+    (reconecta sozinha se cair) e um pool limitado de canais, para que
+    publicações concorrentes não disputem o mesmo canal.
     """
     
-    def __init__(self, rabbitmq_url: str, exchange_name: str) -> None:
+    def __init__(
+        self,
+        rabbitmq_url: str,
+        exchange_name: str,
+        channel_pool_size: int = 10,
+        publisher_confirms: bool = True,
+        confirm_window: int = 256,
+        codec: EventCodec | None = None,
+    ) -> None:
         """
         Inicializa configuração do RabbitMQ.
         
         Args:
             rabbitmq_url: URL de conexão do RabbitMQ
             exchange_name: Nome do exchange
+            channel_pool_size: Máximo de canais abertos para publicação
+            publisher_confirms: Esperar a confirmação do broker (sem ela,
+                publicar só garante que a mensagem foi escrita no socket)
+            confirm_window: Máximo de mensagens sem confirmação num publish_many
+            codec: Serializador dos eventos (padrão: JSON)
         """
+        if confirm_window < 1:
+            raise ValueError("confirm_window deve ser no mínimo 1")
+        
         self.rabbitmq_url = rabbitmq_url
         self.exchange_name = exchange_name
-        self.connection: AbstractConnection | None = None
-        self.channel: AbstractChannel | None = None
-        self.exchange: AbstractExchange | None = None
+        self.channel_pool_size = channel_pool_size
+        self.publisher_confirms = publisher_confirms
+        self.confirm_window = confirm_window
+        self.codec = codec or EventCodec()
+        self.connection: AbstractRobustConnection | None = None
+        self.channel_pool: Pool[AbstractChannel] | None = None
     
     async def connect(self) -> None:
         """
-        Conecta ao RabbitMQ e cria exchange.
+        Conecta ao RabbitMQ, declara o exchange e cria o pool de canais.
         
-        IMPORTANTE: Deve ser chamado antes de publicar eventos!
+        IMPORTANTE: Deve ser chamado uma vez (no startup) antes de publicar eventos!
         """
-        # Conexão robusta (reconecta automaticamente se cair)
+        # Conexão robusta (reconecta automaticamente se cair,
+        # e restaura os canais abertos junto com ela)
         self.connection = await connect_robust(self.rabbitmq_url)
         
-        # Canal de comunicação
-        self.channel = await self.connection.channel()
+        # Exchange do tipo "topic" (permite routing complexo),
+        # declarado uma única vez no startup
+        channel = await self.connection.channel()
+        try:
+            await channel.declare_exchange(
+                self.exchange_name,
+                ExchangeType.TOPIC,  # Tipo: topic (permite padrões)
+                durable=True,  # Persiste se RabbitMQ reiniciar
+            )
+        finally:
+            await channel.close()
         
-        # Exchange do tipo "topic" (permite routing complexo)
-        self.exchange = await self.channel.declare_exchange(
-            self.exchange_name,
-            ExchangeType.TOPIC,  # Tipo: topic (permite padrões)
-            durable=True,  # Persiste se RabbitMQ reiniciar
-        )
+        # Canais são criados sob demanda até o limite do pool
+        self.channel_pool = Pool(self._open_channel, max_size=self.channel_pool_size)
+    
+    async def _open_channel(self) -> AbstractChannel:
+        """Abre um novo canal para o pool."""
+        return await self.connection.channel(publisher_confirms=self.publisher_confirms)
     
     async def publish(self, event: DomainEvent) -> None:
         """
         Publica um evento no RabbitMQ.
         
-        O evento é convertido para JSON e enviado para o exchange.
+        O evento é serializado pelo codec e enviado para o exchange.
         """
-        if not self.exchange:
+        if not self.channel_pool:
             raise RuntimeError("Not connected to RabbitMQ. Call connect() first!")
         
-        # Converte evento para dict
-        event_dict = event.to_dict()
-        
-        # Serializa para JSON
-        event_json = json.dumps(event_dict, default=str)
-        
-        # Cria mensagem
-        message = Message(
-            body=event_json.encode(),  # Body em bytes
-            content_type="application/json",
-            delivery_mode=2,  # Persistente (não perde se RabbitMQ cair)
-        )
-        
-        # Routing key baseado no tipo do evento
+        # Routing key baseado no tipo do evento, calculada no registro do codec
         # Ex: "AccountCreated" -> routing key = "account.created"
-        routing_key = self._get_routing_key(event.event_type)
+        message, routing_key = self._build_message(event)
         
-        # Publica no exchange
-        await self.exchange.publish(
-            message,
-            routing_key=routing_key,
-        )
+        # Pega um canal livre do pool (espera se todos estiverem em uso)
+        async with self.channel_pool.acquire() as channel:
+            exchange = await self._exchange(channel)
+            
+            # Publica no exchange (com confirms, espera o ack do broker)
+            await exchange.publish(
+                message,
+                routing_key=routing_key,
+            )
     
     async def publish_many(self, events: list[DomainEvent]) -> None:
-        """Publica múltiplos eventos."""
-        for event in events:
-            await self.publish(event)
-    
-    def _get_routing_key(self, event_type: str) -> str:
         """
-        Converte tipo do evento para routing key.
+        Publica vários eventos num único canal, sem esperar um a um.
+        
+        As mensagens saem na ordem da lista e até `confirm_window` ficam
+        aguardando confirmação ao mesmo tempo; as confirmações são
+        aguardadas juntas no final. Um nack não interrompe o lote.
         
-        AccountCreated -> account.created
-        MoneyDeposited -> money.deposited
-        TransferRequested -> transfer.requested
+        Raises:
+            EventPublishError: Com os eventos recusados (os demais foram publicados)
         """
-        # Converte de PascalCase para snake_case
-        # e adiciona pontos entre palavras
-        import re
-        snake_case = re.sub(r'(?<!^)(?=[A-Z])', '_', event_type).lower()
-        return snake_case.replace('_', '.')
+        if not self.channel_pool:
+            raise RuntimeError("Not connected to RabbitMQ. Call connect() first!")
+        if not events:
+            return
+        
+        window = asyncio.Semaphore(self.confirm_window)
+        pending: list[asyncio.Task] = []
+        
+        async with self.channel_pool.acquire() as channel:
+            exchange = await self._exchange(channel)
+            try:
+                for event in events:
+                    # Janela cheia: espera a confirmação mais antiga liberar vaga
+                    await window.acquire()
+                    message, routing_key = self._build_message(event)
+                    task = asyncio.create_task(
+                        exchange.publish(message, routing_key=routing_key)
+                    )
+                    task.add_done_callback(lambda _: window.release())
+                    pending.append(task)
+                
+                results = await asyncio.gather(*pending, return_exceptions=True)
+            except BaseException:
+                for task in pending:
+                    task.cancel()
+                raise
+        
+        failed = [
+            (event, result)
+            for event, result in zip(events, results)
+            if isinstance(result, BaseException)
+        ]
+        if failed:
+            raise EventPublishError(
+                [event for event, _ in failed], [error for _, error in failed]
+            )
+    
+    async def _exchange(self, channel: AbstractChannel):
+        """Referência ao exchange no canal (reabre o canal se preciso)."""
+        # Canal fechado por erro de protocolo: reabre antes de usar
+        if channel.is_closed:
+            await channel.reopen()
+        
+        # Exchange já foi declarado no connect(): apenas referência local,
+        # sem ida ao broker
+        return await channel.get_exchange(self.exchange_name, ensure=False)
+    
+    def _build_message(self, event: DomainEvent) -> tuple[Message, str]:
+        """Evento -> (mensagem AMQP persistente, routing key)."""
+        encoded = self.codec.encode(event)
+        message = Message(
+            body=encoded.body,
+            content_type=encoded.content_type,
+            headers=encoded.headers,  # x-schema-version
+            type=encoded.event_type,
+            delivery_mode=2,  # Persistente (não perde se RabbitMQ cair)
+        )
+        return message, encoded.routing_key
     
     async def close(self) -> None:
-        """Fecha conexão com RabbitMQ."""
+        """Fecha os canais do pool e a conexão com RabbitMQ."""
+        if self.channel_pool:
+            await self.channel_pool.close()
         if self.connection:
             await self.connection.close()
\ No newline at end of file
@@ -3,18 +3,57 @@ Worker que processa transferências assincronamente.
 
 Este worker escuta a fila de transferências no RabbitMQ,
 processa cada transferência e publica o resultado.
+
+Os lançamentos do livro-razão (saída e entrada de cada transferência)
+são acumulados e gravados em lote com um único insert_many. A mensagem
+só recebe ack depois que seus lançamentos foram gravados; se o lote
+falhar, as mensagens voltam para a fila (a liquidação é idempotente e
+os ids dos lançamentos são determinísticos, então o reprocessamento
+não duplica nada).
+
+Só recusas de domínio (mensagem inválida, conta inexistente ou inativa,
+saldo insuficiente) viram TransferFailed. Um erro de infraestrutura no
+meio da liquidação devolve a mensagem à fila: o dinheiro pode já ter
+saído da origem, e a reentrega completa a transferência. As devoluções
+são contadas (header x-retry-count); esgotadas as tentativas, a mensagem
+vai para a dead-letter <fila>.dlq em vez de girar para sempre.
+
+Repositórios e publisher são injetados: com as implementações em
+memória o worker roda dentro do processo da API, assinando
+TransferRequested direto no publisher (ver handle_transfer_requested).
 """
 
-import json
 import asyncio
-from aio_pika import connect_robust, ExchangeType
+from decimal import InvalidOperation
+from aio_pika import connect_robust, ExchangeType, Message
 from aio_pika.abc import AbstractIncomingMessage
 
+from ...domain.entities import Transaction, TransactionStatus, TransactionType
 from ...domain.value_objects import AccountNumber, Money
 from ...domain.events import TransferCompleted, TransferFailed
-from ..database.mongo_account_repository import MongoAccountRepository
-from .rabbitmq_event_publisher import RabbitMQEventPublisher
+from ...domain.exceptions import (
+    AccountNotActiveError,
+    AccountNotFoundError,
+    InsufficientFundsError,
+)
+from ...application.interfaces import (
+    AccountRepository,
+    EventPublisher,
+    TransactionRepository,
+)
+from ...application.services import RetryPolicy, use_case_scope
+from .event_codec import EventCodec
+
 
+# Recusas definitivas: repetir a mensagem não mudaria o resultado
+_SETTLEMENT_REFUSALS = (AccountNotFoundError, AccountNotActiveError, InsufficientFundsError)
+
+# Espera antes de devolver à fila uma mensagem que falhou por infraestrutura
+# (evita girar a mesma mensagem sem parar enquanto o banco está fora)
+_REQUEUE_DELAY_SECONDS = 1.0
+
+# Header com o número de vezes que a mensagem já voltou para a fila
+_RETRY_COUNT_HEADER = "x-retry-count"
 
 class TransferWorker:
     """
@@ -23,51 +62,82 @@ class TransferWorker:
     Fluxo:
     1. Escuta fila "transfers"
     2. Recebe TransferRequested
-    3. Busca contas no MongoDB
-    4. Executa transferência (saque + depósito)
-    5. Salva ambas as contas
-    6. Publica TransferCompleted ou TransferFailed
+    3. Liquida a transferência no repositório (saque + depósito juntos)
+    4. Publica TransferCompleted ou TransferFailed (recusa de domínio)
+    5. Grava os lançamentos no livro-razão (em lote) e dá ack
+    
+    Erro de infraestrutura: a mensagem volta para o fim da fila (a
+    reentrega retoma a liquidação), até max_delivery_attempts tentativas;
+    depois vai para a dead-letter.
     """
     
     def __init__(
         self,
-        rabbitmq_url: str,
-        mongodb_url: str,
-        mongodb_database: str,
-        exchange_name: str,
-        queue_name: str,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        event_publisher: EventPublisher,
+        rabbitmq_url: str = "",
+        exchange_name: str = "",
+        queue_name: str = "",
+        ledger_batch_size: int = 100,
+        ledger_flush_interval_ms: int = 50,
+        retry_policy: RetryPolicy | None = None,
+        max_delivery_attempts: int = 5,
     ) -> None:
         """
         Inicializa o worker.
         
         Args:
-            rabbitmq_url: URL do RabbitMQ
-            mongodb_url: URL do MongoDB
-            mongodb_database: Nome do banco
-            exchange_name: Nome do exchange
-            queue_name: Nome da fila de transferências
+            account_repository: Repositório de contas (interface!)
+            transaction_repository: Livro-razão de transações (interface!)
+            event_publisher: Publicador dos eventos de resultado (já conectado)
+            rabbitmq_url: URL do RabbitMQ (só para start())
+            exchange_name: Nome do exchange (só para start())
+            queue_name: Nome da fila de transferências (só para start())
+            ledger_batch_size: Mensagens por lote de lançamentos (e prefetch)
+            ledger_flush_interval_ms: Espera máxima de um lote incompleto
+            retry_policy: Repete a liquidação quando uma conta muda no meio
+            max_delivery_attempts: Tentativas de uma mensagem que falha por
+                infraestrutura antes de ir para a dead-letter
         """
         self.rabbitmq_url = rabbitmq_url
         self.exchange_name = exchange_name
         self.queue_name = queue_name
+        self.dead_letter_queue = f"{queue_name}.dlq"
+        self.max_delivery_attempts = max_delivery_attempts
+        self._channel = None  # Canal do consumo (start()), usado para republicar
         
-        # Repositório para buscar/salvar contas
-        self.repository = MongoAccountRepository(mongodb_url, mongodb_database)
+        self.repository = account_repository
+        self.transaction_repository = transaction_repository
+        self.event_publisher = event_publisher
+        self.retry_policy = retry_policy or RetryPolicy()
         
-        # Publisher para publicar eventos de resultado
-        self.event_publisher = RabbitMQEventPublisher(rabbitmq_url, exchange_name)
+        # Lote pendente: mensagens ainda sem ack + seus lançamentos
+        self.ledger_batch_size = ledger_batch_size
+        self.ledger_flush_interval = ledger_flush_interval_ms / 1000
+        self._pending: list[tuple[AbstractIncomingMessage, list[Transaction]]] = []
+        self._ledger_lock = asyncio.Lock()
     
     async def start(self) -> None:
         """
         Inicia o worker.
         
         Conecta ao RabbitMQ, declara fila e começa a processar mensagens.
+        
+        A declaração é a mesma da topologia (ver topology.py): durável e
+        sem argumentos, então as duas convivem com a fila já existente.
+        O mesmo vale para a dead-letter <fila>.dlq.
         """
         print("🔄 Transfer Worker iniciando...")
         
         # Conecta ao RabbitMQ
         connection = await connect_robust(self.rabbitmq_url)
         channel = await connection.channel()
+        self._channel = channel
+        
+        # Sem prefetch o RabbitMQ entregaria a fila inteira de uma vez;
+        # com ele, no máximo um lote fica aguardando ack
+        await channel.set_qos(prefetch_count=self.ledger_batch_size)
         
         # Declara exchange
         exchange = await channel.declare_exchange(
@@ -85,8 +155,8 @@ class TransferWorker:
         # Bind fila ao exchange com routing key
         await queue.bind(exchange, routing_key="transfer.requested")
         
-        # Conecta event publisher
-        await self.event_publisher.connect()
+        # Dead-letter: mensagens que esgotaram as tentativas
+        await channel.declare_queue(self.dead_letter_queue, durable=True)
         
         print(f"✅ Worker escutando fila '{self.queue_name}'...")
         print(f"✅ Aguardando eventos 'transfer.requested'...")
@@ -94,12 +164,27 @@ class TransferWorker:
         # Começa a consumir mensagens
         await queue.consume(self._process_transfer)
         
+        # Grava lotes incompletos periodicamente
+        flusher = asyncio.create_task(self._flush_periodically())
+        
         # Mantém rodando
         try:
             await asyncio.Future()  # Roda forever
         finally:
+            flusher.cancel()
+            await self._flush_ledger()
             await connection.close()
     
+    async def handle_transfer_requested(self, event_data: dict) -> None:
+        """
+        Processa um TransferRequested entregue no próprio processo.
+        
+        Sem fila não há ack a adiar: os lançamentos são gravados na hora.
+        """
+        with use_case_scope(type(self).__name__):
+            entries = await self._settle(event_data)
+            await self.transaction_repository.save_many(entries)
+    
     async def _process_transfer(self, message: AbstractIncomingMessage) -> None:
         """
         Processa uma mensagem de transferência.
@@ -107,67 +192,214 @@ class TransferWorker:
         Args:
             message: Mensagem do RabbitMQ
         """
-        async with message.process():
-            try:
-                # Deserializa JSON
-                event_data = json.loads(message.body.decode())
-                
-                print(f"\n📨 Processando transferência: {event_data['transfer_id']}")
-                
-                # Extrai dados
-                transfer_id = event_data["transfer_id"]
-                from_account_number = AccountNumber(value=event_data["from_account"])
-                to_account_number = AccountNumber(value=event_data["to_account"])
-                amount = Money.create(event_data["amount"])
-                
-                # Busca contas no MongoDB
-                from_account = await self.repository.find_by_account_number(
-                    from_account_number
-                )
-                to_account = await self.repository.find_by_account_number(
-                    to_account_number
+        try:
+            # Deserializa no formato da mensagem (JSON ou msgpack)
+            event_data = EventCodec.decode(message.body, message.content_type)
+        except ValueError:
+            event_data = {}
+        
+        # Uma cópia republicada (ver _retry_later) não vem marcada como
+        # reentrega pelo broker, mas também pode já ter sido liquidada
+        retries = int((message.headers or {}).get(_RETRY_COUNT_HEADER, 0))
+        
+        try:
+            with use_case_scope(type(self).__name__):
+                entries = await self._settle(
+                    event_data, redelivered=message.redelivered or retries > 0
                 )
-                
-                if not from_account:
-                    raise ValueError(f"Conta origem {from_account_number} não encontrada")
-                
-                if not to_account:
-                    raise ValueError(f"Conta destino {to_account_number} não encontrada")
-                
-                # Executa transferência
-                # 1. Saca da conta origem (valida saldo automaticamente!)
-                from_account.withdraw(amount)
-                
-                # 2. Deposita na conta destino
-                to_account.deposit(amount)
-                
-                # 3. Salva ambas as contas
-                await self.repository.save(from_account)
-                await self.repository.save(to_account)
-                
-                # Publica evento de sucesso
-                success_event = TransferCompleted(
-                    transfer_id=transfer_id,
-                    from_account=str(from_account_number),
-                    to_account=str(to_account_number),
-                    amount=str(amount.amount),
+        except Exception as e:
+            # Banco ou broker com problema: a liquidação pode ter parado no
+            # meio, então a mensagem volta para a fila em vez de virar falha
+            await self._retry_later(message, retries + 1, e)
+            return
+        
+        # O ack fica para depois da gravação do lote
+        self._pending.append((message, entries))
+        if len(self._pending) >= self.ledger_batch_size:
+            await self._flush_ledger()
+    
+    async def _retry_later(
+        self, message: AbstractIncomingMessage, attempts: int, error: Exception
+    ) -> None:
+        """
+        Devolve a mensagem ao fim da fila ou, sem tentativas, à dead-letter.
+        
+        nack com requeue não tem contador (e x-delivery-count só existe em
+        quorum queues): a mensagem é republicada com x-retry-count e a
+        original recebe ack. Uma mensagem que sempre falha vai para a
+        <fila>.dlq em vez de girar para sempre. Ela não vira TransferFailed:
+        a liquidação pode ter parado no meio, e devolvê-la à fila depois de
+        corrigida a causa completa a transferência.
+        
+        Args:
+            message: Mensagem que falhou
+            attempts: Tentativas feitas, contando esta
+            error: Erro de infraestrutura da tentativa
+        """
+        if attempts >= self.max_delivery_attempts:
+            print(f"☠️ Transferência enviada à dead-letter após {attempts} tentativas: {error}")
+            routing_key = self.dead_letter_queue
+        else:
+            print(f"⚠️ Transferência devolvida à fila (tentativa {attempts}): {error}")
+            await asyncio.sleep(_REQUEUE_DELAY_SECONDS)
+            routing_key = self.queue_name
+        
+        try:
+            # Exchange padrão: entrega direto na fila com o nome da routing key
+            await self._channel.default_exchange.publish(
+                Message(
+                    body=message.body,
+                    content_type=message.content_type,
+                    headers={**(message.headers or {}), _RETRY_COUNT_HEADER: attempts},
+                    type=message.type,
+                    delivery_mode=2,  # Persistente
+                ),
+                routing_key=routing_key,
+            )
+        except Exception as e:
+            # Sem conseguir republicar: devolve a original (não perde a mensagem)
+            print(f"⚠️ Republicação falhou, mensagem devolvida à fila: {e}")
+            await message.nack(requeue=True)
+            return
+        await message.ack()
+    
+    async def _settle(self, event_data: dict, redelivered: bool = False) -> list[Transaction]:
+        """
+        Liquida a transferência e publica o resultado.
+        
+        Args:
+            event_data: Dados do TransferRequested
+            redelivered: Mensagem reentregue pelo broker (pode já ter sido liquidada)
+        
+        Returns:
+            Lançamentos a gravar no livro-razão (vazio se falhou)
+        
+        Raises:
+            Exception: Erros de infraestrutura (a mensagem deve voltar à fila)
+        """
+        try:
+            transfer_id = event_data["transfer_id"]
+            from_account_number = AccountNumber(value=event_data["from_account"])
+            to_account_number = AccountNumber(value=event_data["to_account"])
+            amount = Money.create(event_data["amount"])
+        except (KeyError, TypeError, ValueError, InvalidOperation) as e:
+            await self._publish_failure(event_data, f"Mensagem inválida: {e}")
+            return []
+        
+        print(f"\n📨 Processando transferência: {transfer_id}")
+        
+        # Os marcadores de idempotência de cada conta guardam só os
+        # transfer_ids recentes; o lançamento de saída no livro-razão
+        # prova que uma reentrega antiga já foi liquidada
+        if redelivered and await self.transaction_repository.exists(f"{transfer_id}:out"):
+            print(f"↩️ Transferência {transfer_id} já liquidada, reentrega ignorada")
+            return []
+        
+        try:
+            # Executa transferência (saque + depósito) como uma única
+            # operação no banco; reentregas da mesma mensagem não
+            # movem o dinheiro de novo (por isso repetir é seguro)
+            await self.retry_policy.run(
+                lambda: self.repository.settle_transfer(
+                    transfer_id, from_account_number, to_account_number, amount
                 )
-                await self.event_publisher.publish(success_event)
-                
-                print(f"✅ Transferência {transfer_id} concluída com sucesso!")
-                
+            )
+        except _SETTLEMENT_REFUSALS as e:
+            await self._publish_failure(event_data, str(e))
+            return []
+        
+        # Liquidada: daqui em diante nada pode virar TransferFailed
+        entries = self._ledger_entries(
+            transfer_id, from_account_number, to_account_number, amount
+        )
+        
+        # Publica evento de sucesso
+        success_event = TransferCompleted(
+            transfer_id=transfer_id,
+            from_account=str(from_account_number),
+            to_account=str(to_account_number),
+            amount=str(amount.amount),
+        )
+        await self.event_publisher.publish(success_event)
+        
+        print(f"✅ Transferência {transfer_id} concluída com sucesso!")
+        return entries
+    
+    async def _publish_failure(self, event_data: dict, reason: str) -> None:
+        """Publica TransferFailed para uma transferência recusada."""
+        print(f"❌ Transferência falhou: {reason}")
+        
+        failed_event = TransferFailed(
+            transfer_id=event_data.get("transfer_id", "unknown"),
+            from_account=event_data.get("from_account", ""),
+            to_account=event_data.get("to_account", ""),
+            amount=event_data.get("amount", "0"),
+            reason=reason,
+        )
+        await self.event_publisher.publish(failed_event)
+    
+    @staticmethod
+    def _ledger_entries(
+        transfer_id: str,
+        from_account_number: AccountNumber,
+        to_account_number: AccountNumber,
+        amount: Money,
+    ) -> list[Transaction]:
+        """
+        Lançamentos de uma transferência liquidada: saída e entrada.
+        
+        Os ids derivam do transfer_id, então uma mensagem reentregue
+        gera os mesmos lançamentos (e o insert ignora os repetidos).
+        """
+        out_entry = Transaction(
+            id=f"{transfer_id}:out",
+            account_number=from_account_number,
+            type=TransactionType.TRANSFER_OUT,
+            amount=amount,
+            status=TransactionStatus.PENDING,
+            description="Transferência enviada",
+            related_account=to_account_number,
+        )
+        in_entry = Transaction(
+            id=f"{transfer_id}:in",
+            account_number=to_account_number,
+            type=TransactionType.TRANSFER_IN,
+            amount=amount,
+            status=TransactionStatus.PENDING,
+            description="Transferência recebida",
+            related_account=from_account_number,
+        )
+        out_entry.complete()
+        in_entry.complete()
+        return [out_entry, in_entry]
+    
+    async def _flush_periodically(self) -> None:
+        """Grava o lote pendente a cada ledger_flush_interval."""
+        while True:
+            await asyncio.sleep(self.ledger_flush_interval)
+            await self._flush_ledger()
+    
+    async def _flush_ledger(self) -> None:
+        """
+        Grava os lançamentos pendentes com um único insert_many.
+        
+        Sucesso: ack de todas as mensagens do lote.
+        Falha: nack com requeue (serão reprocessadas).
+        """
+        async with self._ledger_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            
+            entries = [entry for _, message_entries in batch for entry in message_entries]
+            try:
+                with use_case_scope(type(self).__name__):
+                    await self.transaction_repository.save_many(entries)
             except Exception as e:
-                # Algo deu errado!
-                print(f"❌ Erro ao processar transferência: {e}")
-                
-                # Publica evento de falha
-                failed_event = TransferFailed(
-                    transfer_id=event_data.get("transfer_id", "unknown"),
-                    from_account=event_data.get("from_account", ""),
-                    to_account=event_data.get("to_account", ""),
-                    amount=event_data.get("amount", "0"),
-                    reason=str(e),
-                )
-                await self.event_publisher.publish(failed_event)
-                
-                print(f"❌ Transferência falhou: {e}")
\ No newline at end of file
+                print(f"❌ Erro ao gravar livro-razão ({len(batch)} mensagens): {e}")
+                for message, _ in batch:
+                    await message.nack(requeue=True)
+                return
+            
+            for message, _ in batch:
+                await message.ack()
@@ -5,74 +5,200 @@ Fornece instâncias de repositórios e publishers para as rotas.
 """
 
 from typing import Annotated
-from fastapi import Depends
-
-from src.infrastructure.config import settings
-from src.infrastructure.database import MongoAccountRepository
-from src.infrastructure.messaging import RabbitMQEventPublisher
+from fastapi import Depends, Request
+
+from src.application.interfaces import (
+    AccountRepository,
+    EventPublisher,
+    ReportRepository,
+    SnapshotRepository,
+    StatsRepository,
+    TransactionRepository,
+    UnitOfWork,
+)
+from src.application.services import LedgerReplayer, RetryPolicy
 from src.application.use_cases import (
     CreateAccountUseCase,
     DepositMoneyUseCase,
     WithdrawMoneyUseCase,
     TransferMoneyUseCase,
+    GetTransactionHistoryUseCase,
+    ExportStatementUseCase,
+    GetBalanceAtUseCase,
+    ListAccountsUseCase,
+    GetSystemStatsUseCase,
+    GetStatusReportUseCase,
+    GetBalanceDistributionUseCase,
+    GetOpeningRateUseCase,
 )
+from src.infrastructure.config import settings
 
 
 # ==================== REPOSITÓRIOS ====================
 
-def get_account_repository() -> MongoAccountRepository:
-    """Fornece instância do repositório de contas."""
-    return MongoAccountRepository(
-        mongodb_url=settings.mongodb_url,
-        database_name=settings.mongodb_database,
-    )
+def get_account_repository(request: Request) -> AccountRepository:
+    """
+    Fornece o repositório de contas da aplicação.
+    
+    O repositório (e o pool de conexões do MongoDB) é criado uma única
+    vez no lifespan da aplicação e compartilhado entre as requisições.
+    """
+    return request.app.state.account_repository
+
+
+def get_transaction_repository(request: Request) -> TransactionRepository:
+    """Fornece o livro-razão de transações da aplicação."""
+    return request.app.state.transaction_repository
+
+
+def get_snapshot_repository(request: Request) -> SnapshotRepository:
+    """Fornece o repositório de checkpoints de saldo."""
+    return request.app.state.snapshot_repository
+
+
+def get_stats_repository(request: Request) -> StatsRepository:
+    """Fornece as visões agregadas (estatísticas) da aplicação."""
+    return request.app.state.stats_repository
+
+
+def get_report_repository(request: Request) -> ReportRepository:
+    """Fornece o repositório de relatórios (com cache de resultados)."""
+    return request.app.state.report_repository
 
 
 # ==================== EVENT PUBLISHER ====================
 
-async def get_event_publisher() -> RabbitMQEventPublisher:
-    """Fornece instância do event publisher."""
-    publisher = RabbitMQEventPublisher(
-        rabbitmq_url=settings.rabbitmq_url,
-        exchange_name=settings.rabbitmq_exchange,
-    )
-    await publisher.connect()
-    return publisher
+def get_event_publisher(request: Request) -> EventPublisher:
+    """
+    Fornece o event publisher da aplicação.
+    
+    A conexão com o RabbitMQ (e o pool de canais) é aberta uma única
+    vez no lifespan da aplicação, não a cada requisição.
+    """
+    return request.app.state.event_publisher
+
+
+# ==================== RETRY ====================
+
+def get_retry_policy(request: Request) -> RetryPolicy:
+    """Fornece a política de retry compartilhada (e seus contadores)."""
+    return request.app.state.retry_policy
+
+
+def get_unit_of_work(request: Request) -> UnitOfWork | None:
+    """Fornece a unidade de trabalho (None se a outbox estiver desligada)."""
+    return request.app.state.unit_of_work
 
 
 # ==================== USE CASES ====================
 
 async def get_create_account_use_case(
-    repository: Annotated[MongoAccountRepository, Depends(get_account_repository)],
-    publisher: Annotated[RabbitMQEventPublisher, Depends(get_event_publisher)],
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+    publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
+    transactions: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+    snapshots: Annotated[SnapshotRepository, Depends(get_snapshot_repository)],
 ) -> CreateAccountUseCase:
     """Fornece instância do use case de criar conta."""
-    return CreateAccountUseCase(repository, publisher)
+    return CreateAccountUseCase(
+        repository,
+        publisher,
+        transactions,
+        snapshots,
+        check_legacy_cpf=settings.cpf_migration_pending,
+    )
 
 
 async def get_deposit_money_use_case(
-    repository: Annotated[MongoAccountRepository, Depends(get_account_repository)],
-    publisher: Annotated[RabbitMQEventPublisher, Depends(get_event_publisher)],
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+    publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
+    transactions: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+    retry_policy: Annotated[RetryPolicy, Depends(get_retry_policy)],
+    unit_of_work: Annotated[UnitOfWork | None, Depends(get_unit_of_work)],
 ) -> DepositMoneyUseCase:
     """Fornece instância do use case de depósito."""
-    return DepositMoneyUseCase(repository, publisher)
+    return DepositMoneyUseCase(repository, publisher, transactions, retry_policy, unit_of_work)
 
 
 async def get_withdraw_money_use_case(
-    repository: Annotated[MongoAccountRepository, Depends(get_account_repository)],
-    publisher: Annotated[RabbitMQEventPublisher, Depends(get_event_publisher)],
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+    publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
+    transactions: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+    retry_policy: Annotated[RetryPolicy, Depends(get_retry_policy)],
+    unit_of_work: Annotated[UnitOfWork | None, Depends(get_unit_of_work)],
 ) -> WithdrawMoneyUseCase:
     """Fornece instância do use case de saque."""
-    return WithdrawMoneyUseCase(repository, publisher)
+    return WithdrawMoneyUseCase(repository, publisher, transactions, retry_policy, unit_of_work)
 
 
 async def get_transfer_money_use_case(
-    repository: Annotated[MongoAccountRepository, Depends(get_account_repository)],
-    publisher: Annotated[RabbitMQEventPublisher, Depends(get_event_publisher)],
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+    publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
 ) -> TransferMoneyUseCase:
     """Fornece instância do use case de transferência."""
     return TransferMoneyUseCase(repository, publisher)
 
 
+async def get_transaction_history_use_case(
+    transactions: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+) -> GetTransactionHistoryUseCase:
+    """Fornece instância do use case de histórico de transações."""
+    return GetTransactionHistoryUseCase(transactions)
+
+
+async def get_export_statement_use_case(
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+    transactions: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+) -> ExportStatementUseCase:
+    """Fornece instância do use case de extrato."""
+    return ExportStatementUseCase(repository, transactions, settings.statement_batch_size)
+
+
+
+async def get_balance_at_use_case(
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+    transactions: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+    snapshots: Annotated[SnapshotRepository, Depends(get_snapshot_repository)],
+) -> GetBalanceAtUseCase:
+    """Fornece instância do use case de saldo em um instante."""
+    replayer = LedgerReplayer(transactions, snapshots, settings.statement_batch_size)
+    return GetBalanceAtUseCase(repository, replayer)
+
+
+
+async def get_list_accounts_use_case(
+    repository: Annotated[AccountRepository, Depends(get_account_repository)],
+) -> ListAccountsUseCase:
+    """Fornece instância do use case de listagem de contas."""
+    return ListAccountsUseCase(repository)
+
+
+async def get_system_stats_use_case(
+    repository: Annotated[StatsRepository, Depends(get_stats_repository)],
+) -> GetSystemStatsUseCase:
+    """Fornece instância do use case de estatísticas do sistema."""
+    return GetSystemStatsUseCase(repository)
+
+
+async def get_status_report_use_case(
+    repository: Annotated[ReportRepository, Depends(get_report_repository)],
+) -> GetStatusReportUseCase:
+    """Fornece instância do use case de totais por status."""
+    return GetStatusReportUseCase(repository)
+
+
+async def get_balance_distribution_use_case(
+    repository: Annotated[ReportRepository, Depends(get_report_repository)],
+) -> GetBalanceDistributionUseCase:
+    """Fornece instância do use case de distribuição de saldos."""
+    return GetBalanceDistributionUseCase(repository)
+
+
+async def get_opening_rate_use_case(
+    repository: Annotated[ReportRepository, Depends(get_report_repository)],
+) -> GetOpeningRateUseCase:
+    """Fornece instância do use case de aberturas por período."""
+    return GetOpeningRateUseCase(repository)
+
+
 # Type aliases para facilitar uso
-AccountRepositoryDep = Annotated[MongoAccountRepository, Depends(get_account_repository)]
+AccountRepositoryDep = Annotated[AccountRepository, Depends(get_account_repository)]
@@ -1,7 +1,15 @@
 """Rotas de contas."""
 
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from datetime import datetime
+from enum import Enum
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from src.application.use_cases import (
     CreateAccountUseCase,
@@ -10,19 +18,43 @@ from src.application.use_cases import (
     DepositMoneyInput,
     WithdrawMoneyUseCase,
     WithdrawMoneyInput,
+    GetTransactionHistoryUseCase,
+    GetTransactionHistoryInput,
+    ExportStatementUseCase,
+    ExportStatementInput,
+    StatementLine,
+    GetBalanceAtUseCase,
+    GetBalanceAtInput,
+    ListAccountsUseCase,
+    ListAccountsInput,
 )
-from src.infrastructure.database import MongoAccountRepository
+from src.domain.exceptions import (
+    AccountNotFoundError,
+    ConcurrentUpdateError,
+    DuplicateAccountError,
+    MissingOpeningSnapshotError,
+)
+from src.application.interfaces import AccountRepository
 from src.presentation.schemas import (
     CreateAccountRequest,
     AccountResponse,
+    AccountSummaryResponse,
+    AccountListResponse,
     DepositRequest,
     WithdrawRequest,
     TransactionResponse,
+    LedgerEntryResponse,
+    TransactionHistoryResponse,
+    BalanceAtResponse,
 )
 from src.presentation.api.dependencies import (
     get_create_account_use_case,
     get_deposit_money_use_case,
     get_withdraw_money_use_case,
+    get_transaction_history_use_case,
+    get_export_statement_use_case,
+    get_balance_at_use_case,
+    get_list_accounts_use_case,
     get_account_repository,
 )
 
@@ -30,6 +62,56 @@ from src.presentation.api.dependencies import (
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 
+class StatementFormat(str, Enum):
+    """Formatos do extrato."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+# Linhas agrupadas por escrita no socket (menos chamadas, memória constante)
+_STATEMENT_CHUNK_LINES = 500
+
+_STATEMENT_COLUMNS = [
+    "transaction_id",
+    "created_at",
+    "type",
+    "description",
+    "related_account",
+    "amount",
+    "balance",
+]
+
+
+async def _ndjson_chunks(lines: AsyncIterator[StatementLine]) -> AsyncIterator[str]:
+    """Uma linha JSON por lançamento."""
+    chunk: list[str] = []
+    async for line in lines:
+        chunk.append(json.dumps(asdict(line), ensure_ascii=False) + "\n")
+        if len(chunk) >= _STATEMENT_CHUNK_LINES:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+async def _csv_chunks(lines: AsyncIterator[StatementLine]) -> AsyncIterator[str]:
+    """Cabeçalho + uma linha CSV por lançamento."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_STATEMENT_COLUMNS)
+    count = 0
+    async for line in lines:
+        writer.writerow(asdict(line)[column] for column in _STATEMENT_COLUMNS)
+        count += 1
+        if count >= _STATEMENT_CHUNK_LINES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
 @router.post("", response_model=AccountResponse, status_code=status.HTTP_201_CREATED)
 async def create_account(
     request: CreateAccountRequest,
@@ -59,6 +141,45 @@ async def create_account(
             balance=output.balance,
             status=output.status,
         )
+    except DuplicateAccountError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("", response_model=AccountListResponse)
+async def list_accounts(
+    use_case: Annotated[ListAccountsUseCase, Depends(get_list_accounts_use_case)],
+    status_filter: Annotated[str | None, Query(alias="status")] = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+):
+    """
+    Lista contas (da mais antiga para a mais nova).
+    
+    Filtros opcionais por status (ex: `analysis`) e faixa de criação.
+    Paginação por cursor: passe o `next_cursor` da resposta para
+    buscar a próxima página (ausente na última).
+    """
+    try:
+        output = await use_case.execute(
+            ListAccountsInput(
+                status=status_filter,
+                created_from=created_from,
+                created_to=created_to,
+                limit=limit,
+                cursor=cursor,
+            )
+        )
+        
+        return AccountListResponse(
+            items=[AccountSummaryResponse(**vars(item)) for item in output.items],
+            next_cursor=output.next_cursor,
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -70,12 +191,19 @@ async def deposit_money(
     account_number: str,
     request: DepositRequest,
     use_case: Annotated[DepositMoneyUseCase, Depends(get_deposit_money_use_case)],
+    idempotency_key: Annotated[str | None, Header(max_length=100)] = None,
 ):
-    """Deposita dinheiro em uma conta."""
+    """
+    Deposita dinheiro em uma conta.
+    
+    Com o header Idempotency-Key, repetir a requisição (ex.: depois de um
+    timeout) não deposita de novo.
+    """
     try:
         input_dto = DepositMoneyInput(
             account_number=account_number,
             amount=request.amount,
+            idempotency_key=idempotency_key,
         )
         
         output = await use_case.execute(input_dto)
@@ -86,6 +214,8 @@ async def deposit_money(
             amount=output.amount_deposited,
             new_balance=output.new_balance,
         )
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -97,12 +227,19 @@ async def withdraw_money(
     account_number: str,
     request: WithdrawRequest,
     use_case: Annotated[WithdrawMoneyUseCase, Depends(get_withdraw_money_use_case)],
+    idempotency_key: Annotated[str | None, Header(max_length=100)] = None,
 ):
-    """Saca dinheiro de uma conta."""
+    """
+    Saca dinheiro de uma conta.
+    
+    Com o header Idempotency-Key, repetir a requisição (ex.: depois de um
+    timeout) não saca de novo.
+    """
     try:
         input_dto = WithdrawMoneyInput(
             account_number=account_number,
             amount=request.amount,
+            idempotency_key=idempotency_key,
         )
         
         output = await use_case.execute(input_dto)
@@ -113,6 +250,104 @@ async def withdraw_money(
             amount=output.amount_withdrawn,
             new_balance=output.new_balance,
         )
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/{account_number}/transactions", response_model=TransactionHistoryResponse)
+async def get_transaction_history(
+    account_number: str,
+    use_case: Annotated[
+        GetTransactionHistoryUseCase, Depends(get_transaction_history_use_case)
+    ],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+):
+    """
+    Histórico de transações da conta (mais recentes primeiro).
+    
+    Paginação por cursor: passe o `next_cursor` da resposta para
+    buscar a próxima página (ausente na última).
+    """
+    try:
+        output = await use_case.execute(
+            GetTransactionHistoryInput(
+                account_number=account_number,
+                limit=limit,
+                cursor=cursor,
+            )
+        )
+        
+        return TransactionHistoryResponse(
+            account_number=output.account_number,
+            items=[LedgerEntryResponse(**vars(item)) for item in output.items],
+            next_cursor=output.next_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/{account_number}/statement")
+async def export_statement(
+    account_number: str,
+    use_case: Annotated[ExportStatementUseCase, Depends(get_export_statement_use_case)],
+    format: StatementFormat = StatementFormat.NDJSON,
+):
+    """
+    Extrato completo da conta (ordem cronológica, com saldo acumulado).
+    
+    A resposta é transmitida enquanto o cursor do MongoDB é lido:
+    a API nunca monta o extrato inteiro em memória.
+    """
+    try:
+        lines = await use_case.execute(ExportStatementInput(account_number=account_number))
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    
+    if format == StatementFormat.CSV:
+        return StreamingResponse(
+            _csv_chunks(lines),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f'attachment; filename="extrato-{account_number}.csv"'
+            },
+        )
+    return StreamingResponse(_ndjson_chunks(lines), media_type="application/x-ndjson")
+
+
+@router.get("/{account_number}/balance", response_model=BalanceAtResponse)
+async def get_balance_at(
+    account_number: str,
+    use_case: Annotated[GetBalanceAtUseCase, Depends(get_balance_at_use_case)],
+    at: datetime | None = None,
+):
+    """
+    Saldo da conta em um instante, reconstruído pelo livro-razão.
+    
+    Parte do checkpoint mais próximo antes de `at` e soma só os
+    lançamentos depois dele (sem `at`: até o último lançamento).
+    Conta antiga ainda sem checkpoint de abertura: 409.
+    """
+    try:
+        output = await use_case.execute(
+            GetBalanceAtInput(account_number=account_number, at=at)
+        )
+        
+        return BalanceAtResponse(**vars(output))
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except MissingOpeningSnapshotError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -122,7 +357,7 @@ async def withdraw_money(
 @router.post("/{account_number}/approve", status_code=status.HTTP_200_OK)
 async def approve_account(
     account_number: str,
-    use_case: Annotated[MongoAccountRepository, Depends(get_account_repository)],
+    use_case: Annotated[AccountRepository, Depends(get_account_repository)],
 ):
     """Aprova uma conta (muda status para ACTIVE)."""
     try:
@@ -138,6 +373,8 @@ async def approve_account(
         await use_case.save(account)
         
         return {"message": f"Conta {account_number} aprovada com sucesso!"}
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -0,0 +1,38 @@
+"""Rotas administrativas."""
+
+from dataclasses import asdict
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.application.use_cases import (
+    GetSystemStatsUseCase,
+    GetSystemStatsInput,
+)
+from src.application.use_cases.get_system_stats import MAX_DAYS
+from src.presentation.schemas import SystemStatsResponse
+from src.presentation.api.dependencies import get_system_stats_use_case
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/stats", response_model=SystemStatsResponse)
+async def get_stats(
+    use_case: Annotated[GetSystemStatsUseCase, Depends(get_system_stats_use_case)],
+    days: Annotated[int, Query(ge=1, le=MAX_DAYS)] = 30,
+):
+    """
+    Resumo do sistema: contas e saldo por status e lançamentos por dia.
+
+    Lido das visões mantidas pelo projetor de change streams
+    (python -m src.scripts.run_stats_projector), sem varrer as coleções.
+    `updated_at` indica até quando as visões estão atualizadas.
+    """
+    try:
+        output = await use_case.execute(GetSystemStatsInput(days=days))
+
+        return SystemStatsResponse(**asdict(output))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -0,0 +1,38 @@
+"""Rotas de métricas operacionais."""
+
+from fastapi import APIRouter, Request
+
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics(request: Request):
+    """
+    Retorna métricas dos recursos compartilhados da aplicação.
+    
+    - mongodb_pool: conexões abertas, em uso e aguardando no pool
+      (None com STORAGE_BACKEND=memory)
+    - mongodb_commands: latência por comando, coleção e use case, e as
+      amostras de comandos lentos (None com memory ou monitoração desligada)
+    - read_routing: leituras por operação no primário / secundários
+    - retries: conflitos de versão, retries e contas mais disputadas
+    - account_cache: hits, misses e evictions do cache (se habilitado)
+    - report_cache: resultados de relatórios guardados, hits e misses
+    - event_buffer: eventos aguardando publicação e latência dos flushes
+      (se EVENT_BUFFER_ENABLED)
+    """
+    account_cache = request.app.state.account_cache
+    pool_monitor = request.app.state.mongo_pool_monitor
+    command_monitor = request.app.state.mongo_command_monitor
+    read_routing = request.app.state.read_routing_stats
+    event_buffer = request.app.state.event_buffer
+    return {
+        "mongodb_pool": pool_monitor.snapshot() if pool_monitor else None,
+        "mongodb_commands": command_monitor.snapshot() if command_monitor else None,
+        "read_routing": read_routing.snapshot() if read_routing else None,
+        "retries": request.app.state.retry_policy.stats.snapshot(),
+        "account_cache": account_cache.snapshot() if account_cache else None,
+        "report_cache": request.app.state.report_repository.snapshot(),
+        "event_buffer": event_buffer.snapshot() if event_buffer else None,
+    }
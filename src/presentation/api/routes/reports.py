@@ -0,0 +1,92 @@
+"""Rotas de relatórios."""
+
+from dataclasses import asdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.application.use_cases import (
+    GetStatusReportUseCase,
+    GetBalanceDistributionUseCase,
+    GetBalanceDistributionInput,
+    GetOpeningRateUseCase,
+    GetOpeningRateInput,
+)
+from src.presentation.schemas import (
+    StatusReportResponse,
+    BalanceDistributionResponse,
+    OpeningRateResponse,
+)
+from src.presentation.api.dependencies import (
+    get_status_report_use_case,
+    get_balance_distribution_use_case,
+    get_opening_rate_use_case,
+)
+
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/status-totals", response_model=StatusReportResponse)
+async def get_status_totals(
+    use_case: Annotated[GetStatusReportUseCase, Depends(get_status_report_use_case)],
+):
+    """Quantidade de contas, saldo total e saldo médio por status."""
+    try:
+        output = await use_case.execute()
+
+        return StatusReportResponse(**asdict(output))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/balance-distribution", response_model=BalanceDistributionResponse)
+async def get_balance_distribution(
+    use_case: Annotated[
+        GetBalanceDistributionUseCase, Depends(get_balance_distribution_use_case)
+    ],
+    boundaries: Annotated[list[Decimal] | None, Query()] = None,
+):
+    """
+    Contas por faixa de saldo.
+
+    `boundaries` define os limites (ex.: ?boundaries=0&boundaries=500&boundaries=5000);
+    o último limite abre uma faixa sem teto.
+    """
+    try:
+        output = await use_case.execute(GetBalanceDistributionInput(boundaries=boundaries))
+
+        return BalanceDistributionResponse(**asdict(output))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/opening-rate", response_model=OpeningRateResponse)
+async def get_opening_rate(
+    use_case: Annotated[GetOpeningRateUseCase, Depends(get_opening_rate_use_case)],
+    period: str = "day",
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
+    """
+    Contas abertas por dia, semana ou mês (padrão: últimos 30 dias).
+
+    Só aparecem os períodos com pelo menos uma abertura.
+    """
+    try:
+        output = await use_case.execute(
+            GetOpeningRateInput(
+                period=period,
+                created_from=created_from,
+                created_to=created_to,
+            )
+        )
+
+        return OpeningRateResponse(**asdict(output))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -4,11 +4,247 @@ Aplicação FastAPI principal.
 Ponto de entrada da API REST.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.presentation.api.routes import accounts, transfers
+from src.presentation.api.routes import accounts, admin, reports, transfers, metrics
+from src.application.services import RetryPolicy
 from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    MongoAccountRepository,
+    MongoCommandMonitor,
+    MongoOutboxPublisher,
+    MongoPoolMonitor,
+    MongoReportRepository,
+    MongoSnapshotRepository,
+    MongoStatsRepository,
+    MongoTransactionRepository,
+    MongoUnitOfWork,
+    ReadRouter,
+    ReadRoutingStats,
+    SchemaManager,
+    create_mongo_client,
+)
+from src.infrastructure.cache import (
+    AccountCache,
+    CachingAccountRepository,
+    CachingReportRepository,
+)
+from src.infrastructure.in_memory import (
+    InMemoryAccountRepository,
+    InMemoryEventPublisher,
+    InMemoryReportRepository,
+    InMemorySnapshotRepository,
+    InMemoryStatsRepository,
+    InMemoryTransactionRepository,
+)
+from src.infrastructure.messaging import (
+    BufferedEventPublisher,
+    CacheInvalidationConsumer,
+    EventCodec,
+    RabbitMQEventPublisher,
+    TopologyManager,
+    TransferWorker,
+    build_topology,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida da aplicação.
+    
+    Cria os recursos compartilhados UMA vez no startup
+    (cliente MongoDB com pool de conexões, publisher do RabbitMQ
+    com pool de canais e, se habilitado, o cache de contas)
+    e fecha no shutdown.
+    
+    Com STORAGE_BACKEND=memory e/ou MESSAGING_BACKEND=memory os
+    repositórios e o publisher são os em memória, e o worker de
+    transferências roda dentro deste processo.
+    """
+    # ==================== ARMAZENAMENTO ====================
+    app.state.mongo_pool_monitor = None
+    app.state.mongo_command_monitor = None
+    app.state.read_routing_stats = None
+    # Tudo que é aberto no startup fica dentro do try: uma falha no meio
+    # (ex.: broker fora do ar) ainda fecha o que já foi criado
+    mongo_client = None
+    event_publisher = None
+    cache_consumer = None
+    try:
+        if settings.storage_backend == "memory":
+            account_repository = InMemoryAccountRepository()
+            transaction_repository = InMemoryTransactionRepository()
+            snapshot_repository = InMemorySnapshotRepository()
+            stats_repository = InMemoryStatsRepository(account_repository, transaction_repository)
+            report_repository = InMemoryReportRepository(account_repository)
+        else:
+            pool_monitor = MongoPoolMonitor()
+            command_monitor = None
+            if settings.mongodb_command_monitoring:
+                command_monitor = MongoCommandMonitor(
+                    slow_threshold_ms=settings.mongodb_slow_command_ms,
+                    max_slow_samples=settings.mongodb_slow_command_samples,
+                )
+            mongo_client = create_mongo_client(
+                settings, pool_monitor=pool_monitor, command_monitor=command_monitor
+            )
+            app.state.mongo_pool_monitor = pool_monitor
+            app.state.mongo_command_monitor = command_monitor
+            
+            # Leituras EVENTUAL vão para os secundários (um roteador por processo)
+            app.state.read_routing_stats = ReadRoutingStats()
+            read_router = ReadRouter(
+                app.state.read_routing_stats,
+                settings.mongodb_secondary_max_staleness_seconds,
+            )
+            
+            account_repository = MongoAccountRepository(
+                client=mongo_client,
+                database_name=settings.mongodb_database,
+                transfer_settlement=settings.mongodb_transfer_settlement,
+                read_router=read_router,
+            )
+            transaction_repository = MongoTransactionRepository(
+                client=mongo_client,
+                database_name=settings.mongodb_database,
+                read_router=read_router,
+            )
+            snapshot_repository = MongoSnapshotRepository(
+                client=mongo_client,
+                database_name=settings.mongodb_database,
+            )
+            report_repository = MongoReportRepository(
+                client=mongo_client,
+                database_name=settings.mongodb_database,
+                read_router=read_router,
+            )
+            # Visões mantidas pelo projetor (python -m src.scripts.run_stats_projector)
+            stats_repository = MongoStatsRepository(
+                client=mongo_client,
+                database_name=settings.mongodb_database,
+            )
+            
+            # Índices (idempotente: só cria o que falta)
+            if settings.mongodb_apply_schema_on_startup:
+                await SchemaManager(mongo_client[settings.mongodb_database]).apply()
+        
+        # Cache de contas: envolve o repositório (invalidado nas escritas
+        # deste processo e, com RabbitMQ, pelos eventos dos demais)
+        app.state.account_cache = None
+        if settings.account_cache_enabled:
+            app.state.account_cache = AccountCache(
+                max_size=settings.account_cache_max_size,
+                ttl_seconds=settings.account_cache_ttl_seconds,
+            )
+            account_repository = CachingAccountRepository(
+                account_repository, app.state.account_cache
+            )
+        
+        app.state.account_repository = account_repository
+        app.state.transaction_repository = transaction_repository
+        app.state.snapshot_repository = snapshot_repository
+        app.state.stats_repository = stats_repository
+        # Relatórios são agregações caras: resultado guardado por alguns segundos
+        app.state.report_repository = CachingReportRepository(
+            report_repository, settings.report_cache_ttl_seconds
+        )
+        
+        # Compartilhada (use cases e worker em memória) para que os
+        # contadores de conflito sejam do processo
+        app.state.retry_policy = RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            base_delay_ms=settings.retry_base_delay_ms,
+            max_delay_ms=settings.retry_max_delay_ms,
+        )
+        
+        # ==================== MENSAGERIA ====================
+        app.state.unit_of_work = None
+        
+        # Filas, dead-letter e policies (idempotente; o worker
+        # aplica a mesma topologia no startup dele). A API não consome
+        # nenhuma dessas filas: uma fila divergente no broker é avisada,
+        # mas não impede a API de subir
+        if settings.messaging_backend != "memory" and settings.rabbitmq_topology_enabled:
+            try:
+                await TopologyManager(
+                    settings.rabbitmq_url,
+                    settings.rabbitmq_exchange,
+                    build_topology(
+                        exchange_name=settings.rabbitmq_exchange,
+                        transfer_queue=settings.rabbitmq_transfer_queue,
+                        event_routing_keys=settings.rabbitmq_event_queues,
+                        event_queue_max_length=settings.rabbitmq_event_queue_max_length,
+                    ),
+                    settings.rabbitmq_management_url,
+                ).apply()
+            except Exception as e:
+                print(f"⚠️ Topologia do RabbitMQ não aplicada: {e}")
+        
+        if settings.messaging_backend == "memory":
+            event_publisher = InMemoryEventPublisher(settings.memory_event_buffer_size)
+            
+            # Sem broker: o worker assina TransferRequested aqui mesmo
+            transfer_worker = TransferWorker(
+                account_repository=account_repository,
+                transaction_repository=transaction_repository,
+                event_publisher=event_publisher,
+                retry_policy=app.state.retry_policy,
+            )
+            event_publisher.subscribe(
+                "TransferRequested", transfer_worker.handle_transfer_requested
+            )
+        elif settings.outbox_enabled and mongo_client:
+            # Eventos vão para a outbox na transação do use case; quem
+            # publica no RabbitMQ é o relay (python -m src.scripts.run_outbox_relay)
+            event_publisher = MongoOutboxPublisher(mongo_client, settings.mongodb_database)
+            app.state.unit_of_work = MongoUnitOfWork(mongo_client)
+        else:
+            event_publisher = RabbitMQEventPublisher(
+                rabbitmq_url=settings.rabbitmq_url,
+                exchange_name=settings.rabbitmq_exchange,
+                channel_pool_size=settings.rabbitmq_channel_pool_size,
+                publisher_confirms=settings.rabbitmq_publisher_confirms,
+                confirm_window=settings.rabbitmq_confirm_window,
+                codec=EventCodec(settings.event_wire_format),
+            )
+            await event_publisher.connect()
+        
+        if settings.messaging_backend != "memory" and settings.account_cache_enabled:
+            cache_consumer = CacheInvalidationConsumer(
+                rabbitmq_url=settings.rabbitmq_url,
+                exchange_name=settings.rabbitmq_exchange,
+                repository=account_repository,
+            )
+            await cache_consumer.start()
+        
+        # Publicação em segundo plano: o broker sai do caminho da requisição
+        # (com a outbox ele já saiu; o buffer tiraria o evento da transação)
+        app.state.event_buffer = None
+        if settings.event_buffer_enabled and app.state.unit_of_work is None:
+            event_publisher = BufferedEventPublisher(
+                event_publisher,
+                max_size=settings.event_buffer_max_size,
+                batch_size=settings.event_buffer_batch_size,
+                flush_interval_ms=settings.event_buffer_flush_interval_ms,
+                overflow=settings.event_buffer_overflow,
+                max_flush_attempts=settings.event_buffer_max_flush_attempts,
+            )
+            await event_publisher.start()
+            app.state.event_buffer = event_publisher
+        app.state.event_publisher = event_publisher
+        
+        yield
+    finally:
+        if cache_consumer:
+            await cache_consumer.close()
+        if event_publisher:
+            await event_publisher.close()
+        if mongo_client:
+            mongo_client.close()
 
 
 # Cria aplicação FastAPI
@@ -16,6 +252,7 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Sistema bancário com Clean Architecture + DDD",
+    lifespan=lifespan,
 )
 
 # CORS (permite requisições de qualquer origem)
@@ -30,6 +267,9 @@ app.add_middleware(
 # Registra rotas
 app.include_router(accounts.router)
 app.include_router(transfers.router)
+app.include_router(reports.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -3,18 +3,50 @@
 from .account_schemas import (
     CreateAccountRequest,
     AccountResponse,
+    AccountSummaryResponse,
+    AccountListResponse,
     DepositRequest,
     WithdrawRequest,
     TransactionResponse,
+    LedgerEntryResponse,
+    TransactionHistoryResponse,
+    BalanceAtResponse,
+)
+from .admin_schemas import (
+    StatusStatsResponse,
+    LedgerDayResponse,
+    SystemStatsResponse,
+)
+from .report_schemas import (
+    StatusReportItemResponse,
+    StatusReportResponse,
+    BalanceBucketResponse,
+    BalanceDistributionResponse,
+    OpeningRateItemResponse,
+    OpeningRateResponse,
 )
 from .transfer_schemas import TransferRequest, TransferResponse
 
 __all__ = [
     "CreateAccountRequest",
     "AccountResponse",
+    "AccountSummaryResponse",
+    "AccountListResponse",
     "DepositRequest",
     "WithdrawRequest",
     "TransactionResponse",
+    "LedgerEntryResponse",
+    "TransactionHistoryResponse",
+    "BalanceAtResponse",
+    "StatusStatsResponse",
+    "LedgerDayResponse",
+    "SystemStatsResponse",
+    "StatusReportItemResponse",
+    "StatusReportResponse",
+    "BalanceBucketResponse",
+    "BalanceDistributionResponse",
+    "OpeningRateItemResponse",
+    "OpeningRateResponse",
     "TransferRequest",
     "TransferResponse",
 ]
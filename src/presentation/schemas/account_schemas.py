@@ -48,6 +48,37 @@ class AccountResponse(BaseModel):
         }
 
 
+class AccountSummaryResponse(BaseModel):
+    """Schema de uma conta na listagem."""
+    account_number: str
+    holder_name: str
+    status: str
+    balance: str
+    created_at: datetime
+
+
+class AccountListResponse(BaseModel):
+    """Schema de uma página da listagem de contas."""
+    items: list[AccountSummaryResponse]
+    next_cursor: str | None = None
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "account_number": "ACC-550e8400-e29b-41d4-a716-446655440000",
+                        "holder_name": "João Paulo",
+                        "status": "analysis",
+                        "balance": "1000.00",
+                        "created_at": "2024-02-08T10:30:00"
+                    }
+                ],
+                "next_cursor": "WyIyMDI0LTAyLTA4VDEwOjMwOjAwIiwgIkFDQy0uLi4iXQ=="
+            }
+        }
+
+
 class DepositRequest(BaseModel):
     """Schema para depósito."""
     amount: float = Field(..., gt=0)
@@ -75,9 +106,9 @@ class WithdrawRequest(BaseModel):
 class TransactionResponse(BaseModel):
     """Schema de resposta de transação."""
     account_number: str
-    old_balance: str
+    old_balance: str | None  # None em contas com saldo dividido
     amount: str
-    new_balance: str
+    new_balance: str | None
     
     class Config:
         json_schema_extra = {
@@ -88,3 +119,60 @@ class TransactionResponse(BaseModel):
                 "new_balance": "1500.00"
             }
         }
+
+
+class BalanceAtResponse(BaseModel):
+    """Schema do saldo reconstruído a partir do livro-razão."""
+    account_number: str
+    balance: str
+    at: datetime | None = None
+    snapshot_taken_at: datetime | None = None
+    replayed_entries: int
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "account_number": "ACC-550e8400-e29b-41d4-a716-446655440000",
+                "balance": "1500.00",
+                "at": "2024-02-08T12:00:00",
+                "snapshot_taken_at": "2024-02-08T11:55:00",
+                "replayed_entries": 3
+            }
+        }
+
+
+class LedgerEntryResponse(BaseModel):
+    """Schema de um lançamento do histórico."""
+    transaction_id: str
+    type: str
+    amount: str
+    status: str
+    description: str
+    related_account: str | None = None
+    created_at: datetime
+
+
+class TransactionHistoryResponse(BaseModel):
+    """Schema de uma página do histórico de transações."""
+    account_number: str
+    items: list[LedgerEntryResponse]
+    next_cursor: str | None = None
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "account_number": "ACC-550e8400-e29b-41d4-a716-446655440000",
+                "items": [
+                    {
+                        "transaction_id": "7c9e6679-7425-40de-944b-e07fc1f90ae7",
+                        "type": "deposit",
+                        "amount": "500.00",
+                        "status": "completed",
+                        "description": "Depósito",
+                        "related_account": None,
+                        "created_at": "2024-02-08T10:30:00"
+                    }
+                ],
+                "next_cursor": "WyIyMDI0LTAyLTA4VDEwOjMwOjAwIiwgIjdjOWUuLi4iXQ=="
+            }
+        }
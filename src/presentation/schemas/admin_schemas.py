@@ -0,0 +1,44 @@
+"""Schemas (DTOs) da API administrativa."""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class StatusStatsResponse(BaseModel):
+    """Totais de um status de conta."""
+    status: str
+    count: int
+    balance: str
+
+
+class LedgerDayResponse(BaseModel):
+    """Totais de um tipo de lançamento em um dia."""
+    day: str
+    type: str
+    count: int
+    amount: str
+
+
+class SystemStatsResponse(BaseModel):
+    """Schema do resumo agregado do sistema."""
+    total_accounts: int
+    pending_accounts: int
+    accounts_by_status: list[StatusStatsResponse]
+    ledger_days: list[LedgerDayResponse]
+    updated_at: datetime | None = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total_accounts": 3,
+                "pending_accounts": 1,
+                "accounts_by_status": [
+                    {"status": "active", "count": 2, "balance": "1500.00"},
+                    {"status": "analysis", "count": 1, "balance": "0.00"},
+                ],
+                "ledger_days": [
+                    {"day": "2024-02-08", "type": "deposit", "count": 12, "amount": "3400.00"},
+                ],
+                "updated_at": "2024-02-08T12:00:00",
+            }
+        }
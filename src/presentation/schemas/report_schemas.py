@@ -0,0 +1,84 @@
+"""Schemas (DTOs) dos relatórios."""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class StatusReportItemResponse(BaseModel):
+    """Totais de um status."""
+    status: str
+    count: int
+    total_balance: str
+    average_balance: str
+
+
+class StatusReportResponse(BaseModel):
+    """Schema do relatório por status."""
+    items: list[StatusReportItemResponse]
+    total_accounts: int
+    total_balance: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "status": "active",
+                        "count": 2,
+                        "total_balance": "1500.00",
+                        "average_balance": "750.00",
+                    },
+                ],
+                "total_accounts": 2,
+                "total_balance": "1500.00",
+            }
+        }
+
+
+class BalanceBucketResponse(BaseModel):
+    """Uma faixa de saldo (upper nulo: sem teto)."""
+    lower: str
+    upper: str | None = None
+    count: int
+    total_balance: str
+
+
+class BalanceDistributionResponse(BaseModel):
+    """Schema da distribuição de saldos."""
+    buckets: list[BalanceBucketResponse]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "buckets": [
+                    {"lower": "0", "upper": "100", "count": 10, "total_balance": "420.00"},
+                    {"lower": "100", "upper": None, "count": 3, "total_balance": "9000.00"},
+                ]
+            }
+        }
+
+
+class OpeningRateItemResponse(BaseModel):
+    """Aberturas em um período."""
+    period_start: datetime
+    count: int
+
+
+class OpeningRateResponse(BaseModel):
+    """Schema do ritmo de abertura de contas."""
+    period: str
+    created_from: datetime
+    created_to: datetime
+    points: list[OpeningRateItemResponse]
+    total: int
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "period": "day",
+                "created_from": "2024-02-01T00:00:00",
+                "created_to": "2024-02-08T00:00:00",
+                "points": [{"period_start": "2024-02-07T00:00:00", "count": 42}],
+                "total": 42,
+            }
+        }
@@ -0,0 +1,30 @@
+"""
+Script para aplicar os índices do MongoDB.
+
+Executa: python -m src.scripts.apply_schema
+"""
+
+import asyncio
+from src.infrastructure.config import settings
+from src.infrastructure.database import SchemaManager, create_mongo_client
+
+
+async def main():
+    """Cria (ou atualiza) os índices declarados em schema.py."""
+    mongo_client = create_mongo_client(settings)
+    
+    try:
+        schema = SchemaManager(mongo_client[settings.mongodb_database])
+        report = await schema.apply()
+    finally:
+        mongo_client.close()
+    
+    for collection_name, created in report.items():
+        if created:
+            print(f"✅ {collection_name}: índices criados {', '.join(created)}")
+        else:
+            print(f"✅ {collection_name}: índices já atualizados")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
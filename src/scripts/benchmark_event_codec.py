@@ -0,0 +1,112 @@
+"""
+Benchmark da serialização dos eventos publicados no broker.
+
+Para cada tipo de evento em src/domain/events, mede a vazão de
+codificação (evento -> corpo + routing key) e decodificação
+(corpo -> dict) e o tamanho do corpo em:
+- legacy: to_dict() + json.dumps(default=str) + regex da routing key
+- json: EventCodec("json") (orjson, se instalado)
+- msgpack: EventCodec("msgpack") (pulado se o msgpack não estiver instalado)
+
+Executa: python -m src.scripts.benchmark_event_codec --iterations 100000
+"""
+
+import argparse
+import dataclasses
+import json
+import re
+import time
+import uuid
+from collections.abc import Callable
+
+from src.domain import events as domain_events
+from src.domain.events import DomainEvent
+from src.infrastructure.messaging import EventCodec
+
+
+def sample_event(event_class: type[DomainEvent]) -> DomainEvent:
+    """Instância do evento com todos os campos preenchidos."""
+    values = {}
+    for field in dataclasses.fields(event_class):
+        if not field.init or field.name in ("event_id", "occurred_at"):
+            continue
+        if field.name in ("amount", "initial_balance", "new_balance"):
+            values[field.name] = "1234.56"
+        elif field.name == "cpf":
+            values[field.name] = "52998224725"
+        else:
+            values[field.name] = f"{field.name}-{uuid.uuid4()}"
+    return event_class(**values)
+
+
+def legacy_encode(event: DomainEvent) -> tuple[bytes, str]:
+    """Caminho de antes do codec, como o publisher fazia."""
+    body = json.dumps(event.to_dict(), default=str).encode()
+    snake_case = re.sub(r"(?<!^)(?=[A-Z])", "_", event.event_type).lower()
+    return body, snake_case.replace("_", ".")
+
+
+def legacy_decode(body: bytes) -> dict:
+    return json.loads(body.decode())
+
+
+def ops_per_second(operation: Callable[[], object], iterations: int) -> float:
+    """Vazão de `operation` em chamadas por segundo."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    formats: dict[str, tuple[Callable, Callable]] = {
+        "legacy": (lambda event: legacy_encode(event)[0], legacy_decode),
+    }
+    for wire_format in ("json", "msgpack"):
+        try:
+            codec = EventCodec(wire_format)
+        except RuntimeError as e:
+            print(f"⚠️ {wire_format} pulado: {e}")
+            continue
+        formats[wire_format] = (
+            lambda event, codec=codec: codec.encode(event).body,
+            lambda body, codec=codec: codec.decode(body, codec.content_type),
+        )
+
+    print(f"{args.iterations} iterações por evento e formato\n")
+    print(f"{'evento':<20} {'formato':<8} {'encode/s':>12} {'decode/s':>12} {'bytes':>7}")
+
+    totals = {name: [0.0, 0.0] for name in formats}
+    event_classes = [
+        getattr(domain_events, name) for name in domain_events.__all__ if name != "DomainEvent"
+    ]
+    for event_class in event_classes:
+        event = sample_event(event_class)
+        for name, (encode, decode) in formats.items():
+            body = encode(event)
+            encode_rate = ops_per_second(lambda: encode(event), args.iterations)
+            decode_rate = ops_per_second(lambda: decode(body), args.iterations)
+            totals[name][0] += encode_rate
+            totals[name][1] += decode_rate
+            print(
+                f"{event_class.__name__:<20} {name:<8} "
+                f"{encode_rate:>12.0f} {decode_rate:>12.0f} {len(body):>7}"
+            )
+
+    print("\nMédia entre os tipos de evento (relativa ao legacy):")
+    legacy_encode_rate, legacy_decode_rate = totals["legacy"]
+    for name, (encode_total, decode_total) in totals.items():
+        print(
+            f"{name:<8} encode {encode_total / len(event_classes):>10.0f}/s "
+            f"({encode_total / legacy_encode_rate:.2f}x)   "
+            f"decode {decode_total / len(event_classes):>10.0f}/s "
+            f"({decode_total / legacy_decode_rate:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
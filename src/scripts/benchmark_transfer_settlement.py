@@ -0,0 +1,161 @@
+"""
+Benchmark da liquidação de transferências no MongoDB.
+
+Compara, com as mesmas contas e a mesma concorrência:
+- sequential: caminho antigo (2 leituras + 2 saves com versão)
+- bulk: settle_transfer com débito condicional e depois crédito
+- transaction: settle_transfer com transação multi-documento
+
+Precisa de um replica set (transações). Para subir um de um nó:
+    docker-compose --profile replica-set up -d mongodb-rs
+
+Executa: python -m src.scripts.benchmark_transfer_settlement \\
+    --url "mongodb://localhost:27018/?replicaSet=rs0"
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from decimal import Decimal
+
+from src.application.services import RetryPolicy
+from src.domain.entities import Account
+from src.domain.value_objects import Money
+from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    MongoAccountRepository,
+    SchemaManager,
+    create_mongo_client,
+)
+from src.scripts.sample_data import random_cpf
+
+
+async def create_accounts(repository: MongoAccountRepository, count: int) -> list[Account]:
+    """Cria contas ativas com saldo alto o bastante para todo o benchmark."""
+    accounts = []
+    for _ in range(count):
+        account = Account.create("Benchmark", random_cpf(), Money.create("1000000"))
+        account.approve()
+        accounts.append(account)
+    await repository.save_many(accounts)
+    return accounts
+
+
+async def sequential_transfer(
+    repository: MongoAccountRepository,
+    retry_policy: RetryPolicy,
+    from_account: Account,
+    to_account: Account,
+    amount: Money,
+) -> None:
+    """Caminho antigo: lê e salva cada conta separadamente."""
+    async def attempt() -> None:
+        source = await repository.find_by_account_number(from_account.account_number)
+        target = await repository.find_by_account_number(to_account.account_number)
+        source.withdraw(amount)
+        target.deposit(amount)
+        await repository.save(source)
+        await repository.save(target)
+    
+    await retry_policy.run(attempt)
+
+
+async def run_strategy(
+    name: str,
+    repository: MongoAccountRepository,
+    accounts: list[Account],
+    transfers: int,
+    concurrency: int,
+) -> None:
+    """Executa `transfers` transferências aleatórias e imprime as métricas."""
+    semaphore = asyncio.Semaphore(concurrency)
+    retry_policy = RetryPolicy(max_attempts=50)
+    latencies: list[float] = []
+    failures = 0
+    amount = Money.create("1.00")
+    
+    async def one_transfer() -> None:
+        nonlocal failures
+        from_account, to_account = random.sample(accounts, 2)
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if name == "sequential":
+                    await sequential_transfer(
+                        repository, retry_policy, from_account, to_account, amount
+                    )
+                else:
+                    await repository.settle_transfer(
+                        str(uuid.uuid4()),
+                        from_account.account_number,
+                        to_account.account_number,
+                        amount,
+                    )
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(one_transfer() for _ in range(transfers)))
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:<12} {transfers / elapsed:>10.0f} transf/s   "
+        f"p50 {statistics.median(latencies) * 1000:>7.2f} ms   "
+        f"p99 {p99 * 1000:>7.2f} ms   "
+        f"falhas {failures}   conflitos {retry_policy.stats.conflicts}"
+    )
+
+
+async def total_balance(repository: MongoAccountRepository, accounts: list[Account]) -> Decimal:
+    """Soma dos saldos: deve ser a mesma antes e depois (dinheiro não some)."""
+    found = await repository.find_many_by_account_numbers(
+        [account.account_number for account in accounts]
+    )
+    return sum((account.balance.amount for account in found), Decimal("0"))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="mongodb://localhost:27018/?replicaSet=rs0")
+    parser.add_argument("--database", default="jbank_benchmark")
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--transfers", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    
+    mongo_client = create_mongo_client(settings.model_copy(update={"mongodb_url": args.url}))
+    
+    try:
+        await mongo_client.drop_database(args.database)
+        await SchemaManager(mongo_client[args.database]).apply()
+        
+        repositories = {
+            "sequential": MongoAccountRepository(mongo_client, args.database),
+            "bulk": MongoAccountRepository(mongo_client, args.database, "bulk"),
+            "transaction": MongoAccountRepository(mongo_client, args.database, "transaction"),
+        }
+        accounts = await create_accounts(repositories["bulk"], args.accounts)
+        before = await total_balance(repositories["bulk"], accounts)
+        
+        print(
+            f"{args.transfers} transferências, {args.accounts} contas, "
+            f"concorrência {args.concurrency}\n"
+        )
+        for name, repository in repositories.items():
+            await run_strategy(name, repository, accounts, args.transfers, args.concurrency)
+        
+        after = await total_balance(repositories["bulk"], accounts)
+        print(f"\nSaldo total antes {before} / depois {after}")
+    finally:
+        await mongo_client.drop_database(args.database)
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
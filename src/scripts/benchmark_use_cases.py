@@ -0,0 +1,128 @@
+"""
+Benchmark dos use cases sem I/O de rede.
+
+Roda depósito, saque e transferência (use case + worker) sobre os
+repositórios e o publisher em memória, medindo só o custo da camada
+de aplicação e do domínio.
+
+Executa: python -m src.scripts.benchmark_use_cases --operations 20000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+
+from src.application.use_cases import (
+    DepositMoneyInput,
+    DepositMoneyUseCase,
+    TransferMoneyInput,
+    TransferMoneyUseCase,
+    WithdrawMoneyInput,
+    WithdrawMoneyUseCase,
+)
+from src.domain.entities import Account
+from src.domain.value_objects import Money
+from src.infrastructure.in_memory import (
+    InMemoryAccountRepository,
+    InMemoryEventPublisher,
+    InMemoryTransactionRepository,
+)
+from src.infrastructure.messaging import TransferWorker
+from src.scripts.sample_data import random_cpf
+
+
+async def run_operation(
+    name: str,
+    operation: Callable[[Account, Account], Awaitable[object]],
+    accounts: list[Account],
+    operations: int,
+    concurrency: int,
+) -> None:
+    """Executa `operations` chamadas e imprime vazão e latências."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+    
+    async def one() -> None:
+        nonlocal failures
+        first, second = random.sample(accounts, 2)
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await operation(first, second)
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(operations)))
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:<10} {operations / elapsed:>10.0f} ops/s   "
+        f"p50 {statistics.median(latencies) * 1_000_000:>7.1f} µs   "
+        f"p99 {p99 * 1_000_000:>7.1f} µs   "
+        f"falhas {failures}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    
+    accounts_repository = InMemoryAccountRepository()
+    transactions = InMemoryTransactionRepository()
+    publisher = InMemoryEventPublisher()
+    worker = TransferWorker(accounts_repository, transactions, publisher)
+    publisher.subscribe("TransferRequested", worker.handle_transfer_requested)
+    
+    accounts = []
+    for _ in range(args.accounts):
+        account = Account.create("Benchmark", random_cpf(), Money.create("1000000"))
+        account.approve()
+        accounts.append(account)
+    await accounts_repository.save_many(accounts)
+    
+    deposit = DepositMoneyUseCase(accounts_repository, publisher, transactions)
+    withdraw = WithdrawMoneyUseCase(accounts_repository, publisher, transactions)
+    transfer = TransferMoneyUseCase(accounts_repository, publisher)
+    
+    operations = {
+        "deposit": lambda a, _: deposit.execute(
+            DepositMoneyInput(str(a.account_number), 1.0)
+        ),
+        "withdraw": lambda a, _: withdraw.execute(
+            WithdrawMoneyInput(str(a.account_number), 1.0)
+        ),
+        # Inclui a liquidação pelo worker (entregue em outra task)
+        "transfer": lambda a, b: transfer.execute(
+            TransferMoneyInput(str(a.account_number), str(b.account_number), 1.0)
+        ),
+    }
+    
+    print(
+        f"{args.operations} operações por use case, {args.accounts} contas, "
+        f"concorrência {args.concurrency}\n"
+    )
+    for name, operation in operations.items():
+        await run_operation(name, operation, accounts, args.operations, args.concurrency)
+    await publisher.close()
+    
+    found = await accounts_repository.find_many_by_account_numbers(
+        [account.account_number for account in accounts]
+    )
+    total = sum((account.balance.amount for account in found), Decimal("0"))
+    print(f"\nSaldo total {total} (esperado {Decimal('1000000') * args.accounts})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""
+Confere para onde vão as leituras STRONG e EVENTUAL.
+
+Precisa do replica set de três nós:
+    docker-compose --profile replica-set-3 up -d
+
+Executa: python -m src.scripts.check_read_routing \\
+    --url "mongodb://localhost:27031,localhost:27032,localhost:27033/?replicaSet=rs3"
+"""
+
+import argparse
+import asyncio
+import threading
+from collections import Counter
+
+from pymongo import monitoring
+
+from src.application.interfaces import ReadConsistency
+from src.domain.entities import Account
+from src.domain.value_objects import Money
+from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    MongoAccountRepository,
+    ReadRouter,
+    create_mongo_client,
+)
+from src.scripts.sample_data import random_cpf
+
+
+class FindCounter(monitoring.CommandListener):
+    """Conta os comandos `find` por servidor (host:porta)."""
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.by_server: Counter[str] = Counter()
+    
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name == "find":
+            host, port = event.connection_id
+            with self._lock:
+                self.by_server[f"{host}:{port}"] += 1
+    
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+    
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+async def read_many(
+    repository: MongoAccountRepository,
+    account: Account,
+    consistency: ReadConsistency,
+    reads: int,
+    counter: FindCounter,
+) -> Counter[str]:
+    """Executa `reads` leituras e devolve quantas foram para cada servidor."""
+    before = counter.by_server.copy()
+    for _ in range(reads):
+        await repository.find_by_account_number(account.account_number, consistency)
+    return counter.by_server - before
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url",
+        default="mongodb://localhost:27031,localhost:27032,localhost:27033/?replicaSet=rs3",
+    )
+    parser.add_argument("--database", default="jbank_read_routing")
+    parser.add_argument("--reads", type=int, default=100)
+    args = parser.parse_args()
+    
+    counter = FindCounter()
+    monitoring.register(counter)
+    mongo_client = create_mongo_client(settings.model_copy(update={"mongodb_url": args.url}))
+    
+    try:
+        router = ReadRouter(max_staleness_seconds=settings.mongodb_secondary_max_staleness_seconds)
+        repository = MongoAccountRepository(mongo_client, args.database, read_router=router)
+        
+        account = Account.create("Read Routing", random_cpf(), Money.create("10"))
+        await repository.save(account)
+        
+        for consistency in ReadConsistency:
+            servers = await read_many(repository, account, consistency, args.reads, counter)
+            print(f"{consistency.name:<9} {dict(servers)}")
+        
+        print(f"\nContadores do roteador: {router.stats.snapshot()}")
+    finally:
+        await mongo_client.drop_database(args.database)
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
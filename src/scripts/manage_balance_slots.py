@@ -0,0 +1,55 @@
+"""
+Liga ou desliga o saldo dividido (sub-ledger) de uma conta.
+
+Contas que recebem muitos créditos simultâneos (ex.: lojistas) espalham
+os créditos em N slots em vez de disputar um único documento.
+
+Executa:
+    python -m src.scripts.manage_balance_slots enable ACC-... [--slots 16]
+    python -m src.scripts.manage_balance_slots disable ACC-...
+"""
+
+import argparse
+import asyncio
+
+from src.domain.value_objects import AccountNumber
+from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    BalanceSlots,
+    MongoAccountRepository,
+    create_mongo_client,
+)
+
+
+async def main() -> None:
+    """Aplica o comando pedido e mostra o saldo resultante."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("command", choices=["enable", "disable"])
+    parser.add_argument("account_number")
+    parser.add_argument("--slots", type=int, default=16, help="Número de slots (enable)")
+    args = parser.parse_args()
+
+    mongo_client = create_mongo_client(settings)
+
+    try:
+        balance_slots = BalanceSlots(
+            mongo_client,
+            settings.mongodb_database,
+            use_transactions=settings.mongodb_transfer_settlement == "transaction",
+        )
+        if args.command == "enable":
+            await balance_slots.enable(args.account_number, args.slots)
+            print(f"✅ {args.account_number}: saldo dividido em {args.slots} slots")
+        else:
+            await balance_slots.disable(args.account_number)
+            print(f"✅ {args.account_number}: saldo dividido desativado")
+
+        repository = MongoAccountRepository(mongo_client, settings.mongodb_database)
+        account = await repository.find_by_account_number(AccountNumber(value=args.account_number))
+        print(f"💰 Saldo: {account.balance}")
+    finally:
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Migra os documentos de conta para o formato atual (ver account_codec.py).
+
+Percorre a coleção em lotes por _id (keyset) e, em cada lote, regrava
+CPF só com dígitos, saldo em Decimal128 e schema_version num único
+bulk_write. Cada update só casa se CPF e saldo ainda forem os lidos,
+então não sobrescreve uma escrita concorrente (o documento fica para
+a próxima execução). Pode ser interrompido e executado de novo.
+
+Executa: python -m src.scripts.migrate_account_documents [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import time
+
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import create_mongo_client
+from src.infrastructure.database.account_codec import (
+    SCHEMA_VERSION,
+    migrate_account_document,
+)
+
+
+async def main() -> None:
+    """Migra todas as contas em formato antigo, lote a lote."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    mongo_client = create_mongo_client(settings)
+    collection = mongo_client[settings.mongodb_database]["accounts"]
+
+    started = time.perf_counter()
+    migrated = skipped = 0
+    last_id = None
+
+    try:
+        while True:
+            query: dict = {"schema_version": {"$ne": SCHEMA_VERSION}}
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+
+            documents = await (
+                collection.find(query, projection={"_id": 1, "cpf": 1, "balance": 1})
+                .sort("_id", ASCENDING)
+                .limit(args.batch_size)
+                .to_list(length=args.batch_size)
+            )
+            if not documents:
+                break
+            last_id = documents[-1]["_id"]
+
+            operations = []
+            for document in documents:
+                changes = migrate_account_document(document)
+                if changes:
+                    operations.append(
+                        UpdateOne(
+                            {
+                                "_id": document["_id"],
+                                "cpf": document["cpf"],
+                                "balance": document["balance"],
+                            },
+                            {"$set": changes},
+                        )
+                    )
+
+            if operations:
+                try:
+                    result = await collection.bulk_write(operations, ordered=False)
+                    modified = result.modified_count
+                except BulkWriteError as e:
+                    # CPF já gravado só com dígitos por outra conta (índice único)
+                    modified = e.details["nModified"]
+                    for error in e.details["writeErrors"]:
+                        print(f"❌ {error['op']['q']['_id']}: {error['errmsg']}")
+                migrated += modified
+                skipped += len(operations) - modified
+            print(f"🔄 {migrated} contas migradas...")
+    finally:
+        mongo_client.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ {migrated} contas migradas em {elapsed:.1f}s")
+    if skipped:
+        print(f"⚠️ {skipped} contas não migradas (conflito ou escrita concorrente)")
+    else:
+        # Sem formato antigo, o índice único já barra CPF duplicado
+        print("ℹ️ Nenhuma conta pendente: pode usar CPF_MIGRATION_PENDING=false")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""
+Job de arquivamento de dados frios.
+
+Move contas encerradas há mais de ARCHIVE_CLOSED_AFTER_DAYS dias e
+lançamentos mais antigos que LEDGER_RETENTION_DAYS dias para as
+coleções de arquivo. Roda a cada ARCHIVE_INTERVAL_SECONDS (ou uma vez
+só, com --once); uma passada interrompida continua do último lote.
+
+Executa: python -m src.scripts.run_archival_job [--once]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import MongoArchiver, create_mongo_client
+
+
+async def run_pass(archiver: MongoArchiver) -> None:
+    """Uma passada: contas encerradas e lançamentos antigos."""
+    started = time.perf_counter()
+    result = await archiver.run()
+    elapsed = time.perf_counter() - started
+    print(
+        f"🧊 {result.accounts_archived} contas e "
+        f"{result.ledger_entries_archived} lançamentos arquivados em {elapsed:.1f}s"
+    )
+
+
+async def main() -> None:
+    """Inicia o job de arquivamento."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--once", action="store_true", help="Uma passada e sai")
+    args = parser.parse_args()
+    
+    mongo_client = create_mongo_client(settings)
+    archiver = MongoArchiver(
+        mongo_client,
+        settings.mongodb_database,
+        batch_size=settings.archive_batch_size,
+        closed_account_days=settings.archive_closed_after_days,
+        ledger_retention_days=settings.ledger_retention_days,
+    )
+    
+    print("🔄 Archival job iniciando...")
+    try:
+        while True:
+            await run_pass(archiver)
+            if args.once:
+                break
+            await asyncio.sleep(settings.archive_interval_seconds)
+    finally:
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
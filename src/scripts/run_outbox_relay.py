@@ -0,0 +1,75 @@
+"""
+Relay da outbox transacional para o RabbitMQ.
+
+Lê os eventos gravados pela API na coleção `outbox` (OUTBOX_ENABLED),
+publica em lotes de OUTBOX_RELAY_BATCH_SIZE com publisher confirms e
+marca os confirmados como enviados. Reiniciado, continua do primeiro
+evento não enviado. Rode uma única instância por banco.
+
+Executa: python -m src.scripts.run_outbox_relay [--once]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    OutboxRelay,
+    SchemaManager,
+    create_mongo_client,
+)
+from src.infrastructure.messaging import EventCodec, RabbitMQEventPublisher
+
+
+async def drain(relay: OutboxRelay) -> None:
+    """Publica tudo que está pendente e sai."""
+    started = time.perf_counter()
+    while await relay.relay_batch():
+        pass
+    elapsed = time.perf_counter() - started
+    print(f"📤 {relay.relayed} eventos publicados em {elapsed:.1f}s")
+
+
+async def main() -> None:
+    """Inicia o relay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--once", action="store_true", help="Esvazia a outbox e sai")
+    args = parser.parse_args()
+
+    mongo_client = create_mongo_client(settings)
+    publisher = RabbitMQEventPublisher(
+        settings.rabbitmq_url,
+        settings.rabbitmq_exchange,
+        publisher_confirms=True,  # Só marca como enviado o que o broker confirmou
+        confirm_window=settings.rabbitmq_confirm_window,
+        codec=EventCodec(settings.event_wire_format),
+    )
+    relay = OutboxRelay(
+        mongo_client,
+        settings.mongodb_database,
+        publisher,
+        batch_size=settings.outbox_relay_batch_size,
+        poll_interval_ms=settings.outbox_relay_poll_interval_ms,
+    )
+
+    try:
+        await SchemaManager(mongo_client[settings.mongodb_database]).apply()
+        await publisher.connect()
+        if args.once:
+            await drain(relay)
+            return
+
+        print("🚀 Relay da outbox rodando (Ctrl+C para parar)")
+        await relay.run()
+    finally:
+        print(f"📊 {relay.relayed} publicados, {relay.failed} recusados pelo broker")
+        await publisher.close()
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n⏹️ Relay parado")
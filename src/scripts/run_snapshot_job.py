@@ -0,0 +1,96 @@
+"""
+Job de checkpoints de saldo.
+
+Percorre todas as contas em lotes e grava um checkpoint para as que
+tiveram lançamentos suficientes desde o último. Contas ainda sem
+checkpoint (anteriores ao livro-razão) ganham o de abertura, a partir
+do saldo gravado: rode uma passada (--once) logo depois de atualizar. Roda a cada
+SNAPSHOT_INTERVAL_SECONDS (ou uma vez só, com --once).
+
+Executa: python -m src.scripts.run_snapshot_job [--once]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.application.services import LedgerReplayer
+from src.application.use_cases import TakeBalanceSnapshotsUseCase
+from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    MongoAccountRepository,
+    MongoSnapshotRepository,
+    MongoTransactionRepository,
+    create_mongo_client,
+)
+
+
+async def run_pass(
+    account_repository: MongoAccountRepository,
+    use_case: TakeBalanceSnapshotsUseCase,
+) -> None:
+    """Uma passada por todas as contas, lote a lote."""
+    started = time.perf_counter()
+    accounts = snapshots = entries = 0
+    
+    # Enquanto um lote é processado, o próximo já é buscado
+    next_page = asyncio.create_task(
+        account_repository.list_account_numbers(None, settings.snapshot_batch_size)
+    )
+    while True:
+        page = await next_page
+        if not page:
+            break
+        next_page = asyncio.create_task(
+            account_repository.list_account_numbers(page[-1], settings.snapshot_batch_size)
+        )
+        
+        result = await use_case.execute(page)
+        accounts += result.accounts
+        snapshots += result.snapshots_taken
+        entries += result.entries_replayed
+    
+    elapsed = time.perf_counter() - started
+    print(
+        f"📸 {accounts} contas, {snapshots} checkpoints, "
+        f"{entries} lançamentos lidos em {elapsed:.1f}s"
+    )
+
+
+async def main() -> None:
+    """Inicia o job de checkpoints."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--once", action="store_true", help="Uma passada e sai")
+    args = parser.parse_args()
+    
+    mongo_client = create_mongo_client(settings)
+    
+    account_repository = MongoAccountRepository(mongo_client, settings.mongodb_database)
+    snapshot_repository = MongoSnapshotRepository(mongo_client, settings.mongodb_database)
+    replayer = LedgerReplayer(
+        MongoTransactionRepository(mongo_client, settings.mongodb_database),
+        snapshot_repository,
+        batch_size=settings.statement_batch_size,
+    )
+    use_case = TakeBalanceSnapshotsUseCase(
+        account_repository,
+        replayer,
+        snapshot_repository,
+        min_entries=settings.snapshot_min_entries,
+        settle_seconds=settings.snapshot_settle_seconds,
+        concurrency=settings.snapshot_concurrency,
+    )
+    
+    print("🔄 Snapshot job iniciando...")
+    try:
+        while True:
+            await run_pass(account_repository, use_case)
+            if args.once:
+                break
+            await asyncio.sleep(settings.snapshot_interval_seconds)
+    finally:
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
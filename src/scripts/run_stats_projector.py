@@ -0,0 +1,64 @@
+"""
+Projetor das visões de estatísticas (GET /admin/stats).
+
+Consome o change stream de contas, slots de saldo e lançamentos e
+mantém os totais agregados. Retoma do último resume token salvo; na
+primeira execução (ou com --rebuild) recalcula tudo antes.
+
+Exige replica set (change streams e transações), por exemplo:
+    docker-compose --profile replica-set up -d mongodb-rs
+
+Executa: python -m src.scripts.run_stats_projector [--rebuild]
+"""
+
+import argparse
+import asyncio
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import (
+    SchemaManager,
+    StatsProjector,
+    create_mongo_client,
+)
+
+
+async def main() -> None:
+    """Inicia o projetor."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Recalcula as visões antes de seguir"
+    )
+    args = parser.parse_args()
+
+    mongo_client = create_mongo_client(settings)
+    projector = StatsProjector(
+        mongo_client,
+        settings.mongodb_database,
+        batch_size=settings.stats_projector_batch_size,
+        flush_interval_ms=settings.stats_projector_flush_interval_ms,
+    )
+
+    try:
+        # Imagens anterior/posterior precisam estar ligadas nas coleções
+        # (só aqui: a API não paga por elas se o projetor não roda)
+        schema = SchemaManager(mongo_client[settings.mongodb_database])
+        await schema.apply()
+        await schema.enable_change_stream_images()
+
+        if args.rebuild:
+            print("🔁 Reconstruindo visões...")
+            await projector.rebuild()
+            print("✅ Visões reconstruídas")
+
+        print("🚀 Projetor de estatísticas rodando (Ctrl+C para parar)")
+        await projector.run()
+    finally:
+        print(f"📊 {projector.processed_events} eventos processados")
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n⏹️ Projetor parado")
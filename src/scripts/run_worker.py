@@ -5,21 +5,91 @@ Executa: python -m src.scripts.run_worker
 """
 
 import asyncio
+from src.application.services import RetryPolicy
 from src.infrastructure.config import settings
-from src.infrastructure.messaging import TransferWorker
+from src.infrastructure.database import (
+    MongoAccountRepository,
+    MongoTransactionRepository,
+    create_mongo_client,
+)
+from src.infrastructure.messaging import (
+    EventCodec,
+    RabbitMQEventPublisher,
+    TopologyManager,
+    TransferWorker,
+    build_topology,
+)
 
 
 async def main():
     """Inicia o worker de transferências."""
+    if settings.messaging_backend == "memory":
+        # Sem broker não há fila para consumir: a API roda o worker
+        # no próprio processo
+        print("ℹ️ MESSAGING_BACKEND=memory: o worker roda dentro da API")
+        return
+    
+    # Filas, bindings e dead-letter antes de consumir. A fila de
+    # transferências o próprio worker declara (start()), então uma fila
+    # de evento divergente no broker não impede o consumo
+    if settings.rabbitmq_topology_enabled:
+        try:
+            queues = await TopologyManager(
+                settings.rabbitmq_url,
+                settings.rabbitmq_exchange,
+                build_topology(
+                    exchange_name=settings.rabbitmq_exchange,
+                    transfer_queue=settings.rabbitmq_transfer_queue,
+                    event_routing_keys=settings.rabbitmq_event_queues,
+                    event_queue_max_length=settings.rabbitmq_event_queue_max_length,
+                ),
+                settings.rabbitmq_management_url,
+            ).apply()
+            print(f"📐 Topologia aplicada: {len(queues)} filas")
+        except Exception as e:
+            print(f"⚠️ Topologia do RabbitMQ não aplicada: {e}")
+    
+    # Um único cliente (e pool) MongoDB para todo o processo
+    mongo_client = create_mongo_client(settings)
+    
+    event_publisher = RabbitMQEventPublisher(
+        settings.rabbitmq_url,
+        settings.rabbitmq_exchange,
+        publisher_confirms=settings.rabbitmq_publisher_confirms,
+        confirm_window=settings.rabbitmq_confirm_window,
+        codec=EventCodec(settings.event_wire_format),
+    )
+    
     worker = TransferWorker(
+        account_repository=MongoAccountRepository(
+            mongo_client,
+            settings.mongodb_database,
+            settings.mongodb_transfer_settlement,
+        ),
+        transaction_repository=MongoTransactionRepository(
+            mongo_client, settings.mongodb_database
+        ),
+        event_publisher=event_publisher,
         rabbitmq_url=settings.rabbitmq_url,
-        mongodb_url=settings.mongodb_url,
-        mongodb_database=settings.mongodb_database,
         exchange_name=settings.rabbitmq_exchange,
         queue_name=settings.rabbitmq_transfer_queue,
+        ledger_batch_size=settings.ledger_batch_size,
+        ledger_flush_interval_ms=settings.ledger_flush_interval_ms,
+        retry_policy=RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            base_delay_ms=settings.retry_base_delay_ms,
+            max_delay_ms=settings.retry_max_delay_ms,
+        ),
+        max_delivery_attempts=settings.transfer_max_delivery_attempts,
     )
     
-    await worker.start()
+    try:
+        # Dentro do try: se o broker recusar, o cliente MongoDB é fechado
+        await event_publisher.connect()
+        await worker.start()
+    finally:
+        await event_publisher.close()
+        mongo_client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,14 @@
+"""Dados de exemplo compartilhados pelos scripts de benchmark e pelos testes."""
+
+import random
+
+from src.domain.value_objects import CPF
+
+
+def random_cpf() -> CPF:
+    """Gera um CPF válido aleatório (dígitos verificadores calculados)."""
+    digits = [random.randint(0, 9) for _ in range(9)]
+    for weight in (10, 11):
+        total = sum(d * (weight - i) for i, d in enumerate(digits))
+        digits.append((total * 10) % 11 % 10)
+    return CPF("".join(map(str, digits)))
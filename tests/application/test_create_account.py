@@ -0,0 +1,51 @@
+"""CreateAccountUseCase: CPF duplicado, inclusive contra contas antigas."""
+
+import pytest
+
+from src.application.use_cases import CreateAccountInput, CreateAccountUseCase
+from src.domain.exceptions import DuplicateAccountError
+from src.domain.value_objects import CPF
+from src.infrastructure.in_memory import InMemoryEventPublisher, InMemoryTransactionRepository
+
+from ..factories import legacy_account_document, random_cpf
+
+
+def create_use_case(repository, check_legacy_cpf: bool = True) -> CreateAccountUseCase:
+    return CreateAccountUseCase(
+        repository,
+        InMemoryEventPublisher(),
+        InMemoryTransactionRepository(),
+        check_legacy_cpf=check_legacy_cpf,
+    )
+
+
+async def test_duplicate_cpf_is_rejected(account_repository):
+    use_case = create_use_case(account_repository)
+    cpf = str(random_cpf())
+    await use_case.execute(CreateAccountInput("Titular", cpf, 0))
+
+    with pytest.raises(DuplicateAccountError):
+        await use_case.execute(CreateAccountInput("Outro", cpf, 0))
+
+
+async def test_duplicate_cpf_is_rejected_by_the_write_after_migration(account_repository):
+    # Sem a consulta prévia, quem barra o duplicado é o índice único
+    use_case = create_use_case(account_repository, check_legacy_cpf=False)
+    cpf = str(random_cpf())
+    await use_case.execute(CreateAccountInput("Titular", cpf, 0))
+
+    with pytest.raises(DuplicateAccountError):
+        await use_case.execute(CreateAccountInput("Outro", cpf, 0))
+
+
+async def test_cpf_of_legacy_account_is_rejected(mongo_repository):
+    # Documento antigo: CPF formatado, que o índice único não compara
+    # com o CPF só com dígitos das contas novas
+    document = legacy_account_document()
+    await mongo_repository.collection.insert_one(document)
+    digits = CPF(document["cpf"]).value
+
+    with pytest.raises(DuplicateAccountError):
+        await create_use_case(mongo_repository).execute(
+            CreateAccountInput("Outro", digits, 0)
+        )
@@ -0,0 +1,24 @@
+"""DepositMoneyUseCase: repetições com a mesma chave de idempotência."""
+
+from src.application.use_cases import DepositMoneyInput, DepositMoneyUseCase
+from src.domain.value_objects import Money
+from src.infrastructure.in_memory import InMemoryEventPublisher, InMemoryTransactionRepository
+
+
+async def test_retry_with_same_key_deposits_once(account_repository, create_account):
+    account = await create_account("100.00")
+    publisher = InMemoryEventPublisher()
+    transactions = InMemoryTransactionRepository()
+    use_case = DepositMoneyUseCase(account_repository, publisher, transactions)
+    input_dto = DepositMoneyInput(str(account.account_number), 50, idempotency_key="chave-1")
+
+    first = await use_case.execute(input_dto)
+    repeated = await use_case.execute(input_dto)
+
+    assert first.new_balance == "150.00"
+    assert repeated.new_balance is None
+    stored = await account_repository.find_by_account_number(account.account_number)
+    assert stored.balance == Money.create("150.00")
+    page = await transactions.find_page_by_account(account.account_number, limit=10)
+    assert len(page.items) == 1
+    assert [e.event_type for e in publisher.events] == ["MoneyDeposited"]
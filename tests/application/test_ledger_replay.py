@@ -0,0 +1,76 @@
+"""LedgerReplayer: checkpoint de abertura para contas com e sem histórico completo."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.application.services import LedgerReplayer
+from src.application.use_cases import (
+    CreateAccountInput,
+    CreateAccountUseCase,
+    TakeBalanceSnapshotsUseCase,
+)
+from src.domain.entities import Account, Transaction, TransactionType
+from src.domain.exceptions import MissingOpeningSnapshotError
+from src.domain.value_objects import AccountNumber, Money
+from src.infrastructure.in_memory import (
+    InMemoryAccountRepository,
+    InMemoryEventPublisher,
+    InMemorySnapshotRepository,
+    InMemoryTransactionRepository,
+)
+
+from ..factories import random_cpf
+
+
+@pytest.fixture
+def repositories():
+    return (
+        InMemoryAccountRepository(),
+        InMemoryTransactionRepository(),
+        InMemorySnapshotRepository(),
+    )
+
+
+async def test_account_without_snapshot_is_refused(repositories):
+    _, transactions, snapshots = repositories
+
+    with pytest.raises(MissingOpeningSnapshotError):
+        await LedgerReplayer(transactions, snapshots).balance_at(AccountNumber.generate())
+
+
+async def test_new_account_opens_at_zero(repositories):
+    accounts, transactions, snapshots = repositories
+    output = await CreateAccountUseCase(
+        accounts, InMemoryEventPublisher(), transactions, snapshots
+    ).execute(CreateAccountInput("Titular", str(random_cpf()), 50))
+
+    result = await LedgerReplayer(transactions, snapshots).balance_at(
+        AccountNumber(value=output.account_number)
+    )
+
+    assert result.balance == Decimal("50.00")
+    assert result.replayed_entries == 1
+
+
+async def test_pre_ledger_account_opens_from_stored_balance(repositories):
+    accounts, transactions, snapshots = repositories
+    # Conta anterior ao livro-razão: 100 de saldo sem nenhum lançamento
+    account = Account.create("Titular", random_cpf(), Money.create("100.00"))
+    account.approve()
+    await accounts.save(account)
+    # Um depósito já com lançamento
+    await accounts.apply_balance_delta(account.account_number, Decimal("10.00"))
+    deposit = Transaction.create(
+        account.account_number, TransactionType.DEPOSIT, Money.create("10.00")
+    )
+    deposit.complete()
+    await transactions.save(deposit)
+
+    replayer = LedgerReplayer(transactions, snapshots)
+    job = TakeBalanceSnapshotsUseCase(accounts, replayer, snapshots, settle_seconds=0)
+    summary = await job.execute([account.account_number])
+
+    assert summary.snapshots_taken == 1
+    result = await replayer.balance_at(account.account_number)
+    assert result.balance == Decimal("110.00")
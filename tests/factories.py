@@ -0,0 +1,20 @@
+"""Dados de teste."""
+
+import uuid
+from datetime import datetime
+
+from src.scripts.sample_data import random_cpf
+
+
+def legacy_account_document(balance: str = "100.00", status: str = "active") -> dict:
+    """Documento de conta no formato antigo: CPF formatado e saldo em string."""
+    now = datetime.now()
+    return {
+        "account_number": f"ACC-{uuid.uuid4()}",
+        "holder_name": "Conta Antiga",
+        "cpf": random_cpf().formatted(),
+        "balance": balance,
+        "status": status,
+        "created_at": now,
+        "updated_at": now,
+    }
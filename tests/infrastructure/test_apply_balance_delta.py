@@ -0,0 +1,121 @@
+"""AccountRepository.apply_balance_delta: créditos, débitos e saldos antigos."""
+
+from decimal import Decimal
+
+import pytest
+from bson.decimal128 import Decimal128
+
+from src.domain.entities import Account
+from src.domain.exceptions import (
+    AccountNotActiveError,
+    AccountNotFoundError,
+    InsufficientFundsError,
+)
+from src.domain.value_objects import AccountNumber, Money
+
+from ..factories import legacy_account_document, random_cpf
+
+
+async def test_credit_and_debit_return_new_balance(account_repository, create_account):
+    account = await create_account("100.00")
+
+    assert await account_repository.apply_balance_delta(
+        account.account_number, Decimal("25.50")
+    ) == Money.create("125.50")
+    assert await account_repository.apply_balance_delta(
+        account.account_number, Decimal("-125.50")
+    ) == Money.create("0.00")
+
+
+async def test_debit_beyond_balance_is_rejected(account_repository, create_account):
+    account = await create_account("10.00")
+
+    with pytest.raises(InsufficientFundsError):
+        await account_repository.apply_balance_delta(account.account_number, Decimal("-10.01"))
+
+    stored = await account_repository.find_by_account_number(account.account_number)
+    assert stored.balance == Money.create("10.00")
+
+
+async def test_unknown_or_inactive_account_is_rejected(account_repository, create_account):
+    with pytest.raises(AccountNotFoundError):
+        await account_repository.apply_balance_delta(AccountNumber.generate(), Decimal("1"))
+
+    account = await create_account()
+    account.block()
+    await account_repository.save(account)
+    with pytest.raises(AccountNotActiveError):
+        await account_repository.apply_balance_delta(account.account_number, Decimal("1"))
+
+
+@pytest.mark.parametrize("delta", ["15.00", "-15.00"])
+async def test_legacy_string_balance_is_converted(mongo_repository, delta):
+    document = legacy_account_document(balance="100.00")
+    await mongo_repository.collection.insert_one(document)
+
+    new_balance = await mongo_repository.apply_balance_delta(
+        AccountNumber(value=document["account_number"]), Decimal(delta)
+    )
+
+    assert new_balance == Money.create(Decimal("100.00") + Decimal(delta))
+    stored = await mongo_repository.collection.find_one(
+        {"account_number": document["account_number"]}
+    )
+    assert isinstance(stored["balance"], Decimal128)
+
+
+async def test_split_account_movements_skip_the_balance(mongo_repository):
+    account = Account.create("Titular", random_cpf(), Money.create("100.00"))
+    account.approve()
+    await mongo_repository.save(account)
+    await mongo_repository.balance_slots.enable(str(account.account_number), 4)
+
+    for delta in ("30", "-120"):
+        new_balance = await mongo_repository.apply_balance_delta(
+            account.account_number, Decimal(delta)
+        )
+        assert new_balance is None
+
+    stored = await mongo_repository.find_by_account_number(account.account_number)
+    assert stored.balance == Money.create("10.00")
+
+    # Mudança de status vai para os slots (senão continuariam aceitando créditos)
+    stored.block()
+    await mongo_repository.save(stored)
+    statuses = await mongo_repository.balance_slots.collection.distinct(
+        "status", {"account_number": str(account.account_number)}
+    )
+    assert statuses == ["blocked"]
+
+
+async def test_repeated_operation_is_applied_once(account_repository, create_account):
+    account = await create_account("100.00")
+
+    first = await account_repository.apply_balance_delta(
+        account.account_number, Decimal("-40.00"), "withdraw:chave-1"
+    )
+    repeated = await account_repository.apply_balance_delta(
+        account.account_number, Decimal("-40.00"), "withdraw:chave-1"
+    )
+
+    assert first == Money.create("60.00")
+    assert repeated is None
+    stored = await account_repository.find_by_account_number(account.account_number)
+    assert stored.balance == Money.create("60.00")
+
+
+async def test_repeated_slot_credit_is_applied_once(mongo_repository):
+    account = Account.create("Titular", random_cpf(), Money.create("0.00"))
+    account.approve()
+    await mongo_repository.save(account)
+    await mongo_repository.balance_slots.enable(str(account.account_number), 4)
+    # Primeiro crédito descobre o modo dividido; os seguintes vão aos slots
+    await mongo_repository.apply_balance_delta(account.account_number, Decimal("1.00"))
+
+    for _ in range(2):
+        await mongo_repository.apply_balance_delta(
+            account.account_number, Decimal("10.00"), "deposit:chave-1"
+        )
+
+    stored = await mongo_repository.find_by_account_number(account.account_number)
+    assert stored.balance == Money.create("11.00")
@@ -0,0 +1,65 @@
+"""BalanceSlots.sweep: varreduras interrompidas no meio não perdem dinheiro."""
+
+from decimal import Decimal
+
+from bson.decimal128 import Decimal128
+
+from src.domain.entities import Account
+from src.domain.value_objects import Money
+
+from ..factories import random_cpf
+
+
+async def split_account(repository, balance: str, slot_balances: list[str]) -> str:
+    account = Account.create("Titular", random_cpf(), Money.create(balance))
+    account.approve()
+    await repository.save(account)
+    number = str(account.account_number)
+    await repository.balance_slots.enable(number, len(slot_balances))
+    for slot, amount in enumerate(slot_balances):
+        await repository.balance_slots.collection.update_one(
+            {"_id": f"{number}:{slot}"}, {"$set": {"balance": Decimal128(amount)}}
+        )
+    return number
+
+
+async def test_sweep_moves_all_slots_to_the_account(mongo_repository):
+    number = await split_account(mongo_repository, "10.00", ["5.00", "7.00"])
+
+    assert await mongo_repository.balance_slots.sweep(number) == Decimal("12.00")
+
+    account = await mongo_repository.collection.find_one({"account_number": number})
+    assert account["balance"].to_decimal() == Decimal("22.00")
+    assert "pending_sweep" not in account
+
+
+async def test_interrupted_sweep_is_finished_by_the_next(mongo_repository):
+    number = await split_account(mongo_repository, "10.00", ["5.00", "7.00"])
+    slots = mongo_repository.balance_slots.collection
+    # Queda depois de registrar a varredura e descontar só o primeiro slot
+    pending = {
+        "id": "varredura-1",
+        "slots": [
+            {"slot_id": f"{number}:0", "amount": Decimal128("5.00")},
+            {"slot_id": f"{number}:1", "amount": Decimal128("7.00")},
+        ],
+    }
+    await mongo_repository.collection.update_one(
+        {"account_number": number}, {"$set": {"pending_sweep": pending}}
+    )
+    await slots.update_one(
+        {"_id": f"{number}:0"},
+        {"$inc": {"balance": Decimal128("-5.00")}, "$push": {"applied_sweeps": "varredura-1"}},
+    )
+    # Crédito que chegou no slot depois da queda
+    await slots.update_one({"_id": f"{number}:1"}, {"$inc": {"balance": Decimal128("1.00")}})
+
+    await mongo_repository.balance_slots.sweep(number)
+
+    account = await mongo_repository.collection.find_one({"account_number": number})
+    assert account["balance"].to_decimal() == Decimal("23.00")
+    assert "pending_sweep" not in account
+    balances = [
+        slot["balance"].to_decimal() async for slot in slots.find({"account_number": number})
+    ]
+    assert balances == [Decimal("0"), Decimal("0")]
@@ -0,0 +1,70 @@
+"""BufferedEventPublisher: buffer cheio, broker fora do ar e comandos."""
+
+import pytest
+
+from src.application.interfaces import EventPublisher
+from src.domain.events import MoneyDeposited, TransferRequested
+from src.infrastructure.messaging import BufferedEventPublisher
+
+
+class UnavailableBroker(EventPublisher):
+    """Recusa toda publicação, como um broker fora do ar."""
+
+    def __init__(self) -> None:
+        self.attempts = 0
+
+    async def publish(self, event) -> None:
+        await self.publish_many([event])
+
+    async def publish_many(self, events) -> None:
+        self.attempts += 1
+        raise ConnectionError("broker indisponível")
+
+    async def close(self) -> None:
+        pass
+
+
+def deposited() -> MoneyDeposited:
+    return MoneyDeposited(account_number="ACC-1", amount="10.00", new_balance="10.00")
+
+
+async def test_full_buffer_drops_instead_of_failing():
+    publisher = BufferedEventPublisher(UnavailableBroker(), max_size=1, overflow="drop")
+
+    await publisher.publish(deposited())
+    await publisher.publish(deposited())
+
+    assert publisher.snapshot()["rejected"] == 1
+    assert publisher.snapshot()["depth"] == 1
+
+
+async def test_failed_batch_is_dropped_after_max_attempts():
+    broker = UnavailableBroker()
+    publisher = BufferedEventPublisher(
+        broker, flush_interval_ms=1, retry_delay_ms=1, max_flush_attempts=3
+    )
+    await publisher.start()
+
+    await publisher.publish(deposited())
+    await publisher._queue.join()
+
+    assert broker.attempts == 3
+    assert publisher.snapshot()["dropped"] == 1
+    await publisher.close()
+
+
+async def test_commands_skip_the_buffer_and_surface_failures():
+    broker = UnavailableBroker()
+    publisher = BufferedEventPublisher(broker, max_size=1, overflow="drop")
+    await publisher.publish(deposited())  # Buffer cheio
+
+    with pytest.raises(ConnectionError):
+        await publisher.publish(
+            TransferRequested(
+                transfer_id="T-1", from_account="ACC-1", to_account="ACC-2", amount="5.00"
+            )
+        )
+
+    assert broker.attempts == 1
+    assert publisher.snapshot()["rejected"] == 0
+    assert publisher.snapshot()["depth"] == 1
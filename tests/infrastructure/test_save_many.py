@@ -0,0 +1,49 @@
+"""AccountRepository.save_many: contas novas, conflitos de versão e contas removidas."""
+
+import pytest
+
+from src.domain.entities import Account
+from src.domain.exceptions import ConcurrentUpdateError
+from src.domain.value_objects import Money
+
+from ..factories import random_cpf
+
+
+async def test_saves_new_and_existing_accounts(account_repository, create_account):
+    existing = await create_account("10.00")
+    existing.block()
+    new = Account.create("Nova", random_cpf(), Money.create("5.00"))
+
+    await account_repository.save_many([existing, new])
+
+    assert existing.version == 2 and new.version == 1
+    stored = await account_repository.find_by_account_number(existing.account_number)
+    assert stored.status == existing.status
+    assert await account_repository.find_by_account_number(new.account_number)
+
+
+async def test_reports_exactly_the_stale_accounts(account_repository, create_account):
+    fresh = await create_account()
+    stale = await create_account()
+    concurrent = await account_repository.find_by_account_number(stale.account_number)
+    concurrent.block()
+    await account_repository.save(concurrent)
+
+    fresh.block()
+    stale.block()
+    with pytest.raises(ConcurrentUpdateError) as error:
+        await account_repository.save_many([fresh, stale])
+
+    assert error.value.account_numbers == [str(stale.account_number)]
+    assert fresh.version == 2
+
+
+async def test_deleted_account_is_not_recreated(account_repository, create_account):
+    account = await create_account()
+    await account_repository.delete(account.account_number)
+
+    account.block()
+    with pytest.raises(ConcurrentUpdateError):
+        await account_repository.save_many([account])
+
+    assert await account_repository.find_by_account_number(account.account_number) is None
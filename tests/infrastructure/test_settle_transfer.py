@@ -0,0 +1,134 @@
+"""AccountRepository.settle_transfer: pernas recusadas, saldos antigos e reentregas."""
+
+import uuid
+
+import pytest
+from bson.decimal128 import Decimal128
+
+from src.domain.exceptions import (
+    AccountNotActiveError,
+    AccountNotFoundError,
+    InsufficientFundsError,
+)
+from src.domain.value_objects import AccountNumber, Money
+
+from ..factories import legacy_account_document
+
+
+async def balance_of(repository, account) -> Money:
+    stored = await repository.find_by_account_number(account.account_number)
+    return stored.balance
+
+
+async def test_settles_both_legs(account_repository, create_account):
+    source = await create_account("100.00")
+    target = await create_account("5.00")
+
+    await account_repository.settle_transfer(
+        str(uuid.uuid4()), source.account_number, target.account_number, Money.create("40.00")
+    )
+
+    assert await balance_of(account_repository, source) == Money.create("60.00")
+    assert await balance_of(account_repository, target) == Money.create("45.00")
+
+
+async def test_redelivery_moves_money_once(account_repository, create_account):
+    source = await create_account("100.00")
+    target = await create_account("0.00")
+    transfer_id = str(uuid.uuid4())
+
+    for _ in range(2):
+        await account_repository.settle_transfer(
+            transfer_id, source.account_number, target.account_number, Money.create("30.00")
+        )
+
+    assert await balance_of(account_repository, source) == Money.create("70.00")
+    assert await balance_of(account_repository, target) == Money.create("30.00")
+
+
+async def test_insufficient_funds_moves_nothing(account_repository, create_account):
+    source = await create_account("10.00")
+    target = await create_account("0.00")
+
+    with pytest.raises(InsufficientFundsError):
+        await account_repository.settle_transfer(
+            str(uuid.uuid4()), source.account_number, target.account_number, Money.create("20.00")
+        )
+
+    assert await balance_of(account_repository, source) == Money.create("10.00")
+    assert await balance_of(account_repository, target) == Money.create("0.00")
+
+
+async def test_inactive_target_leaves_source_untouched(account_repository, create_account):
+    source = await create_account("100.00")
+    target = await create_account("0.00")
+    target.block()
+    await account_repository.save(target)
+
+    with pytest.raises(AccountNotActiveError):
+        await account_repository.settle_transfer(
+            str(uuid.uuid4()), source.account_number, target.account_number, Money.create("25.00")
+        )
+
+    assert await balance_of(account_repository, source) == Money.create("100.00")
+    assert await balance_of(account_repository, target) == Money.create("0.00")
+
+
+async def test_missing_target_leaves_source_untouched(account_repository, create_account):
+    source = await create_account("100.00")
+    transfer_id = str(uuid.uuid4())
+
+    with pytest.raises(AccountNotFoundError):
+        await account_repository.settle_transfer(
+            transfer_id, source.account_number, AccountNumber.generate(), Money.create("25.00")
+        )
+    assert await balance_of(account_repository, source) == Money.create("100.00")
+
+    # A compensação também remove o marcador: a origem pode ser debitada de novo
+    target = await create_account("0.00")
+    await account_repository.settle_transfer(
+        transfer_id, source.account_number, target.account_number, Money.create("25.00")
+    )
+    assert await balance_of(account_repository, source) == Money.create("75.00")
+
+
+async def test_legacy_string_balances_are_converted(mongo_repository):
+    source = legacy_account_document(balance="100.00")
+    target = legacy_account_document(balance="1.00")
+    await mongo_repository.collection.insert_many([source, target])
+
+    await mongo_repository.settle_transfer(
+        str(uuid.uuid4()),
+        AccountNumber(value=source["account_number"]),
+        AccountNumber(value=target["account_number"]),
+        Money.create("40.00"),
+    )
+
+    balances = {
+        document["account_number"]: document["balance"]
+        async for document in mongo_repository.collection.find()
+    }
+    assert balances == {
+        source["account_number"]: Decimal128("60.00"),
+        target["account_number"]: Decimal128("41.00"),
+    }
+
+
+async def test_legacy_inactive_target_refunds_source(mongo_repository):
+    source = legacy_account_document(balance="100.00")
+    target = legacy_account_document(balance="1.00", status="blocked")
+    await mongo_repository.collection.insert_many([source, target])
+
+    with pytest.raises(AccountNotActiveError):
+        await mongo_repository.settle_transfer(
+            str(uuid.uuid4()),
+            AccountNumber(value=source["account_number"]),
+            AccountNumber(value=target["account_number"]),
+            Money.create("40.00"),
+        )
+
+    stored = await mongo_repository.collection.find_one(
+        {"account_number": source["account_number"]}
+    )
+    assert stored["balance"] == Decimal128("100.00")
+    assert stored["applied_transfers"] == []
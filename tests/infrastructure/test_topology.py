@@ -0,0 +1,45 @@
+"""build_topology: fila de transferências sem argumentos e filas só para eventos consumidos."""
+
+import pytest
+
+from src.infrastructure.messaging import build_topology
+
+
+def test_transfer_queue_is_dead_lettered_by_policy():
+    queues = build_topology("jbank_events", "jbank_transfer_queue")
+
+    transfer_queue = queues[0]
+    assert transfer_queue.name == "jbank_transfer_queue"
+    assert transfer_queue.routing_keys == ("transfer.requested",)
+    # Mesma declaração de sempre: a dead-letter vem da policy
+    assert transfer_queue.arguments("jbank_events.dlx") == {}
+    assert transfer_queue.by_policy and transfer_queue.dead_letter
+    assert transfer_queue.policy_definition("jbank_events.dlx") == {
+        "dead-letter-exchange": "jbank_events.dlx",
+        "dead-letter-routing-key": "jbank_transfer_queue",
+    }
+
+
+def test_no_event_queues_without_consumers():
+    assert len(build_topology("jbank_events", "jbank_transfer_queue")) == 1
+
+
+def test_event_queues_are_bounded_and_dead_lettered():
+    queues = build_topology(
+        "jbank_events",
+        "jbank_transfer_queue",
+        event_routing_keys=["money.deposited"],
+        event_queue_max_length=10,
+    )
+
+    [spec] = queues[1:]
+    assert spec.name == "jbank_events.money.deposited"
+    arguments = spec.arguments("jbank_events.dlx")
+    assert arguments["x-dead-letter-exchange"] == "jbank_events.dlx"
+    assert arguments["x-max-length"] == 10
+
+
+@pytest.mark.parametrize("routing_key", ["money.deposted", "transfer.requested"])
+def test_unknown_event_queue_is_refused(routing_key):
+    with pytest.raises(ValueError):
+        build_topology("jbank_events", "jbank_transfer_queue", event_routing_keys=[routing_key])
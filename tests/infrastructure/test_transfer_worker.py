@@ -0,0 +1,190 @@
+"""TransferWorker: recusas de domínio, erros de infraestrutura e reentregas."""
+
+import uuid
+
+import pytest
+
+from src.domain.entities import Account
+from src.domain.events import TransferRequested
+from src.domain.value_objects import Money
+from src.infrastructure.in_memory import (
+    InMemoryAccountRepository,
+    InMemoryEventPublisher,
+    InMemoryTransactionRepository,
+)
+from src.infrastructure.messaging import EventCodec, TransferWorker
+from src.infrastructure.messaging import transfer_worker
+
+from ..factories import random_cpf
+
+
+class IncomingMessage:
+    """Mensagem recebida do broker, só com o que o worker usa."""
+
+    def __init__(
+        self, event: TransferRequested, redelivered: bool = False, headers: dict | None = None
+    ) -> None:
+        encoded = EventCodec().encode(event)
+        self.body = encoded.body
+        self.content_type = encoded.content_type
+        self.type = encoded.event_type
+        self.headers = headers or {}
+        self.redelivered = redelivered
+        self.outcome = None
+
+    async def ack(self) -> None:
+        self.outcome = "ack"
+
+    async def nack(self, requeue: bool = True) -> None:
+        self.outcome = "requeue" if requeue else "nack"
+
+
+class DefaultExchange:
+    """Exchange padrão do canal: guarda o que o worker republicou."""
+
+    def __init__(self) -> None:
+        self.published = []
+
+    async def publish(self, message, routing_key: str) -> None:
+        self.published.append((routing_key, message))
+
+
+class Channel:
+    def __init__(self) -> None:
+        self.default_exchange = DefaultExchange()
+
+
+class UnreachableAfterSettlement(InMemoryAccountRepository):
+    """Liquida e em seguida perde a conexão (o worker não vê o sucesso)."""
+
+    async def settle_transfer(self, *args) -> None:
+        await super().settle_transfer(*args)
+        raise ConnectionError("conexão com o banco perdida")
+
+
+@pytest.fixture(autouse=True)
+def no_requeue_delay(monkeypatch):
+    monkeypatch.setattr(transfer_worker, "_REQUEUE_DELAY_SECONDS", 0)
+
+
+async def open_account(repository, balance: str) -> Account:
+    account = Account.create("Titular", random_cpf(), Money.create(balance))
+    account.approve()
+    await repository.save(account)
+    return account
+
+
+def make_worker(repository, transactions=None):
+    publisher = InMemoryEventPublisher()
+    worker = TransferWorker(
+        account_repository=repository,
+        transaction_repository=transactions or InMemoryTransactionRepository(),
+        event_publisher=publisher,
+        queue_name="transfers",
+        ledger_batch_size=1,
+        max_delivery_attempts=3,
+    )
+    worker._channel = Channel()
+    return worker, publisher
+
+
+def transfer_requested(source: Account, target: Account, amount: str) -> TransferRequested:
+    return TransferRequested(
+        transfer_id=str(uuid.uuid4()),
+        from_account=str(source.account_number),
+        to_account=str(target.account_number),
+        amount=amount,
+    )
+
+
+async def balance_of(repository, account) -> Money:
+    stored = await repository.find_by_account_number(account.account_number)
+    return stored.balance
+
+
+async def test_completed_transfer_is_recorded_and_acked():
+    repository = InMemoryAccountRepository()
+    source = await open_account(repository, "100.00")
+    target = await open_account(repository, "0.00")
+    worker, publisher = make_worker(repository)
+    event = transfer_requested(source, target, "40.00")
+    message = IncomingMessage(event)
+
+    await worker._process_transfer(message)
+
+    assert message.outcome == "ack"
+    assert [e.event_type for e in publisher.events] == ["TransferCompleted"]
+    assert await worker.transaction_repository.exists(f"{event.transfer_id}:out")
+
+
+async def test_refused_transfer_publishes_failure_and_acks():
+    repository = InMemoryAccountRepository()
+    source = await open_account(repository, "10.00")
+    target = await open_account(repository, "0.00")
+    worker, publisher = make_worker(repository)
+    message = IncomingMessage(transfer_requested(source, target, "40.00"))
+
+    await worker._process_transfer(message)
+
+    assert message.outcome == "ack"
+    assert [e.event_type for e in publisher.events] == ["TransferFailed"]
+
+
+async def test_infrastructure_error_requeues_without_failure_event():
+    repository = UnreachableAfterSettlement()
+    source = await open_account(repository, "100.00")
+    target = await open_account(repository, "0.00")
+    worker, publisher = make_worker(repository)
+    message = IncomingMessage(transfer_requested(source, target, "40.00"))
+
+    await worker._process_transfer(message)
+
+    # Volta ao fim da fila como cópia com o contador de tentativas
+    assert message.outcome == "ack"
+    [(routing_key, copy)] = worker._channel.default_exchange.published
+    assert routing_key == "transfers"
+    assert copy.headers["x-retry-count"] == 1
+    assert copy.body == message.body
+    assert list(publisher.events) == []
+
+
+async def test_message_failing_every_attempt_is_dead_lettered():
+    repository = UnreachableAfterSettlement()
+    source = await open_account(repository, "100.00")
+    target = await open_account(repository, "0.00")
+    worker, publisher = make_worker(repository)
+    message = IncomingMessage(
+        transfer_requested(source, target, "40.00"), headers={"x-retry-count": 2}
+    )
+
+    await worker._process_transfer(message)
+
+    assert message.outcome == "ack"
+    [(routing_key, copy)] = worker._channel.default_exchange.published
+    assert routing_key == "transfers.dlq"
+    assert copy.headers["x-retry-count"] == 3
+    # Liquidação pode ter parado no meio: nada de TransferFailed
+    assert list(publisher.events) == []
+
+
+async def test_redelivery_of_recorded_transfer_is_skipped():
+    repository = InMemoryAccountRepository()
+    source = await open_account(repository, "100.00")
+    target = await open_account(repository, "0.00")
+    transactions = InMemoryTransactionRepository()
+    event = transfer_requested(source, target, "40.00")
+
+    worker, _ = make_worker(repository, transactions)
+    await worker._process_transfer(IncomingMessage(event))
+
+    # Os marcadores da conta já não conhecem a transferência (ex.: saíram
+    # da janela): só o livro-razão evita liquidar de novo
+    repository._applied_transfers.clear()
+    worker, publisher = make_worker(repository, transactions)
+    message = IncomingMessage(event, redelivered=True)
+    await worker._process_transfer(message)
+
+    assert message.outcome == "ack"
+    assert list(publisher.events) == []
+    assert await balance_of(repository, source) == Money.create("60.00")
+    assert await balance_of(repository, target) == Money.create("40.00")